@@ -0,0 +1,47 @@
+"""Cache hit latency as the cache grows.
+
+    python -m benchmarks.cache_lookup [max entries]
+"""
+import sys
+import timeit
+
+from trakt import Trakt
+from trakt.core.components.cache import FrozenRequest
+
+HEADERS = {"trakt-api-key": "x" * 64, "trakt-api-version": "2"}
+
+
+def make_request(i: int) -> FrozenRequest:
+    return FrozenRequest(f"movies/{i}/stats", {"extended": "full"}, dict(HEADERS))
+
+
+def main(max_entries: int = 10 ** 6) -> None:
+    client = Trakt("", "", cache={"max_entries": 0, "max_bytes": 0})  # unbounded
+    cache = client.cache
+
+    print(f"{'entries':>10} {'hit (us)':>10}")
+
+    filled = 0
+    size = 10
+    while size <= max_entries:
+        for i in range(filled, size):
+            cache.set(make_request(i))
+        filled = size
+
+        # a fresh key object, as a real lookup builds one for every call
+        wanted = [make_request(i) for i in range(0, size, max(1, size // 100))]
+        number = 10 ** 4
+
+        def lookup() -> None:
+            for r in wanted:
+                cache.get(r)
+
+        best = min(timeit.repeat(lookup, number=number // len(wanted), repeat=5))
+        per_hit = best / ((number // len(wanted)) * len(wanted))
+
+        print(f"{size:>10} {per_hit * 1e6:>10.3f}")
+        size *= 10
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
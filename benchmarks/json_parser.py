@@ -0,0 +1,71 @@
+"""Time to parse responses into the models, on the fixtures in tests/test_data.
+
+    python -m benchmarks.json_parser [repeat]
+
+Lists are padded to a full page (100 items). "first" includes compiling the
+structure's decoder.
+"""
+import sys
+import timeit
+from typing import Any, Callable, List, Tuple
+
+from tests.test_data.calendars import SHOWS
+from tests.test_data.comments import TRENDING_COMMENTS
+from tests.test_data.episodes import EXTENDED_EPISODE
+from tests.test_data.movies import TRENDING_MOVIES
+from tests.test_data.people import MOVIE_CREDITS
+from tests.test_data.search import TEXT_RESULTS
+from tests.test_data.seasons import SEASON
+from tests.test_data.shows import EXTENDED_SHOW, TRENDING_SHOWS
+from trakt import Trakt
+from trakt.core import json_parser
+
+PAGE = 100
+
+SEASON_WITH_EPISODES = {**SEASON, "episodes": [EXTENDED_EPISODE] * 24}
+
+CASES: List[Tuple[str, Any]] = [
+    ("shows.get_summary", EXTENDED_SHOW),
+    ("episodes.get_episode", EXTENDED_EPISODE),
+    ("movies.get_trending", TRENDING_MOVIES),
+    ("shows.get_trending", TRENDING_SHOWS),
+    ("comments.get_trending", TRENDING_COMMENTS),
+    ("calendars.get_shows", SHOWS),
+    ("search.text_query", TEXT_RESULTS),
+    ("people.get_movie_credits", MOVIE_CREDITS),
+    ("seasons.get_all_seasons", [SEASON_WITH_EPISODES] * 10),
+]
+
+
+def pad(data: Any) -> Any:
+    if isinstance(data, list) and len(data) < PAGE:
+        return (data * PAGE)[:PAGE]
+
+    return data
+
+
+def best_of(f: Callable[[], Any], repeat: int, number: int) -> float:
+    return min(timeit.repeat(f, number=number, repeat=repeat)) / number
+
+
+def main(repeat: int = 3) -> None:
+    client = Trakt("", "")
+
+    print(f"{'path':<28} {'first (ms)':>10} {'parse (ms)':>10}")
+
+    for name, data in CASES:
+        suite, method = name.split(".")
+        structure = getattr(client, suite).paths[method].response_structure
+        data = pad(data)
+
+        def parse() -> None:
+            json_parser.parse_tree(data, structure)
+
+        first_time = best_of(parse, repeat=1, number=1)
+        parse_time = best_of(parse, repeat, number=3)
+
+        print(f"{name:<28} {first_time * 1e3:>10.3f} {parse_time * 1e3:>10.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
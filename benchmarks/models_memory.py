@@ -0,0 +1,60 @@
+"""Memory taken by parsed models, regular dataclasses vs the slotted variants.
+
+    python -m benchmarks.models_memory [count]
+
+Parses a list of count objects (20000 by default; seasons count their
+episodes too) of each fixture in tests/test_data. Only the parsed objects are
+counted, not the json they're parsed from.
+"""
+import gc
+import sys
+import tracemalloc
+from typing import Any, List, Tuple
+
+from tests.test_data.episodes import EXTENDED_EPISODE
+from tests.test_data.seasons import SEASON
+from tests.test_data.shows import EXTENDED_SHOW
+from trakt.core import json_parser
+from trakt.core.models import Episode, Season, Show, slotted_structure
+
+SEASON_WITH_EPISODES = {**SEASON, "episodes": [EXTENDED_EPISODE] * 24}
+
+CASES: List[Tuple[str, Any, Any, int]] = [  # name, item, structure, items per item
+    ("episodes", EXTENDED_EPISODE, [Episode], 1),
+    ("shows", EXTENDED_SHOW, [Show], 1),
+    ("seasons (24 episodes)", SEASON_WITH_EPISODES, [Season], 25),
+]
+
+
+def measure(data: Any, structure: Any) -> int:
+    json_parser.get_decoder(structure)  # compiled outside of the measurement
+    gc.collect()
+
+    tracemalloc.start()
+    try:
+        parsed = json_parser.parse_tree(data, structure)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del parsed
+    return size
+
+
+def main(count: int = 20000) -> None:
+    print(f"{'items':<22} {'count':>7} {'regular (MB)':>12} {'slotted (MB)':>12}")
+
+    for name, item, structure, size in CASES:
+        n = count // size
+        data = [item] * n
+
+        regular = measure(data, structure)
+        slotted = measure(data, slotted_structure(structure))
+
+        print(
+            f"{name:<22} {n:>7} {regular / 2 ** 20:>12.1f} {slotted / 2 ** 20:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,348 @@
+# flake8: noqa: F403, F405
+
+import asyncio
+
+import pytest
+from tests.test_data.certifications import CERTIFICATIONS
+from tests.test_data.countries import COUNTRIES
+from tests.test_data.oauth import OAUTH_GET_TOKEN
+from tests.utils import MockResponse, get_last_req, mk_mock_async_client
+from trakt.core.exceptions import (
+    ArgumentError,
+    DeadlineExceeded,
+    NotFound,
+    TraktResponseError,
+)
+from trakt.core.executors import AsyncExecutor, AsyncPaginationIterator
+from trakt.core.paths import Path
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_async_call():
+    client = mk_mock_async_client({".*": [COUNTRIES, 200]})
+
+    coro = client.countries.get_countries(type="shows")
+    assert get_last_req(client.http) is None
+
+    countries = run(coro)
+    assert [c.code for c in countries] == [c["code"] for c in COUNTRIES]
+
+    with pytest.raises(ArgumentError):
+        client.countries.get_countries(type="qwerty")
+
+
+def test_async_post_processing():
+    client = mk_mock_async_client(
+        {"certifications": [CERTIFICATIONS, 200], "recommendations": [{}, 204]}
+    )
+
+    certifications = run(client.certifications.get_certifications(type="shows"))
+    assert len(certifications) == len(CERTIFICATIONS["us"])
+
+    assert run(client.recommendations.hide_show(show=123)) is None
+    assert get_last_req(client.http)["method"] == "DELETE"
+
+
+def test_async_retry():
+    sleeps = []
+
+    async def sleep(t):
+        sleeps.append(t)
+
+    client = mk_mock_async_client(
+        {".*": (MockResponse([], code) for code in (429, 502, 200))},
+        http={"retry_jitter": False},
+    )
+    client.http.sleep = sleep
+
+    assert run(client.networks.get_networks()) == []
+    assert sleeps == [0.5, 1]
+
+
+def test_async_error():
+    client = mk_mock_async_client({".*": [{}, 404]})
+
+    with pytest.raises(NotFound):
+        run(client.networks.get_networks())
+
+
+def test_concurrent_calls():
+    client = mk_mock_async_client({".*": [[], 200]})
+    path = Path("a/!id", [int])
+
+    async def fetch_all():
+        executor = AsyncExecutor(client)
+        calls = [executor.run(path=path, id=i, no_cache=True) for i in range(1, 51)]
+        return await asyncio.gather(*calls)
+
+    run(fetch_all())
+
+    requested = sorted(r["resource"] for r in client.http._requests.req_stack)
+    assert requested == sorted(f"a/{i}" for i in range(1, 51))
+
+
+def slow_reads(client, delay=0.05):
+    request = client.http._requests.request
+
+    def slow_request(*args, **kwargs):
+        response = request(*args, **kwargs)
+        read = response.read
+
+        async def slow_read():
+            await asyncio.sleep(delay)
+            return await read()
+
+        response.read = slow_read
+        return response
+
+    client.http._requests.request = slow_request
+
+
+def test_async_coalesce_gets():
+    client = mk_mock_async_client({".*": [[], 200]})
+    slow_reads(client)
+
+    async def fetch_all():
+        return await asyncio.gather(
+            *[client.networks.get_networks() for _ in range(10)]
+        )
+
+    assert run(fetch_all()) == [[]] * 10
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_async_coalesce_gets_deadline():
+    client = mk_mock_async_client({".*": [[], 200]})
+    slow_reads(client, delay=0.2)
+
+    async def fetch():
+        leader = asyncio.ensure_future(client.networks.get_networks())
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(DeadlineExceeded):  # stops waiting for the leader
+            await client.networks.get_networks(deadline=0.05)
+
+        return await leader
+
+    assert run(fetch()) == []
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_async_stale_while_revalidate():
+    names = (MockResponse([{"name": n}]) for n in "AB")
+    client = mk_mock_async_client(
+        {".*": names}, cache={"ttl": {"networks": -1}, "stale_while_revalidate": 60}
+    )
+
+    async def main():
+        await client.networks.get_networks()
+        client.config["cache"]["ttl"]["networks"] = 60
+
+        stale = await client.networks.get_networks()
+        await asyncio.sleep(0.05)  # the refresh runs in the background
+        return stale, await client.networks.get_networks()
+
+    stale, fresh = run(main())
+
+    assert (stale[0].name, fresh[0].name) == ("A", "B")
+    assert len(client.http._requests.req_stack) == 2
+
+
+def test_async_not_found_cache():
+    client = mk_mock_async_client(
+        {"movies/missing": [{}, 404]}, cache={"not_found_ttl": 60}
+    )
+
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            run(client.movies.get_summary(movie="missing"))
+
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_async_batch():
+    client = mk_mock_async_client(
+        {"countries": [COUNTRIES, 200], "networks": [{}, 404]}
+    )
+
+    results = run(
+        client.batch(
+            [
+                (client.countries.get_countries, {"type": "shows"}),
+                ("networks.get_networks", {}),
+                (client.countries.get_countries, {"type": "qwerty"}),
+            ]
+        )
+    )
+
+    assert len(results[0].get()) == len(COUNTRIES)
+    assert isinstance(results[1].error, NotFound)
+    assert isinstance(results[2].error, ArgumentError)
+
+
+def test_async_timeouts():
+    client = mk_mock_async_client({".*": [[], 200]})
+
+    run(client.networks.get_networks(timeout=(1, 3)))
+    timeout = get_last_req(client.http)["timeout"]
+    assert (timeout.sock_connect, timeout.sock_read) == (1, 3)
+
+    with pytest.raises(DeadlineExceeded):
+        run(client.networks.get_networks(no_cache=True, deadline=0))
+
+
+def test_async_deadline_cuts_request_timeout():
+    client = mk_mock_async_client({".*": [[], 200]})
+
+    request = client.http._requests.request
+
+    def stalled_request(*args, timeout, **kwargs):
+        response = request(*args, timeout=timeout, **kwargs)
+
+        async def stalled_read():
+            await asyncio.sleep(timeout.sock_read)
+            raise asyncio.TimeoutError()
+
+        response.read = stalled_read
+        return response
+
+    client.http._requests.request = stalled_request
+
+    with pytest.raises(DeadlineExceeded) as e:
+        run(client.networks.get_networks(no_cache=True, deadline=0.1))
+    assert isinstance(e.value.__cause__, asyncio.TimeoutError)
+
+
+def test_async_pagination():
+    data = list(range(1, 11))
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    it = executor.run(path=p_pag, page=2, per_page=4)
+    assert isinstance(it, AsyncPaginationIterator)
+
+    async def collect():
+        return [i async for i in it]
+
+    assert run(collect()) == [5, 6, 7, 8, 9, 10]
+
+
+def test_async_take():
+    data = list(range(1, 11))
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    async def take():
+        it = executor.run(path=p_pag, per_page=2)
+        assert it.has_next()
+
+        assert await it.take(3) == [1, 2, 3]
+        assert await it.take(0) == []
+        assert await it.take() == [4, 5]
+        assert await it.take_all() == [6, 7, 8, 9, 10]
+        assert not it.has_next()
+        assert await it.take(2) == []
+
+    run(take())
+
+
+def test_async_prefetch():
+    data = list(range(300))
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    async def prefetch():
+        it = await executor.run(path=p_pag, per_page=2).prefetch_all()
+        client.http._requests.req_stack = []
+
+        result = [i async for i in it]
+        assert get_last_req(client.http) is None
+        return result
+
+    assert run(prefetch()) == data
+
+
+def test_async_oauth():
+    client = mk_mock_async_client({".*": [OAUTH_GET_TOKEN, 200]}, user=None)
+
+    credentials = run(client.oauth.get_token(code="code"))
+
+    assert credentials.access_token == OAUTH_GET_TOKEN["access_token"]
+    assert client.user is credentials
+
+
+def test_async_context_manager():
+    closed = []
+
+    class Session:
+        async def close(self):
+            closed.append(True)
+
+    async def use_client():
+        async with mk_mock_async_client({".*": [COUNTRIES, 200]}) as client:
+            await client.request("countries", type="shows")
+            client.http._session = Session()
+
+        return client
+
+    client = run(use_client())
+    assert closed == [True]
+    assert client.http._session is None
+
+    with pytest.raises(TypeError):
+        with client:
+            pass  # pragma: no cover
+
+
+def test_async_parallel_prefetch():
+    data = list(range(1000))
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    async def take_all():
+        it = executor.run(path=p_pag, per_page=3)
+        return await it.take(5) + await it.take_all(max_workers=3)
+
+    assert run(take_all()) == data
+
+
+def test_async_readahead():
+    data = list(range(20))
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    async def consume():
+        it = executor.run(path=p_pag, per_page=2, readahead=2)
+        first = await it.take(1)
+        pending = list(it._pending)
+        rest = [i async for i in it]
+        return first + rest, pending
+
+    result, pending = run(consume())
+    assert result == data
+    assert pending == [2, 3]
+
+
+def test_async_lazy_pagination():
+    data = [1, "x", 3]
+    client = mk_mock_async_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = AsyncExecutor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    async def consume():
+        it = executor.run(path=p_pag, per_page=2, lazy=True)
+        items = await it.take(1)
+        with pytest.raises(TraktResponseError):
+            await it.__anext__()
+
+        return items + [i async for i in it]
+
+    assert run(consume()) == [1, 3]
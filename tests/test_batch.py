@@ -0,0 +1,88 @@
+# flake8: noqa: F403, F405
+
+import pytest
+from tests.test_data.movies import MOVIE1, MOVIE_STATS, RATINGS
+from tests.utils import mk_mock_client
+from trakt.core.exceptions import ArgumentError, ClientError, NotFound
+
+
+def mk_batch_client():
+    return mk_mock_client(
+        {
+            "movies/1/ratings": [RATINGS, 200],
+            "movies/1/stats": [MOVIE_STATS, 200],
+            "movies/2/stats": [{}, 404],
+            "movies/trending": [[], 200],
+        }
+    )
+
+
+def test_batch():
+    client = mk_batch_client()
+
+    results = client.batch(
+        [
+            (client.movies.get_ratings, {"movie": 1}),
+            ("movies.get_stats", {"movie": 1}),
+            (client.movies.get_stats, {"movie": 2}),
+        ]
+    )
+
+    assert [r.ok for r in results] == [True, True, False]
+    assert results[0].get().rating == RATINGS["rating"]
+    assert results[1].value.watchers == MOVIE_STATS["watchers"]
+    assert isinstance(results[2].error, NotFound)
+
+    with pytest.raises(NotFound):
+        results[2].get()
+
+
+def test_batch_validation():
+    client = mk_batch_client()
+
+    results = client.batch(
+        [
+            (client.movies.get_most_played, {"period": "fortnightly"}),
+            ("movies.get_nothing", {}),
+            (print, {}),
+            (client.movies.get_stats,),
+            (client.movies.get_stats, {"movie": 1}),
+        ]
+    )
+
+    assert [type(r.error) for r in results] == [
+        ArgumentError,
+        ClientError,
+        ArgumentError,
+        ArgumentError,
+        type(None),
+    ]
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_batch_ordered():
+    client = mk_mock_client(
+        {
+            f"movies/{i}/stats": [{**MOVIE_STATS, "watchers": i}, 200]
+            for i in range(1, 51)
+        }
+    )
+    calls = [(client.movies.get_stats, {"movie": i}) for i in range(1, 51)]
+
+    results = client.batch(calls, max_workers=5)
+
+    # each result belongs to the call at its position
+    assert [r.get().watchers for r in results] == list(range(1, 51))
+
+    with pytest.raises(ArgumentError):
+        client.batch(calls, max_workers=0)
+
+
+def test_batch_shares_cache():
+    client = mk_mock_client(
+        {"movies/1/stats": [MOVIE_STATS, 200]}, cache={"cache_level": "full"}
+    )
+
+    client.batch([(client.movies.get_stats, {"movie": 1})] * 5, max_workers=1)
+
+    assert len(client.http._requests.req_stack) == 1
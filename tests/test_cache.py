@@ -0,0 +1,367 @@
+# flake8: noqa: F403, F405
+
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.test_data.certifications import CERTIFICATIONS
+from tests.test_data.comments import COMMENT
+from tests.utils import MockResponse, mk_mock_client
+from trakt import TraktCredentials
+from trakt.core.components.cache import CacheBackend, CacheManager, FrozenRequest
+from trakt.core.components.http_component import BufferedResponse
+from trakt.core.components.sqlite_cache import SQLiteCacheBackend
+from trakt.core.exceptions import ClientError, NotFound, Unauthorized
+
+NETWORKS = [{"name": "A"}]
+
+
+def mk_sqlite_client(tmp_path, **config):
+    cache = {"backend": "sqlite", "sqlite_path": str(tmp_path / "cache.sqlite")}
+    return mk_mock_client({".*": [NETWORKS, 200]}, cache={**cache, **config})
+
+
+def test_sqlite_cache_survives_restart(tmp_path):
+    with mk_sqlite_client(tmp_path) as client:
+        client.networks.get_networks()
+
+    with mk_sqlite_client(tmp_path) as client:
+        assert client.networks.get_networks()[0].name == "A"
+        assert client.http._requests.req_stack == []
+
+
+def test_sqlite_cache_expiry(tmp_path):
+    with mk_sqlite_client(tmp_path, ttl={"networks": -1}) as client:
+        client.networks.get_networks()
+
+    with mk_sqlite_client(tmp_path) as client:
+        client.networks.get_networks()
+
+        assert len(client.http._requests.req_stack) == 1
+
+
+def cached(path, body=b"[]", headers=None):
+    return FrozenRequest(path, {}, {}, BufferedResponse(200, headers or {}, body))
+
+
+def test_sqlite_backend(tmp_path):
+    client = mk_mock_client({})
+    path = str(tmp_path / "cache.sqlite")
+
+    # two backends on one file act like two processes
+    writer = SQLiteCacheBackend(path, max_entries=2)
+    reader = SQLiteCacheBackend(path)
+
+    for p in "abc":
+        CacheManager(client, backend=writer).set(cached(p, b"x" * 1000))
+
+    assert len(reader) == 2
+    assert reader.total_bytes < 100  # compressed
+    assert reader.get(cached("a")) is None
+
+    entry = reader.get(cached("c", headers={"ETag": "1"}))
+    assert entry.request.response.content == b"x" * 1000
+    assert entry.request.response.status_code == 200
+
+    writer.delete(cached("c"))
+    assert reader.get(cached("c")) is None
+
+
+def test_incomplete_backend():
+    class GetOnlyBackend(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):  # fails when created, not on first use
+        GetOnlyBackend()
+
+
+@pytest.mark.parametrize("old_version", [False, True])
+def test_sqlite_concurrent_open(tmp_path, old_version):
+    path = str(tmp_path / "cache.sqlite")
+    if old_version:
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE entries (key TEXT)")
+            conn.execute("PRAGMA user_version = 1")
+
+    # several processes starting at once; only one of them migrates the file
+    with ThreadPoolExecutor(6) as pool:
+        backends = list(pool.map(lambda _: SQLiteCacheBackend(path), range(6)))
+
+    client = mk_mock_client({})
+    CacheManager(client, backend=backends[0]).set(cached("a"))
+    assert all(len(b) == 1 for b in backends)
+
+
+def test_sqlite_sweep(tmp_path):
+    client = mk_mock_client({}, cache={"timeout": -1})
+    cache = CacheManager(client, backend=SQLiteCacheBackend(str(tmp_path / "c")))
+
+    cache.set(cached("a"))
+    cache.set(cached("b", headers={"ETag": "1"}))
+    cache.sweep()
+
+    assert len(cache) == 1
+    assert cache.get_stale(cached("b")) is not None
+
+
+def test_cache_manager_injection(tmp_path):
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite"))
+    client = mk_mock_client(
+        {".*": [NETWORKS, 200]},
+        cache_manager=lambda c: CacheManager(c, backend=backend),
+    )
+
+    client.networks.get_networks()
+
+    assert len(backend) == 1
+
+
+def test_unknown_backend():
+    with pytest.raises(ClientError):
+        mk_mock_client({}, cache={"backend": "redis"})
+
+
+def mk_swr_client(*responses, **config):
+    def gen():
+        yield from responses
+        while True:
+            yield MockResponse([{"name": "Z"}], 200)
+
+    cache = {"ttl": {"networks": -1}, "stale_while_revalidate": 60, **config}
+    return mk_mock_client({".*": gen()}, cache=cache)
+
+
+def wait_for_refresh(client):
+    for _ in range(100):
+        if not client.cache._refreshing:
+            return
+        time.sleep(0.01)
+
+
+def test_stale_while_revalidate():
+    client = mk_swr_client(MockResponse([{"name": "A"}]), MockResponse([{"name": "B"}]))
+    client.networks.get_networks()
+
+    client.config["cache"]["ttl"]["networks"] = 60
+    assert client.networks.get_networks()[0].name == "A"  # stale, refreshes
+    wait_for_refresh(client)
+    assert client.networks.get_networks()[0].name == "B"
+
+    assert len(client.http._requests.req_stack) == 2
+
+
+def test_stale_while_revalidate_single_refresh():
+    client = mk_swr_client(MockResponse([{"name": "A"}]))
+    client.networks.get_networks()
+
+    key = client.http.last_request
+    assert client.cache.start_refresh(key)  # as if a refresh was running
+
+    for _ in range(3):
+        assert client.networks.get_networks()[0].name == "A"
+
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_stale_while_revalidate_refresh_error(caplog):
+    client = mk_swr_client(
+        MockResponse([{"name": "A"}]),
+        MockResponse(None, 500),
+        MockResponse(None, 500),
+        http={"max_retries": 0},
+    )
+    client.networks.get_networks()
+
+    assert client.networks.get_networks()[0].name == "A"
+    wait_for_refresh(client)
+    assert client.networks.get_networks()[0].name == "A"  # refresh failed
+    wait_for_refresh(client)
+    assert "refresh of networks.get_networks failed" in caplog.text
+
+    client.config["cache"]["stale_while_revalidate"] = 0  # past the grace period
+    assert client.networks.get_networks()[0].name == "Z"
+    assert len(client.http._requests.req_stack) == 4
+
+
+def test_public_cache_keys_ignore_user():
+    client = mk_mock_client({".*": [[], 200]})
+
+    for token in ("token-a", "token-b"):
+        client.set_user(TraktCredentials(token, "", "", 10e14))
+        client.networks.get_networks()
+        client.calendars.get_my_shows()
+
+    requested = [r["resource"] for r in client.http._requests.req_stack]
+    assert requested.count("networks") == 1
+    assert requested.count("calendars/my/shows") == 2
+
+
+def mk_catalog_client(**config):
+    endpoints = {
+        "certifications": [CERTIFICATIONS, 200],
+        **{e: [[], 200] for e in ("countries", "genres", "languages", "networks")},
+        "calendars": [[], 200],
+    }
+    return mk_mock_client(endpoints, cache={"cache_level": "full", **config})
+
+
+def test_cache_warm():
+    client = mk_catalog_client()
+
+    results = client.cache.warm()
+    assert all(r.ok for r in results)
+    assert len(client.http._requests.req_stack) == 9
+
+    client.genres.get_genres(type="shows")
+    client.networks.get_networks()
+    assert len(client.http._requests.req_stack) == 9
+
+    client.cache.warm(["calendars.get_shows", ("genres.get_genres", {"type": "x"})])
+    assert len(client.http._requests.req_stack) == 10
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_snapshot(tmp_path, backend):
+    sqlite_path = str(tmp_path / "cache.sqlite")
+    client = mk_catalog_client(backend=backend, sqlite_path=sqlite_path)
+    client.cache.warm(["networks.get_networks", "calendars.get_my_shows"])
+
+    snapshot = str(tmp_path / "snapshot.gz")
+    assert client.cache.snapshot(snapshot) == 1  # not the user's calendar
+
+    client = mk_catalog_client()
+    assert client.cache.restore(snapshot) == 1
+
+    client.networks.get_networks()
+    assert client.http._requests.req_stack == []
+
+
+def test_cache_stats():
+    events = []
+    client = mk_catalog_client(
+        max_entries=1, metrics_hook=lambda *event: events.append(event)
+    )
+
+    client.networks.get_networks()
+    client.networks.get_networks()
+    client.genres.get_genres(type="movies")  # evicts networks
+
+    stats = client.cache.stats.snapshot()
+    networks, genres = stats["networks.get_networks"], stats["genres.get_genres"]
+
+    assert (networks["misses"], networks["hits"], networks["evictions"]) == (1, 1, 1)
+    assert networks["bytes_stored"] == 0
+    assert networks["time_saved"] > 0
+    assert (genres["misses"], genres["hits"]) == (1, 0)
+    assert genres["bytes_stored"] == client.cache.total_bytes
+
+    assert ("networks.get_networks", "hits", 1) in events
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_stats_expirations(tmp_path, backend):
+    client = mk_catalog_client(
+        backend=backend,
+        sqlite_path=str(tmp_path / "cache.sqlite"),
+        ttl={"networks": -1},
+        stale_while_revalidate=60,
+    )
+
+    client.networks.get_networks()
+    client.networks.get_networks()  # stale
+    wait_for_refresh(client)
+
+    client.config["cache"]["stale_while_revalidate"] = 0
+    client.cache.sweep()
+
+    stats = client.cache.stats.snapshot()["networks.get_networks"]
+    assert (stats["misses"], stats["stale_hits"], stats["expirations"]) == (2, 1, 1)
+    assert stats["bytes_stored"] == 0
+
+
+def mk_comments_client(**config):
+    endpoints = {
+        "comments/1$": [{}, 204],
+        "comments/2$": [{}, 404],
+        "comments/1/replies": [COMMENT, 201],
+        "comments/2/replies": [[COMMENT], 200],
+        "movies/tron/comments": [[COMMENT], 200],
+        "networks": [[], 200],
+    }
+    paginated = ["comments/2/replies", "movies/tron/comments"]
+    return mk_mock_client(
+        endpoints, paginated=paginated, cache={"cache_level": "full", **config}
+    )
+
+
+def requested(client):
+    return [r["resource"] for r in client.http._requests.req_stack]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_mutation_invalidates_cache(tmp_path, backend):
+    sqlite_path = str(tmp_path / "cache.sqlite")
+    client = mk_comments_client(backend=backend, sqlite_path=sqlite_path)
+
+    def fetch():
+        list(client.movies.get_comments(movie="tron"))
+        list(client.comments.get_replies(id=2))
+        client.networks.get_networks()
+
+    fetch()
+    client.comments.post_reply(id=1, comment="a b c d e f")
+    fetch()
+
+    # comment lists are refetched, replies to another comment are still cached
+    assert requested(client).count("movies/tron/comments/newest") == 2
+    assert requested(client).count("comments/2/replies") == 1
+    assert requested(client).count("networks") == 1
+
+    with pytest.raises(NotFound):  # nothing changed
+        client.comments.delete_comment(id=2)
+    fetch()
+    assert requested(client).count("comments/2/replies") == 1
+
+
+def test_invalidate_patterns():
+    client = mk_comments_client()
+    list(client.comments.get_replies(id=2))
+
+    path = client.comments._get_path("delete_comment")
+    path.is_valid(client, id=2)
+    client.cache.invalidate(path.get_invalidated_patterns())
+
+    assert len(client.cache) == 0
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_not_found_cache(tmp_path, backend):
+    client = mk_mock_client(
+        {"movies/missing": [{}, 404], "movies/private": [{}, 401]},
+        cache={
+            "backend": backend,
+            "sqlite_path": str(tmp_path / "cache.sqlite"),
+            "not_found_ttl": 60,
+        },
+    )
+
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            client.movies.get_summary(movie="missing")
+        with pytest.raises(Unauthorized):
+            client.movies.get_summary(movie="private")
+
+    assert requested(client) == ["movies/missing", "movies/private", "movies/private"]
+    assert client.cache.stats.snapshot()["movies.get_summary"]["hits"] == 1
+
+
+def test_not_found_cache_off():
+    client = mk_mock_client({"movies/missing": [{}, 404]})
+
+    for _ in range(2):
+        with pytest.raises(NotFound):
+            client.movies.get_summary(movie="missing")
+
+    assert len(requested(client)) == 2
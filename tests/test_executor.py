@@ -1,17 +1,22 @@
 # flake8: noqa: F403, F405
 
+import threading
 import time
-from dataclasses import asdict
+from copy import deepcopy
+from dataclasses import FrozenInstanceError, asdict
 
 import pytest
 from tests.test_data.oauth import OAUTH_GET_TOKEN
-from tests.utils import MockRequests, get_last_req, mk_mock_client
+from tests.utils import MockRequests, MockResponse, get_last_req, mk_mock_client
 from trakt import Trakt, TraktCredentials
+from trakt.core import json_parser
 from trakt.core.components import DefaultHttpComponent
 from trakt.core.components.cache import FrozenRequest
-from trakt.core.exceptions import ArgumentError, ClientError
+from trakt.core.components.http_component import BufferedResponse
+from trakt.core.exceptions import ArgumentError, ClientError, TraktResponseError
 from trakt.core.executors import Executor, PaginationIterator
 from trakt.core.paths import Path
+from trakt.core.paths.response_structs import Country, Network
 
 
 def test_executor():
@@ -100,7 +105,7 @@ def test_prefetch_off():
 
 
 def test_prefetch_on():
-    data = list(range(10 ** 3))
+    data = list(range(10**3))
     client = mk_mock_client({"pag_on": [data, 200]}, paginated=["pag_on"])
     executor = Executor(client)
     p_pag = Path("pag_on", [int], pagination=True)
@@ -172,7 +177,7 @@ def test_use_cached():
 
 
 def test_cache_timeout():
-    client = mk_mock_client({".*": [[], 200]}, cache={"timeout": -1})
+    client = mk_mock_client({".*": [[], 200]}, cache={"ttl": {"networks": -1}})
 
     client.networks.get_networks()
     client.networks.get_networks()
@@ -180,8 +185,350 @@ def test_cache_timeout():
     assert len(client.http._requests.req_stack) == 2
 
 
+def test_cache_ttl():
+    client = mk_mock_client({}, cache={"timeout": 10})
+    cache = client.cache
+
+    assert cache.get_ttl(client.genres.paths["get_genres"]) == 7 * 24 * 60 * 60
+    assert cache.get_ttl(client.movies.paths["get_stats"]) == 10
+
+    client.config["cache"]["ttl"] = {"movies": 20, "movies.get_trending": "long"}
+
+    assert cache.get_ttl(client.movies.paths["get_trending"]) == 24 * 60 * 60
+    assert cache.get_ttl(client.movies.paths["get_stats"]) == 20
+
+    client.config["cache"]["ttl"] = {"movies": "eternal"}
+    with pytest.raises(ClientError):
+        cache.get_ttl(client.movies.paths["get_stats"])
+
+
 def test_cache_get():
     client = mk_mock_client({})
 
     with pytest.raises(LookupError):
         client.cache.get(FrozenRequest("", {}, {}, None))
+
+
+def test_cache_store():
+    client = mk_mock_client({})
+    client.cache.set(FrozenRequest("a", {"b": "c"}, {"d": "e"}, response="resp"))
+
+    assert client.cache.has(FrozenRequest("a", {"b": "c"}, {"d": "e"}))
+    assert (
+        client.cache.get(FrozenRequest("a", {"b": "c"}, {"d": "e"})).response == "resp"
+    )
+    assert not client.cache.has(FrozenRequest("a", {"b": "c"}, {}))
+
+
+def cached(path, size=0):
+    return FrozenRequest(path, {}, {}, BufferedResponse(200, {}, b"x" * size))
+
+
+def test_cache_lru():
+    client = mk_mock_client({}, cache={"max_entries": 2})
+    cache = client.cache
+
+    cache.set(cached("a"))
+    cache.set(cached("b"))
+    cache.get(cached("a"))
+    cache.set(cached("c"))
+
+    assert len(cache) == 2
+    assert cache.has(cached("a")) and cache.has(cached("c"))
+    assert not cache.has(cached("b"))
+
+
+def test_cache_max_bytes():
+    client = mk_mock_client({}, cache={"max_entries": 0, "max_bytes": 2500})
+    cache = client.cache
+
+    for path in "abc":
+        cache.set(cached(path, 1000))
+
+    assert len(cache) == 2
+    assert cache.total_bytes == 2000 + 2 * len(cached("a")._unique_id)
+    assert not cache.has(cached("a"))
+
+
+def test_cache_sweep():
+    client = mk_mock_client({}, cache={"timeout": -1, "sweep_interval": 0})
+    cache = client.cache
+
+    cache.set(cached("a", 1000))
+    client.config["cache"]["timeout"] = 60
+    cache.set(cached("b"))
+
+    assert len(cache) == 1
+    assert cache.total_bytes == len(cached("b")._unique_id)
+
+
+def mk_revalidation_client(**config):
+    def responses():
+        yield MockResponse([{"name": "A"}], 200, {"ETag": '"v1"'})
+        while True:
+            yield MockResponse(None, 304)
+
+    return mk_mock_client(
+        {".*": responses()}, cache={"ttl": {"networks": -1}, **config}
+    )
+
+
+def test_cache_revalidation():
+    client = mk_revalidation_client()
+
+    assert client.networks.get_networks()[0].name == "A"
+    assert client.networks.get_networks()[0].name == "A"
+
+    first, second = client.http._requests.req_stack
+    assert "If-None-Match" not in first["headers"]
+    assert second["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_cache_revalidation_refreshes_ttl():
+    client = mk_revalidation_client()
+    client.networks.get_networks()
+
+    client.config["cache"]["ttl"]["networks"] = 60
+    client.networks.get_networks()  # 304
+    client.networks.get_networks()  # fresh again
+
+    assert len(client.http._requests.req_stack) == 2
+
+
+def test_cache_revalidation_reuses_parsed(monkeypatch):
+    client = mk_revalidation_client(parsed_results="share")
+    first = client.networks.get_networks()
+
+    parsed = []
+    monkeypatch.setattr(json_parser, "parse_tree", lambda *args: parsed.append(args))
+
+    client.config["cache"]["ttl"]["networks"] = 60
+    assert client.networks.get_networks() is first  # 304
+    assert client.networks.get_networks() is first  # fresh again
+
+    assert parsed == []
+    assert len(client.http._requests.req_stack) == 2
+
+
+def test_cache_revalidation_off():
+    client = mk_mock_client(
+        {".*": [[{"name": "A"}], 200, {"ETag": '"v1"'}]},
+        cache={"ttl": {"networks": -1}, "revalidate": False},
+    )
+
+    client.networks.get_networks()
+    client.networks.get_networks()
+
+    assert "If-None-Match" not in client.http._requests.req_stack[1]["headers"]
+
+
+def mk_parsed_cache_client(monkeypatch, mode):
+    client = mk_mock_client(
+        {".*": [[{"name": "A"}], 200]}, cache={"parsed_results": mode}
+    )
+    parsed = []
+    original_parse_tree = json_parser.parse_tree
+
+    def parse_tree(data, structure):
+        parsed.append(data)
+        return original_parse_tree(data, structure)
+
+    monkeypatch.setattr(json_parser, "parse_tree", parse_tree)
+
+    return client, parsed
+
+
+def test_cache_parsed_results_shared(monkeypatch):
+    client, parsed = mk_parsed_cache_client(monkeypatch, "share")
+
+    first = client.networks.get_networks()
+    second = client.networks.get_networks()
+
+    assert first is second
+    assert len(parsed) == 1
+
+    # callers can't change what the others get
+    with pytest.raises(TypeError):
+        first.append(first[0])
+    with pytest.raises(FrozenInstanceError):
+        first[0].name = "B"
+
+    copied = deepcopy(first)
+    copied[0].name = "B"
+    assert (type(copied[0]), second[0].name) == (Network, "A")
+    assert first[0] == Network("A") and asdict(first[0]) == {"name": "A"}
+
+
+def test_cache_parsed_results_size(monkeypatch):
+    client, _ = mk_parsed_cache_client(monkeypatch, "off")
+    client.networks.get_networks()
+    body_only = client.cache.total_bytes
+
+    client.config["cache"]["parsed_results"] = "share"
+    client.networks.get_networks()  # a hit, parsed and kept now
+    kept = client.cache.total_bytes
+
+    assert kept > body_only
+    assert (
+        client.cache.stats.snapshot()["networks.get_networks"]["bytes_stored"] == kept
+    )
+
+
+def test_cache_parsed_results_copied(monkeypatch):
+    client, parsed = mk_parsed_cache_client(monkeypatch, "copy")
+
+    first = client.networks.get_networks()
+    first[0].name = "B"
+    second = client.networks.get_networks()
+
+    assert second[0].name == "A"
+    assert len(parsed) == 1
+
+
+def test_cache_parsed_results_off(monkeypatch):
+    client, parsed = mk_parsed_cache_client(monkeypatch, "off")
+
+    client.networks.get_networks()
+    client.networks.get_networks()
+
+    assert len(parsed) == 2
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_parallel_prefetch():
+    data = list(range(1000))
+    client = mk_mock_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = Executor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    threads = set()
+    request = client.http._requests.request
+
+    def tracking_request(*args, **kwargs):
+        threads.add(threading.get_ident())
+        time.sleep(0.01)
+        return request(*args, **kwargs)
+
+    client.http._requests.request = tracking_request
+
+    assert executor.run(path=p_pag).take_all(max_workers=4) == data
+    assert len(threads) > 1
+    assert len(client.http._requests.req_stack) == 10
+
+
+def test_parallel_prefetch_partially_consumed():
+    data = list(range(1000))
+    client = mk_mock_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    executor = Executor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    it = executor.run(path=p_pag, per_page=7)
+    assert it.take(130) == data[:130]
+
+    assert it.take_all() == data[130:]
+
+
+def test_prefetch_max_workers():
+    client = mk_mock_client({"pag_on": [[1, 2], 200]}, paginated=["pag_on"])
+    executor = Executor(client)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    with pytest.raises(ArgumentError):
+        executor.run(path=p_pag).prefetch_all(max_workers=0)
+
+    client.config["pagination"]["max_workers"] = 1
+    assert executor.run(path=p_pag).take_all() == [1, 2]
+
+
+def mk_readahead_client(data):
+    client = mk_mock_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    release = threading.Event()
+    request = client.http._requests.request
+
+    def blocking_request(*args, params, **kwargs):
+        if params["page"] != "1":
+            release.wait(1)
+        return request(*args, params=params, **kwargs)
+
+    client.http._requests.request = blocking_request
+
+    return client, release
+
+
+def requested_pages(client):
+    return [r["params"]["page"] for r in client.http._requests.req_stack]
+
+
+def test_readahead():
+    data = list(range(20))
+    client, release = mk_readahead_client(data)
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    it = Executor(client).run(path=p_pag, per_page=2, readahead=3)
+
+    assert next(iter(it)) == 0
+    time.sleep(0.05)
+    assert requested_pages(client) == ["1"]  # 2, 3, 4 in flight
+    assert len(it._pending) == 3
+
+    release.set()
+    assert list(it) == data[1:]
+    assert sorted(requested_pages(client), key=int) == [str(i) for i in range(1, 11)]
+
+
+def test_readahead_close():
+    client, release = mk_readahead_client(list(range(20)))
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    it = Executor(client).run(path=p_pag, per_page=2, readahead=1)
+    assert it.take(2) == [0, 1]
+    pending = list(it._pending.values())
+
+    it.close()
+    assert all(p.cancelled() or p.running() for p in pending)
+    release.set()
+
+    # iteration still works, without reading ahead
+    assert it.take(2) == [2, 3]
+    assert it._pending == {}
+
+
+def test_readahead_prefetch():
+    data = list(range(500))
+    client, release = mk_readahead_client(data)
+    release.set()
+    p_pag = Path("pag_on", [int], pagination=True)
+
+    it = Executor(client).run(path=p_pag, per_page=3, readahead=2)
+    assert it.take(4) == data[:4]
+    assert it.take_all() == data[4:]
+
+    with pytest.raises(ArgumentError):
+        Executor(client).run(path=p_pag, readahead=-1)
+
+
+def test_lazy_pagination():
+    data = [{"name": "Australia", "code": "au"}, {"name": "x"}] * 3
+    client = mk_mock_client({"pag_on": [data, 200]}, paginated=["pag_on"])
+    p_pag = Path("pag_on", [Country], pagination=True)
+
+    it = Executor(client).run(path=p_pag, per_page=2, lazy=True)
+
+    assert next(iter(it)) == Country("Australia", "au")
+    assert it._queue == [{"name": "x"}]  # the page is kept as json
+    assert it._decode_item is json_parser.get_decoder(Country)  # resolved once
+
+    with pytest.raises(TraktResponseError):  # raised when the item is reached
+        next(it)
+
+    assert it.take(1) == [Country("Australia", "au")]
+
+    # parsed pages fail as a whole
+    it = Executor(client).run(path=p_pag, per_page=2)
+    with pytest.raises(TraktResponseError):
+        next(iter(it))
+
+    client = mk_mock_client(
+        {"pag_on": [data[:1], 200]}, paginated=["pag_on"], pagination={"lazy": True}
+    )
+    assert Executor(client).run(path=p_pag).take_all() == [Country("Australia", "au")]
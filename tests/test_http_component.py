@@ -1,12 +1,27 @@
 # flake8: noqa: F403, F405
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
 import pytest
-from tests.utils import MockRequests, mk_mock_client
+import requests
+from tests.utils import MockRequests, MockResponse, get_last_req, mk_mock_client
 from trakt import Trakt
 from trakt.core.components import DefaultHttpComponent
-from trakt.core.exceptions import BadRequest, RequestRelatedError
+from trakt.core.deadline import Deadline
+from trakt.core.exceptions import (
+    BadRequest,
+    DeadlineExceeded,
+    NotFound,
+    RateLimitExceeded,
+    RequestRelatedError,
+    ServiceUnavailable,
+)
 from trakt.core.executors import Executor
 from trakt.core.paths.path import Path
+from trakt.core.retry import RetryPolicy
 
 
 def test_get_url():
@@ -68,3 +83,292 @@ def test_unexpected_code():
 
     with pytest.raises(RequestRelatedError):
         client.networks.get_networks()
+
+
+def test_pooled_session():
+    client = Trakt("", "", http={"pool_connections": 2, "pool_maxsize": 7})
+
+    adapter = client.http._requests.get_adapter("https://api.trakt.tv")
+
+    assert client.http._requests is client.http._session
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 7
+    assert client.http._requests.headers["Connection"] == "keep-alive"
+
+
+def test_keep_alive_off():
+    client = Trakt("", "", http={"keep_alive": False})
+
+    assert client.http._requests.headers["Connection"] == "close"
+
+
+def test_close():
+    closed = []
+
+    with Trakt("", "") as client:
+        client.http._session.close = lambda: closed.append(True)
+
+    assert closed == [True]
+
+    # injected requests dependency is not owned by the component
+    client = mk_mock_client({".*": [[], 200]})
+    client.close()
+
+
+def responses(*responses):
+    def generator():
+        yield from (MockResponse(*r) for r in responses)
+
+    return generator()
+
+
+def mk_retry_client(*mocked_responses, **config):
+    sleeps = []
+
+    client = mk_mock_client({".*": responses(*mocked_responses)}, **config)
+    client.http.sleep = lambda t: sleeps.append(t)
+
+    return client, sleeps
+
+
+def test_retry():
+    client, sleeps = mk_retry_client(
+        ([], 429, {"Retry-After": "2"}), ([], 503), ([], 200)
+    )
+
+    assert client.networks.get_networks() == []
+    assert len(client.http._requests.req_stack) == 3
+    assert sleeps[0] == 2
+    assert 0 <= sleeps[1] <= 1  # backoff_factor * 2 ** 1, with jitter
+
+
+def test_retry_after_too_long():
+    client, sleeps = mk_retry_client(([], 429, {"Retry-After": "3600"}), ([], 200))
+
+    with pytest.raises(RateLimitExceeded):
+        client.networks.get_networks()
+
+    assert sleeps == []
+
+
+def test_retry_exhausted():
+    client, sleeps = mk_retry_client(*[([], 503)] * 3, http={"max_retries": 2})
+
+    with pytest.raises(ServiceUnavailable):
+        client.networks.get_networks()
+
+    assert len(sleeps) == 2
+
+
+def test_no_retry_non_idempotent():
+    client, sleeps = mk_retry_client(([], 429), ([], 201))
+
+    with pytest.raises(RateLimitExceeded):
+        Executor(client).run(path=Path("a", [None], methods="POST"))
+
+    assert sleeps == []
+
+
+def test_no_retry_client_error():
+    client, sleeps = mk_retry_client(([], 404), ([], 200))
+
+    with pytest.raises(NotFound):
+        client.networks.get_networks()
+
+    assert sleeps == []
+
+
+def test_path_retry_policy():
+    client, _ = mk_retry_client(([], 503), ([], 200))
+    path = Path("a", [None], retry_policy=RetryPolicy(max_retries=0))
+
+    with pytest.raises(ServiceUnavailable):
+        Executor(client).run(path=path)
+
+
+def test_retry_connection_error():
+    class FlakyRequests(MockRequests):
+        failures = 1
+
+        def request(self, *args, **kwargs):
+            if self.failures:
+                self.failures -= 1
+                raise requests.ConnectionError()
+            return super().request(*args, **kwargs)
+
+    client = Trakt("", "")
+    client.http = DefaultHttpComponent(
+        client, requests_dependency=FlakyRequests({".*": [[], 200]})
+    )
+    client.http.sleep = lambda t: None
+
+    assert client.networks.get_networks() == []
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.get_backoff(i) for i in range(5)] == [1, 2, 4, 5, 5]
+
+    retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = MockResponse(
+        code=429, headers={"Retry-After": format_datetime(retry_at)}
+    )
+    assert 25 < RetryPolicy().get_backoff(0, response) <= 30
+    assert policy.get_backoff(0, response) is None  # longer than max_backoff
+
+    assert policy.should_retry("GET", 0, 503)
+    assert policy.should_retry("GET", 0)
+    assert not policy.should_retry("GET", 3, 503)
+    assert not policy.should_retry("POST", 0, 503)
+    assert not policy.should_retry("GET", 0, 400)
+
+
+def slow_requests(client, delay=0.1):
+    request = client.http._requests.request
+
+    def slow_request(*args, **kwargs):
+        time.sleep(delay)
+        return request(*args, **kwargs)
+
+    client.http._requests.request = slow_request
+
+
+def test_coalesce_gets():
+    client = mk_mock_client({".*": [[], 200]})
+    slow_requests(client)
+
+    with ThreadPoolExecutor(10) as pool:
+        results = list(pool.map(lambda _: client.networks.get_networks(), range(10)))
+
+    assert results == [[]] * 10
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_coalesce_gets_error():
+    client, _ = mk_retry_client(*[([], 503)] * 2, http={"max_retries": 0})
+    slow_requests(client)
+
+    def get_networks(_):
+        with pytest.raises(ServiceUnavailable):
+            client.networks.get_networks()
+
+    with ThreadPoolExecutor(10) as pool:
+        list(pool.map(get_networks, range(10)))
+
+    assert len(client.http._requests.req_stack) == 1
+
+
+def test_coalesce_gets_deadline_and_timeout():
+    client = mk_mock_client({".*": [[], 200]})
+    slow_requests(client, delay=0.2)
+    get_networks = client.networks.get_networks
+
+    with ThreadPoolExecutor(3) as pool:
+        leader = pool.submit(get_networks)
+        time.sleep(0.05)
+        follower = pool.submit(get_networks, deadline=0.05)
+        other_timeout = pool.submit(get_networks, timeout=5)
+
+        with pytest.raises(DeadlineExceeded):  # stops waiting for the leader
+            follower.result()
+        assert leader.result() == other_timeout.result() == []
+
+    assert len(client.http._requests.req_stack) == 2
+
+    # calls with a deadline don't lead, others don't inherit their failure
+    client = mk_mock_client({".*": [[], 200]}, cache={"cache_level": "no"})
+    slow_requests(client)
+
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(lambda _: client.networks.get_networks(deadline=5), range(2)))
+
+    assert len(client.http._requests.req_stack) == 2
+
+
+def test_coalesce_gets_off():
+    client = mk_mock_client({".*": [[], 200]}, http={"coalesce_gets": False})
+    slow_requests(client)
+
+    with ThreadPoolExecutor(10) as pool:
+        list(pool.map(lambda _: client.networks.get_networks(), range(10)))
+
+    assert len(client.http._requests.req_stack) > 1
+
+
+def test_timeouts():
+    client = mk_mock_client({".*": [[], 200]}, http={"read_timeout": 10})
+
+    client.networks.get_networks(no_cache=True)
+    assert get_last_req(client.http)["timeout"] == (5, 10)
+
+    client.networks.get_networks(no_cache=True, timeout=3)
+    assert get_last_req(client.http)["timeout"] == (3, 3)
+
+    client.networks.get_networks(no_cache=True, timeout=(1, 2))
+    assert get_last_req(client.http)["timeout"] == (1, 2)
+
+    client.networks.get_networks(no_cache=True, deadline=2)
+    assert max(get_last_req(client.http)["timeout"]) <= 2
+
+
+def test_deadline_stops_retries():
+    client, sleeps = mk_retry_client(
+        ([], 503, {"Retry-After": "10"}), ([], 200), http={"max_retries": 5}
+    )
+
+    with pytest.raises(ServiceUnavailable):
+        client.networks.get_networks(deadline=5)
+
+    assert sleeps == []
+
+
+def test_deadline_exceeded():
+    client = mk_mock_client({".*": [[], 200]})
+
+    with pytest.raises(DeadlineExceeded):
+        client.networks.get_networks(deadline=0)
+
+    assert get_last_req(client.http) is None
+
+
+def test_deadline_cuts_request_timeout():
+    client = mk_mock_client({".*": [[], 200]}, cache={"cache_level": "no"})
+
+    def stalled_request(*args, timeout, **kwargs):
+        time.sleep(timeout[1])
+        raise requests.ReadTimeout()
+
+    client.http._requests.request = stalled_request
+
+    with pytest.raises(DeadlineExceeded) as e:
+        client.networks.get_networks(deadline=0.1)
+    assert isinstance(e.value.__cause__, requests.ReadTimeout)
+
+    # a timeout shorter than the deadline is raised as it is
+    client.http.sleep = lambda t: None
+    with pytest.raises(requests.ReadTimeout):
+        client.networks.get_networks(deadline=5, timeout=0.05)
+
+
+def test_pagination_deadline():
+    client = mk_mock_client({"pag_on": [list(range(10)), 200]}, paginated=["pag_on"])
+    path = Path("pag_on", [int], pagination=True)
+    deadline = Deadline(60)
+
+    it = Executor(client).run(path=path, per_page=2, deadline=deadline, timeout=1)
+    assert it.take(2) == [0, 1]
+    assert get_last_req(client.http)["timeout"] == (1, 1)
+
+    deadline.expires_at = time.monotonic()  # spent on the first page
+
+    with pytest.raises(DeadlineExceeded):
+        it.take(2)
+
+
+def test_batch_deadline():
+    client = mk_mock_client({".*": [[], 200]})
+
+    results = client.batch([(client.networks.get_networks, {})] * 3, deadline=0)
+
+    assert all(isinstance(r.error, DeadlineExceeded) for r in results)
@@ -1,14 +1,29 @@
-from dataclasses import dataclass
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from typing import Any, Dict, List, Optional, Union
 
 import pytest
+from tests.test_data.checkin import CHECKIN_EPISODE
 from tests.test_data.episodes import EPISODE, EXTENDED_EPISODE
 from tests.test_data.lists import LIST, TRENDING_LISTS, USER
+from tests.test_data.seasons import SEASON
 from tests.test_data.shows import EXTENDED_SHOW, SHOW
+from tests.utils import mk_mock_client
 from trakt.core import json_parser
 from trakt.core.exceptions import TraktResponseError
-from trakt.core.models import Episode, Show, TraktList, User
+from trakt.core.models import (
+    Episode,
+    Season,
+    Show,
+    TraktList,
+    User,
+    is_instance,
+    slotted,
+    slotted_structure,
+)
 from trakt.core.paths.response_structs import ListResponse
 
 
@@ -23,6 +38,13 @@ class MockClassDateData:
     data: MockClassName
 
 
+@dataclass
+class MockClassOptional:
+    name: str
+    parent: Optional[int]
+    tags: List[str] = field(default_factory=list)
+
+
 def test_basic_list_dict():
     data = ["abc", "xyz"]
     tree_struct = [str]
@@ -106,6 +128,111 @@ def test_wildcards():
     assert parsed[0.7] == 10
 
 
+def test_name_mapping_and_nulls():
+    data = {
+        "crew": {"costume & make-up": [{"name": "x"}]},
+        "items": [{}, {"a": {}, "costume & make-up": 1}],
+    }
+    tree_struct = {"crew": {str: [MockClassName]}, "items": [Any]}
+
+    parsed = json_parser.parse_tree(data, tree_struct)
+
+    assert parsed["crew"]["costume_make_up"][0].name == "x"
+    assert parsed["items"] == [None, {"a": None, "costume_make_up": 1}]
+    assert data["items"][0] == {}  # the input is left as it is
+
+
+def test_decoder_per_structure():
+    decoder = json_parser.get_decoder([Show])
+
+    assert json_parser.get_decoder([Show]) is decoder
+    assert json_parser.get_decoder({"a": [Show]}) is not decoder
+
+
+def test_decoder_concurrent_first_use(monkeypatch):
+    @dataclass
+    class Outer:
+        name: str
+        inner: MockClassOptional
+
+    compile_fields = json_parser._compile_fields
+
+    def slow_compile_fields(*args):
+        time.sleep(0.05)  # the others get to the half-built decoder meanwhile
+        compile_fields(*args)
+
+    monkeypatch.setattr(json_parser, "_compile_fields", slow_compile_fields)
+    data = [{"name": "a", "inner": {"name": "b", "parent": 1}}]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(
+            pool.map(lambda _: json_parser.parse_tree(data, [Outer]), range(8))
+        )
+
+    assert all(r == [Outer("a", MockClassOptional("b", 1))] for r in results)
+
+
+def test_dataclass_fields():
+    parsed = json_parser.parse_tree({"name": "x", "tags": ["a"]}, MockClassOptional)
+    assert (parsed.parent, parsed.tags) == (None, ["a"])
+
+    parsed = json_parser.parse_tree({"name": "x", "parent": {}}, MockClassOptional)
+    assert (parsed.parent, parsed.tags) == (None, [])
+
+    # undeclared keys are kept as attributes
+    parsed = json_parser.parse_tree({"name": "x", "extra": {"a": {}}}, MockClassName)
+    assert parsed.extra == {"a": None}
+
+    with pytest.raises(TraktResponseError):
+        json_parser.parse_tree({"parent": 1}, MockClassOptional)
+
+
+def test_slotted_models():
+    client = mk_mock_client({})
+    data = [{**SEASON, "episodes": [EXTENDED_EPISODE]}]
+
+    regular = json_parser.parse_tree(data, [Season])[0]
+    season = json_parser.parse_tree(data, slotted_structure([Season]))[0]
+
+    assert type(season) is slotted(Season)
+    assert type(season.episodes[0]) is slotted(Episode)
+    assert not hasattr(season, "__dict__")
+    assert not hasattr(season.ids, "__dict__")
+
+    assert season.to_dict() == regular.to_dict()
+    assert season.client is client
+    assert is_instance(season, Season) and is_instance(regular, Season)
+    assert not is_instance(season, (Show, Episode))
+    assert slotted(slotted(Season)) is slotted(Season)
+
+
+def test_slotted_models_pickle():
+    data = {**SEASON, "episodes": [EXTENDED_EPISODE]}
+    season = json_parser.parse_tree(data, slotted(Season))
+
+    unpickled = pickle.loads(pickle.dumps(season))
+
+    assert type(unpickled) is slotted(Season)
+    assert type(unpickled.episodes[0]) is slotted(Episode)
+    assert unpickled == season
+
+
+def test_slotted_models_config():
+    client = mk_mock_client(
+        {
+            r".*episodes.*": [EXTENDED_EPISODE, 200],
+            r".*checkin.*": [CHECKIN_EPISODE, 201],
+        },
+        models={"slots": True},
+    )
+    episode = client.episodes.get_episode(show=1, season=1, episode=1, extended=True)
+
+    assert type(episode) is slotted(Episode)
+    assert episode.title == EXTENDED_EPISODE["title"]
+
+    client.checkin.check_into_episode(episode=episode)  # accepted as an Episode
+
+
 def test_parser_nofail():
     ep = json_parser.parse_tree(EPISODE, Episode)
     epex = json_parser.parse_tree(EXTENDED_EPISODE, Episode)
@@ -134,6 +261,10 @@ def test_parser_default_none():
     assert show.country == "gb"
     assert show.trailer is None
 
+    # 204 from next_episode / last_episode
+    assert json_parser.parse_tree({}, Union[Episode, Dict[str, Any]]) is None
+    assert json_parser.parse_tree(None, Optional[Show]) is None
+
 
 def test_parser_invalid_structure():
     with pytest.raises(TraktResponseError):
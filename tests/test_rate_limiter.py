@@ -0,0 +1,71 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from tests.utils import mk_mock_client
+from trakt.core.executors import Executor
+from trakt.core.paths.path import Path
+from trakt.core.rate_limiter import RateLimiter, TokenBucket
+
+LIMITS = {"GET": (3, 3), "POST": (1, 1)}
+
+
+def test_token_bucket():
+    bucket = TokenBucket(2, 1)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+    assert bucket.reserve() == pytest.approx(1, abs=0.01)
+
+
+def test_token_bucket_threads():
+    bucket = TokenBucket(10, 1)
+
+    with ThreadPoolExecutor(8) as pool:
+        delays = list(pool.map(lambda _: bucket.reserve(), range(30)))
+
+    assert delays.count(0) == 10
+    assert max(delays) == pytest.approx(2, abs=0.05)
+
+
+def test_separate_buckets():
+    limiter = RateLimiter(LIMITS)
+
+    assert limiter.reserve("POST", "client") == 0
+    assert limiter.reserve("DELETE", "client") > 0  # same budget as POST
+    assert limiter.reserve("GET", "client") == 0
+    assert limiter.reserve("POST", "client", "token") == 0
+    assert limiter.reserve("POST", "other client") == 0
+
+
+def test_shared_file_buckets(tmp_path):
+    # two limiters act like two worker processes
+    limiter1 = RateLimiter(LIMITS, lock_dir=str(tmp_path))
+    limiter2 = RateLimiter(LIMITS, lock_dir=str(tmp_path))
+
+    assert limiter1.reserve("POST", "client", "token") == 0
+    assert limiter2.reserve("POST", "client", "token") > 0.9
+    assert limiter2.reserve("POST", "client", "other token") == 0
+
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_rate_limited_client():
+    client = mk_mock_client(
+        {".*": [{}, 200]}, rate_limit={"enabled": True, "post_limit": 2}
+    )
+    sleeps = []
+    client.http.sleep = lambda t: sleeps.append(t)
+
+    path = Path("a", {}, methods="POST")
+    for _ in range(4):
+        Executor(client).run(path=path)
+
+    assert len(sleeps) == 2
+    assert len(client.http._requests.req_stack) == 4
+
+
+def test_rate_limiter_off():
+    client = mk_mock_client({".*": [{}, 200]})
+
+    assert client.http.rate_limiter is None
@@ -1,12 +1,14 @@
 import json
 import re
+import threading
 import types
 from collections import defaultdict
 from copy import deepcopy
 from math import ceil
 from typing import Any, Dict, Generator, Iterable, List, Optional
 
-from trakt import Trakt, TraktCredentials
+from trakt import AsyncTrakt, Trakt, TraktCredentials
+from trakt.core.components.async_http_component import AsyncHttpComponent
 from trakt.core.components.http_component import DefaultHttpComponent
 
 try:
@@ -36,12 +38,13 @@ class MockRequests:
         self.req_map = defaultdict(list)
         self.req_stack = []
         self.paginated_endpoints = paginated or set()
+        self.lock = threading.Lock()
 
         for path, v in map_of_responses.items():
             regexified_path = ".*" + path + ".*"
 
             if isinstance(v, list):
-                (json_response, code, *rest) = v
+                json_response, code, *rest = v
                 headers = {} if not rest else rest[0]
 
                 self.m[regexified_path] = self.make_infinite_response_generator(
@@ -80,7 +83,8 @@ class MockRequests:
         self.req_stack.append(req)
 
         endpoint_identifier = self.find_path(path)
-        response = next(self.m[endpoint_identifier])
+        with self.lock:  # generators can't be advanced by many threads at once
+            response = next(self.m[endpoint_identifier])
 
         if endpoint_identifier[2:-2] in self.paginated_endpoints:
             return self.return_page(response, params=params, **kwargs)
@@ -127,6 +131,41 @@ def get_mock_http_component(
     return wrapper
 
 
+class MockAsyncResponse:
+    def __init__(self, response):
+        self.status = response.status_code
+        self.headers = response.headers
+        self.body = json.dumps(response.json()).encode()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+class MockAsyncSession(MockRequests):
+    def request(self, method, path, params, *args, **kwargs):
+        response = super().request(method, path, params, *args, **kwargs)
+        return MockAsyncResponse(response)
+
+
+def get_mock_async_http_component(
+    map_of_responses: Dict[str, Iterable[Any]], paginated: Optional[List[str]] = None
+):
+    paginated = paginated or []
+
+    def wrapper(client):
+        return AsyncHttpComponent(
+            client, requests_dependency=MockAsyncSession(map_of_responses, paginated)
+        )
+
+    return wrapper
+
+
 USER = TraktCredentials("", "", "", 10e14)
 
 
@@ -142,6 +181,18 @@ def mk_mock_client(
     )
 
 
+def mk_mock_async_client(
+    endpoints, client_id="", client_secret="", user=False, paginated=None, **config
+):
+    return AsyncTrakt(
+        client_id,
+        client_secret,
+        http_component=get_mock_async_http_component(endpoints, paginated=paginated),
+        user=USER if user is False else None,
+        **config,
+    )
+
+
 def get_last_req(http):
     if http._requests.req_stack:
         return http._requests.req_stack[-1]
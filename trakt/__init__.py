@@ -1,12 +1,13 @@
 import logging
 from logging import NullHandler
 
-from trakt.api import TraktApi, TraktCredentials
+from trakt.api import AsyncTraktApi, TraktApi, TraktCredentials
 from trakt.version import __version__  # NOQA
 
 Trakt = TraktApi
+AsyncTrakt = AsyncTraktApi
 
-__all__ = ("Trakt", "TraktCredentials")
+__all__ = ("Trakt", "AsyncTrakt", "TraktCredentials")
 
 
 logging.getLogger(__name__).addHandler(NullHandler())
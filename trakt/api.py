@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
+from trakt.core.batch import BatchCall, BatchResult, run_async_batch, run_batch
 from trakt.core.components import (
+    AsyncHttpComponent,
+    AsyncOauthComponent,
     CacheManager,
     DefaultHttpComponent,
     DefaultOauthComponent,
 )
 from trakt.core.config import Config, DefaultConfig, TraktCredentials
-from trakt.core.executors import Executor
+from trakt.core.executors import AsyncExecutor, Executor
 from trakt.core.models import AbstractBaseModel
 from trakt.core.paths import (
     DEFAULT_INTERFACES,
@@ -65,6 +78,8 @@ class TraktApi:
     seasons: SeasonsI
     episodes: EpisodesI
 
+    executor_class: Type[Executor] = Executor
+
     def __init__(
         self,
         client_id: str,
@@ -72,11 +87,11 @@ class TraktApi:
         *,
         http_component: Optional[Type[DefaultHttpComponent]] = None,
         oauth_component: Optional[Type[DefaultOauthComponent]] = None,
-        cache_manager: Optional[Type[CacheManager]] = None,
+        cache_manager: Optional[Callable[[TraktApi], CacheManager]] = None,
         interfaces: Dict[str, Type[SuiteInterface]] = None,
         user: Optional[TraktCredentials] = None,
         auto_refresh_token: bool = False,
-        **config: str
+        **config: str,
     ) -> None:
         AbstractBaseModel.set_client(self)
 
@@ -87,7 +102,7 @@ class TraktApi:
             client_id=client_id,
             client_secret=client_secret,
             auto_refresh_token=auto_refresh_token,
-            **config
+            **config,
         )
 
         self.user = user
@@ -98,21 +113,47 @@ class TraktApi:
 
         interfaces = interfaces or {}
         for i_name, default in DEFAULT_INTERFACES.items():
-            i_obj = interfaces.get(i_name, default)(self, Executor)
+            i_obj = interfaces.get(i_name, default)(self, self.executor_class)
+            i_obj.name_paths()
             setattr(self, i_name, i_obj)
 
     def request(self, params: Union[str, List[str]], **kwargs: Any) -> Any:
         if isinstance(params, str):
             params = params.split(".")
 
-        e = Executor(self, params)
+        e = self.executor_class(self, params)
         e.install(self._get_executor_paths())
 
         return e.run(**kwargs)
 
+    def batch(
+        self,
+        calls: Iterable[BatchCall],
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> List[BatchResult]:
+        """Run many api calls concurrently.
+
+        calls: (method, kwargs) pairs, method being eg. client.movies.get_stats
+        or "movies.get_stats". Results come in input order; failed calls hold
+        their exception instead of raising. deadline: time budget in seconds
+        of the whole batch.
+        """
+        return run_batch(self, calls, max_workers, deadline)
+
     def set_user(self, user: TraktCredentials) -> None:
         self.user = user
 
+    def close(self) -> None:
+        self.http.close()
+        self.cache.close()
+
+    def __enter__(self) -> TraktApi:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
     def _get_executor_paths(self) -> List[SuiteInterface]:
         return [
             self.calendars,
@@ -130,3 +171,41 @@ class TraktApi:
             self.search,
             self.shows,
         ]
+
+
+class AsyncTraktApi(TraktApi):
+    """TraktApi running on asyncio; api calls return awaitables,
+    paginated endpoints return async iterators."""
+
+    http: AsyncHttpComponent  # type: ignore[assignment]
+    oauth: AsyncOauthComponent
+
+    executor_class = AsyncExecutor
+
+    def __init__(self, client_id: str, client_secret: str, **kwargs: Any) -> None:
+        kwargs["http_component"] = kwargs.get("http_component") or AsyncHttpComponent
+        kwargs["oauth_component"] = kwargs.get("oauth_component") or AsyncOauthComponent
+
+        super().__init__(client_id, client_secret, **kwargs)
+
+    async def batch(  # type: ignore[override]
+        self,
+        calls: Iterable[BatchCall],
+        max_workers: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> List[BatchResult]:
+        return await run_async_batch(self, calls, max_workers, deadline)
+
+    async def close(self) -> None:  # type: ignore[override]
+        await self.http.close()
+        self.cache.close()
+
+    def __enter__(self) -> AsyncTraktApi:
+        # close() is a coroutine, __exit__ couldn't wait for it
+        raise TypeError("use async with")
+
+    async def __aenter__(self) -> AsyncTraktApi:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
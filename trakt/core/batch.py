@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from trakt.core.deadline import Deadline
+from trakt.core.exceptions import ArgumentError, ClientError
+from trakt.core.executors import Executor
+from trakt.core.paths.suite_interface import SuiteInterface
+
+if TYPE_CHECKING:  # pragma: no cover
+    from trakt.api import AsyncTraktApi, TraktApi
+    from trakt.core.paths.path import Path
+
+__all__ = ("BatchResult", "run_batch", "run_async_batch")
+
+BatchCall = Sequence[Any]  # (client.movies.get_stats | "movies.get_stats", kwargs)
+
+
+@dataclass
+class BatchResult:
+    value: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def get(self) -> Any:
+        if self.error is not None:
+            raise self.error
+
+        return self.value
+
+
+@dataclass
+class _PreparedCall:
+    method: Callable[..., Any]
+    kwargs: Dict[str, Any]
+
+
+def run_batch(
+    client: TraktApi,
+    calls: Iterable[BatchCall],
+    max_workers: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> List[BatchResult]:
+    max_workers = _get_max_workers(client, max_workers)
+    shared_deadline = Deadline.coerce(deadline)
+    # validate all before running
+    prepared = [_prepare(client, c, shared_deadline) for c in calls]
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        return list(pool.map(_execute, prepared))
+
+
+async def run_async_batch(
+    client: AsyncTraktApi,
+    calls: Iterable[BatchCall],
+    max_workers: Optional[int] = None,
+    deadline: Optional[float] = None,
+) -> List[BatchResult]:
+    semaphore = asyncio.Semaphore(_get_max_workers(client, max_workers))
+    shared_deadline = Deadline.coerce(deadline)
+    prepared = [_prepare(client, c, shared_deadline) for c in calls]
+
+    async def execute(call: Union[_PreparedCall, BatchResult]) -> BatchResult:
+        if isinstance(call, BatchResult):
+            return call
+
+        async with semaphore:
+            try:
+                value = call.method(**call.kwargs)
+                if inspect.isawaitable(value):  # paginated calls return an iterator
+                    value = await value
+            except Exception as e:
+                return BatchResult(error=e)
+
+        return BatchResult(value=value)
+
+    return list(await asyncio.gather(*map(execute, prepared)))
+
+
+def _execute(call: Union[_PreparedCall, BatchResult]) -> BatchResult:
+    if isinstance(call, BatchResult):
+        return call
+
+    try:
+        return BatchResult(value=call.method(**call.kwargs))
+    except Exception as e:
+        return BatchResult(error=e)
+
+
+def _get_max_workers(client: TraktApi, max_workers: Optional[int]) -> int:
+    if max_workers is None:
+        max_workers = client.config["batch"]["max_workers"]
+
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ArgumentError(f"max_workers={max_workers} is invalid; must be >= 1")
+
+    return max_workers
+
+
+def _prepare(
+    client: TraktApi, call: BatchCall, deadline: Optional[Deadline]
+) -> Union[_PreparedCall, BatchResult]:
+    """Resolve and validate a call; invalid calls become failed results."""
+    try:
+        if isinstance(call, str) or len(call) != 2:
+            raise ArgumentError("batch call: has to be a (method, kwargs) pair")
+
+        method, kwargs = call
+        if isinstance(method, str):
+            method = _find_method(client, method)
+
+        _validate(method, kwargs)
+    except Exception as e:
+        return BatchResult(error=e)
+
+    if deadline is not None:
+        kwargs = {"deadline": deadline, **kwargs}
+
+    return _PreparedCall(method, kwargs)
+
+
+def _find_method(client: TraktApi, name: str) -> Callable[..., Any]:
+    suite_name, _, method_name = name.partition(".")
+    suite = getattr(client, suite_name, None)
+    if isinstance(suite, SuiteInterface) and method_name in suite.paths:
+        return getattr(suite, method_name)
+
+    # fall back to path aliases, as client.request does
+    params = name.split(".")
+    suites = client._get_executor_paths()
+    matching_paths = [p for s in suites for p in s.find_matching(params)]
+
+    if len(matching_paths) != 1:
+        raise ClientError("Invalid call: matching paths # has to be 1")
+
+    return matching_paths[0][1]
+
+
+def _validate(method: Callable[..., Any], kwargs: Dict[str, Any]) -> None:
+    interface = getattr(method, "__self__", None)
+    if not isinstance(interface, SuiteInterface):
+        raise ArgumentError("batch call: method has to be an api method")
+
+    # dry run: the method prepares its arguments as usual, the path validators
+    # run and the executor stops before making the request
+    dry_run = copy(interface)
+    dry_run.executor_class = _ValidatingExecutor
+
+    try:
+        getattr(dry_run, method.__name__)(**kwargs)
+    except _Validated:
+        pass
+
+
+class _Validated(Exception):
+    pass
+
+
+class _ValidatingExecutor(Executor):
+    def __init__(self, client: TraktApi, params: Optional[List[str]] = None) -> None:
+        self.params = params or []
+        self.client = client
+        self.path_suites = []
+
+    def run(self, *, path: Optional[Path] = None, **kwargs: Any) -> Any:
+        if path is not None:
+            copy(path).is_valid(self.client, **kwargs)  # raises
+
+        raise _Validated
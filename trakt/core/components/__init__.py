@@ -1,5 +1,6 @@
 # flake8: noqa: F403
 
+from trakt.core.components.async_http_component import AsyncHttpComponent
 from trakt.core.components.cache import CacheManager, FrozenRequest
 from trakt.core.components.http_component import DefaultHttpComponent
-from trakt.core.components.oauth import DefaultOauthComponent
+from trakt.core.components.oauth import AsyncOauthComponent, DefaultOauthComponent
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+from trakt.core.components.http_component import (
+    ApiResponse,
+    BaseHttpComponent,
+    BufferedResponse,
+    PendingRequest,
+    Timeout,
+)
+from trakt.core.deadline import Deadline
+from trakt.core.exceptions import ClientError
+from trakt.core.retry import RetryPolicy
+from trakt.core.singleflight import AsyncSingleFlight
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+REQUEST_ERRORS = (
+    (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+    if aiohttp
+    else (asyncio.TimeoutError,)
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from trakt.api import AsyncTraktApi
+
+
+class AsyncHttpComponent(BaseHttpComponent):
+    client: AsyncTraktApi
+    _requests: Any
+    _session: Any
+
+    def __init__(self, client: AsyncTraktApi, requests_dependency: Any = None) -> None:
+        super().__init__(client)
+        self._requests = requests_dependency
+        self._session = None
+        self._flights = AsyncSingleFlight()
+
+    def _get_session(self) -> Any:
+        if self._requests is None:
+            # aiohttp sessions have to be created inside a running event loop
+            self._session = self._make_session()
+            self._requests = self._session
+
+        return self._requests
+
+    def _make_session(self) -> Any:
+        if aiohttp is None:  # pragma: no cover
+            raise ClientError("aiohttp is required to use the asyncio client")
+
+        config = self.client.config["http"]
+
+        connector = aiohttp.TCPConnector(
+            limit=config["pool_connections"] * config["pool_maxsize"],
+            limit_per_host=config["pool_maxsize"],
+            force_close=not config["keep_alive"],
+        )
+
+        return aiohttp.ClientSession(
+            connector=connector, cookie_jar=aiohttp.DummyCookieJar()
+        )
+
+    @staticmethod
+    def _make_client_timeout(timeouts: Tuple[float, float]) -> Any:
+        if aiohttp is None:  # pragma: no cover
+            return None  # only possible with an injected session
+
+        connect, read = timeouts
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._requests = None
+
+    async def request(
+        self,
+        path: str,
+        *,
+        method: str = "GET",
+        query_args: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        no_raise: bool = False,
+        use_cache: bool = False,
+        serve_stale: bool = False,
+        user_scoped: bool = True,
+        cache_label: str = "",
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = None,
+        deadline: Union[Deadline, float, None] = None,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        pending = self._prepare(
+            path,
+            method,
+            query_args,
+            data,
+            headers,
+            user_scoped,
+            retry_policy,
+            timeout,
+            deadline,
+        )
+
+        if use_cache:
+            cached_response = self._get_cached(pending, serve_stale)
+            if cached_response is not None:
+                return cached_response
+
+        flight_key = self._get_flight_key(pending)
+        if flight_key is None:
+            response = await self._get_response(pending)
+        else:
+            get_response = partial(self._get_response, pending)
+            response = await self._flights.do(
+                flight_key, get_response, pending.deadline
+            )
+
+        return self._finish_request(pending, response, use_cache, no_raise, cache_label)
+
+    async def _get_response(self, pending: PendingRequest) -> Any:
+        attempt = 0
+        delay: Optional[float]
+
+        while True:
+            try:
+                response = await self._get_raw_response(pending)
+            except REQUEST_ERRORS as e:
+                delay = self._get_error_retry_delay(e, pending, attempt)
+            else:
+                delay = self._get_retry_delay(pending, attempt, response)
+                if delay is None:
+                    return response
+
+            await self.sleep(delay)
+            attempt += 1
+
+    async def sleep(self, t: float) -> None:  # pragma: no cover
+        await asyncio.sleep(t)
+
+    async def _get_raw_response(self, pending: PendingRequest) -> Any:
+        delay = self._get_rate_limit_delay(pending)
+        if delay:
+            await self.sleep(delay)
+
+        timeouts = self._get_timeouts(pending.timeout, pending.deadline)
+        async with self._get_session().request(
+            pending.method,
+            pending.url,
+            params=pending.query_args,
+            data=pending.data,
+            headers=pending.get_headers(),
+            timeout=self._make_client_timeout(timeouts),
+        ) as response:
+            content = await response.read()
+
+        revalidated = pending.get_revalidated(response.status)
+        if revalidated is not None:
+            return revalidated
+
+        return BufferedResponse(response.status, response.headers, content)
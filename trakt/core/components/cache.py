@@ -1,11 +1,50 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import gzip
+import json
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, fields, is_dataclass, replace
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+
+from trakt.core.components.cache_stats import CacheStats
+from trakt.core.exceptions import ClientError
+from trakt.core.models import read_only
 
 if TYPE_CHECKING:  # pragma: no cover
     from trakt.api import TraktApi
+    from trakt.core.batch import BatchCall, BatchResult
+    from trakt.core.paths.path import Path
+
+USER_HEADERS = {"Authorization"}  # left out of the cache keys of public endpoints
+
+# catalogs fetched by cache.warm() by default
+WARMUP_CALLS: List[BatchCall] = [
+    *[
+        (f"{suite}.get_{suite}", {"type": t})
+        for suite in ("certifications", "countries", "genres", "languages")
+        for t in ("movies", "shows")
+    ],
+    ("networks.get_networks", {}),
+]
 
 
 class CacheLevel(Enum):
@@ -14,15 +53,255 @@ class CacheLevel(Enum):
     FULL = "full"
 
 
+@dataclass
+class CacheEntry:
+    request: FrozenRequest  # holds the response
+    expires_at: float  # unix timestamp
+    size: int = 0  # estimated, in bytes
+    label: str = ""  # of the path, for the stats
+    latency: float = 0  # seconds the api took to respond
+
+    def is_expired(self) -> bool:
+        return time.time() > self.expires_at
+
+    def has_validators(self) -> bool:
+        """Whether the response can be revalidated with a conditional request."""
+        if self.is_negative():
+            return False
+
+        return bool(self.request.get_conditional_headers())
+
+    def is_negative(self) -> bool:
+        """Whether it's a remembered 404, see cache.not_found_ttl."""
+        return self.request.response.status_code == 404
+
+
+class CacheBackend(ABC):
+    """Storage of cache entries; CacheManager decides what and how long to cache.
+
+    Backends report stored and removed entries to on_change (event, label,
+    size); events: "stored", "replaced", "deleted", "evicted", "expired".
+    """
+
+    on_change: Optional[Callable[[str, str, int], None]] = None
+
+    def _notify(self, event: str, label: str, size: int) -> None:
+        if self.on_change is not None:
+            self.on_change(event, label, size)
+
+    @abstractmethod
+    def get(self, key: FrozenRequest) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: FrozenRequest) -> None:
+        ...
+
+    @abstractmethod
+    def delete_paths(self, matches: Callable[[str], bool]) -> None:
+        """Drop the entries whose api path matches."""
+
+    @abstractmethod
+    def entries(self) -> Iterator[CacheEntry]:
+        """All entries, but those of user-scoped requests."""
+
+    @abstractmethod
+    def sweep(self, expired_before: float, keep_revalidatable: bool) -> None:
+        """Drop entries which expired before the given time (but those with
+        validators, if asked to)."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @property
+    @abstractmethod
+    def total_bytes(self) -> int:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """LRU dict bounded by entry count and estimated size (0 = no limit)."""
+
+    _cache: OrderedDict[FrozenRequest, CacheEntry]  # least recently used first
+
+    def __init__(self, max_entries: int = 0, max_bytes: int = 0) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+
+    def get(self, key: FrozenRequest) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+
+            return entry
+
+    def set(self, entry: CacheEntry) -> None:
+        with self._lock:
+            self._remove(entry.request, "replaced")
+            self._cache[entry.request] = entry
+            self._total_bytes += entry.size
+            self._notify("stored", entry.label, entry.size)
+
+            self._evict()
+
+    def delete(self, key: FrozenRequest) -> None:
+        with self._lock:
+            self._remove(key, "deleted")
+
+    def delete_paths(self, matches: Callable[[str], bool]) -> None:
+        with self._lock:
+            for req in [req for req in self._cache if matches(req.path)]:
+                self._remove(req, "deleted")
+
+    def entries(self) -> Iterator[CacheEntry]:
+        with self._lock:
+            entries = list(self._cache.values())
+
+        return (e for e in entries if not e.request.is_user_scoped())
+
+    def sweep(self, expired_before: float, keep_revalidatable: bool) -> None:
+        with self._lock:
+            for req, entry in list(self._cache.items()):
+                if entry.expires_at < expired_before:
+                    if not (keep_revalidatable and entry.has_validators()):
+                        self._remove(req, "expired")
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def _remove(self, key: FrozenRequest, event: str) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry.size
+            self._notify(event, entry.label, entry.size)
+
+    def _evict(self) -> None:
+        while self._cache and self._over_limit():
+            _, entry = self._cache.popitem(last=False)
+            self._total_bytes -= entry.size
+            self._notify("evicted", entry.label, entry.size)
+
+    def _over_limit(self) -> bool:
+        if self.max_entries and len(self._cache) > self.max_entries:
+            return True
+
+        return bool(self.max_bytes) and self._total_bytes > self.max_bytes
+
+
 class CacheManager:
+    """Cache of api responses, kept in a pluggable backend.
+
+    The backend is picked by the cache.backend setting ("memory" or "sqlite"),
+    or passed in: cache_manager=lambda c: CacheManager(c, backend=...).
+    Expired entries are swept every cache.sweep_interval seconds, on writes.
+
+    With cache.stale_while_revalidate set, entries are served for that many
+    seconds past their expiry while the executor refreshes them in the
+    background.
+    """
+
     client: TraktApi
-    _cache: Dict[FrozenRequest, datetime]
+    backend: CacheBackend
+    stats: CacheStats
 
     CACHE_LEVELS = (CacheLevel.NO, CacheLevel.BASIC, CacheLevel.FULL)
 
-    def __init__(self, client: TraktApi) -> None:
+    def __init__(
+        self, client: TraktApi, backend: Optional[CacheBackend] = None
+    ) -> None:
         self.client = client
-        self._cache = {}
+        self.backend = self._make_backend() if backend is None else backend
+        self._last_sweep = time.time()
+
+        self.stats = CacheStats(client.config["cache"]["metrics_hook"])
+        self.backend.on_change = self._record_change
+
+        self._refreshing: Set[FrozenRequest] = set()
+        self._refresh_lock = threading.Lock()
+
+    def _make_backend(self) -> CacheBackend:
+        config = self.client.config["cache"]
+        limits = {
+            "max_entries": config["max_entries"],
+            "max_bytes": config["max_bytes"],
+        }
+
+        if config["backend"] == "memory":
+            return MemoryCacheBackend(**limits)
+
+        if config["backend"] == "sqlite":
+            from trakt.core.components.sqlite_cache import SQLiteCacheBackend
+
+            return SQLiteCacheBackend(config["sqlite_path"], **limits)
+
+        raise ClientError(f"unknown cache backend: {config['backend']}")
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    @property
+    def total_bytes(self) -> int:
+        return self.backend.total_bytes
+
+    def close(self) -> None:
+        self.backend.close()
+
+    def warm(
+        self, calls: Optional[Iterable[BatchCall]] = None, **kwargs: Any
+    ) -> List[BatchResult]:
+        """Make the calls (WARMUP_CALLS by default) concurrently to fill the cache.
+
+        Takes the same calls and arguments as client.batch(); a call may also be
+        just a method name, eg. "networks.get_networks".
+        """
+        calls = WARMUP_CALLS if calls is None else calls
+        calls = [(c, {}) if isinstance(c, str) else c for c in calls]
+
+        return self.client.batch(calls, **kwargs)
+
+    def snapshot(self, path: str) -> int:
+        """Dump the entries to a gzipped json lines file; returns their number.
+
+        Entries of user-scoped requests are left out, they hold access tokens.
+        """
+        count = 0
+
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            for entry in self.backend.entries():
+                f.write(json.dumps(_dump_entry(entry)) + "\n")
+                count += 1
+
+        return count
+
+    def restore(self, path: str) -> int:
+        """Load the entries of a snapshot; returns their number."""
+        count = 0
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                self.backend.set(_load_entry(json.loads(line)))
+                count += 1
+
+        self.sweep()  # drops whatever expired in the meantime
+
+        return count
 
     def accepted_level(self, level: CacheLevel) -> bool:
         max_allowed = CacheLevel(self.client.config["cache"]["cache_level"])
@@ -35,26 +314,271 @@ class CacheManager:
             return max_allowed == CacheLevel.FULL
 
     def get(self, wanted: FrozenRequest) -> FrozenRequest:
-        if not self.has(wanted):
+        entry = self._get_fresh_entry(wanted)
+        if entry is None:
             raise LookupError("Request not in cache")
 
-        return [r for r in self._cache.keys() if r == wanted][0]
+        self._record_hit(entry, "hits")
+        return entry.request
 
-    def set(self, req: FrozenRequest) -> None:
-        cache_timeout = self.client.config["cache"]["timeout"]
-        valid_till = datetime.now() + timedelta(seconds=cache_timeout)
-        self._cache[req] = valid_till
+    def get_stale(self, wanted: FrozenRequest) -> Optional[FrozenRequest]:
+        """Expired entry which can be revalidated with a conditional request."""
+        entry = self.backend.get(wanted)
+        if entry is None or not entry.is_expired() or not self._can_revalidate(entry):
+            return None
+
+        return entry.request
+
+    def get_within_grace(self, wanted: FrozenRequest) -> Optional[FrozenRequest]:
+        """Expired entry which may still be served while it's being refreshed."""
+        entry = self.backend.get(wanted)
+        if entry is None or not entry.is_expired() or not self._within_grace(entry):
+            return None
+
+        self._record_hit(entry, "stale_hits")
+        return entry.request
+
+    def start_refresh(self, req: FrozenRequest) -> bool:
+        """Claim the background refresh of req; False if it's claimed already."""
+        with self._refresh_lock:
+            if req in self._refreshing:
+                return False
+
+            self._refreshing.add(req)
+            return True
+
+    def finish_refresh(self, req: FrozenRequest) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(req)
+
+    def set(
+        self,
+        req: FrozenRequest,
+        ttl: Optional[float] = None,
+        label: str = "",
+        latency: float = 0,
+    ) -> None:
+        if ttl is None:
+            ttl = self.client.config["cache"]["timeout"]
+
+        expires_at = time.time() + ttl
+        entry = CacheEntry(req, expires_at, _estimate_size(req), label, latency)
+
+        self.backend.set(entry)
+        self._sweep_if_due()
+
+    def get_ttl(self, path: Path) -> float:
+        """Seconds to keep the path's responses for.
+
+        Overrides from the cache.ttl setting (by path name, then by suite name)
+        take precedence over the path's own ttl; cache.timeout is the fallback.
+        """
+        config = self.client.config["cache"]
+        ttl: Union[int, float, str, None] = path.ttl
+
+        if path.name:
+            suite_name = path.name.partition(".")[0]
+            for key in (suite_name, path.name):
+                ttl = config["ttl"].get(key, ttl)
+
+        if ttl is None:
+            return config["timeout"]
+
+        if isinstance(ttl, str):
+            if ttl not in config["ttl_policies"]:
+                raise ClientError(f"unknown cache ttl policy: {ttl}")
+
+            return config["ttl_policies"][ttl]
+
+        return ttl
+
+    def invalidate(self, patterns: Iterable[Pattern[str]]) -> None:
+        """Drop the entries whose api path fully matches any of the patterns."""
+        patterns = list(patterns)
+        if patterns:
+            self.backend.delete_paths(lambda p: any(r.fullmatch(p) for r in patterns))
 
     def has(self, req: FrozenRequest) -> bool:
-        if req not in self._cache:
-            return False
+        return self._get_fresh_entry(req) is not None
+
+    def sweep(self) -> None:
+        """Drop expired entries which can't be revalidated (nor served stale)."""
+        config = self.client.config["cache"]
+
+        self._last_sweep = time.time()
+        self.backend.sweep(
+            expired_before=self._last_sweep - config["stale_while_revalidate"],
+            keep_revalidatable=config["revalidate"],
+        )
+
+    def get_parsed(self, req: FrozenRequest, structure: Any) -> Any:
+        """Result parsed earlier from req's response into the given structure."""
+        mode = self.client.config["cache"]["parsed_results"]
+        key = _get_structure_key(structure)
+
+        if mode == "off" or key not in req.parsed:
+            raise LookupError("Parsed result not in cache")
+
+        # "share" hands out the read-only cached result itself
+        parsed = req.parsed[key]
+        return deepcopy(parsed) if mode == "copy" else parsed
+
+    def set_parsed(
+        self, req: FrozenRequest, structure: Any, json: Any, parsed: Any
+    ) -> Any:
+        """Keep the parsed result; returns the one for the caller (read-only if
+        shared)."""
+        mode = self.client.config["cache"]["parsed_results"]
+        if mode == "off":
+            return parsed
+
+        if mode == "share":
+            parsed = read_only(parsed)
+
+        req.json = json
+        req.parsed[_get_structure_key(structure)] = (
+            deepcopy(parsed) if mode == "copy" else parsed
+        )
+        self._update_size(req)
 
-        valid_till = self._cache[req]
-        if datetime.now() > valid_till:
-            del self._cache[req]
+        return parsed
+
+    def _update_size(self, req: FrozenRequest) -> None:
+        # results parsed from a response stored earlier; those of a new one are
+        # counted when it's stored
+        entry = self.backend.get(req)
+        if entry is not None and entry.request is req:
+            self.backend.set(replace(entry, size=_estimate_size(req)))
+
+    def _get_fresh_entry(self, req: FrozenRequest) -> Optional[CacheEntry]:
+        entry = self.backend.get(req)
+        if entry is None:
+            return None
+
+        if entry.is_expired():
+            if not (self._can_revalidate(entry) or self._within_grace(entry)):
+                self.backend.delete(req)
+                self.stats.record(entry.label, "expirations")
+            return None
+
+        return entry
+
+    def _can_revalidate(self, entry: CacheEntry) -> bool:
+        if not self.client.config["cache"]["revalidate"]:
             return False
 
-        return True
+        return entry.has_validators()
+
+    def _record_hit(self, entry: CacheEntry, counter: str) -> None:
+        self.stats.record(entry.label, counter)
+        self.stats.record(entry.label, "time_saved", entry.latency)
+
+    def _record_change(self, event: str, label: str, size: int) -> None:
+        self.stats.record(label, "bytes_stored", size if event == "stored" else -size)
+
+        if event == "evicted":
+            self.stats.record(label, "evictions")
+        elif event == "expired":
+            self.stats.record(label, "expirations")
+
+    def _within_grace(self, entry: CacheEntry) -> bool:
+        if entry.is_negative():
+            return False  # it's refetched as soon as it expires
+
+        grace = self.client.config["cache"]["stale_while_revalidate"]
+        return time.time() <= entry.expires_at + grace
+
+    def _sweep_if_due(self) -> None:
+        # a full pass, but at most once per interval; amortized over the writes
+        interval = self.client.config["cache"]["sweep_interval"]
+        if time.time() - self._last_sweep >= interval:
+            self.sweep()
+
+
+def dump_response(response: Any) -> Tuple[int, Dict[str, str], bytes]:
+    """Status code, headers and body of a response, to store it outside memory."""
+    content = getattr(response, "content", None)
+    if not isinstance(content, bytes):
+        content = json.dumps(response.json()).encode()
+
+    return response.status_code, dict(response.headers), content
+
+
+def load_response(status_code: int, headers: Dict[str, str], body: bytes) -> Any:
+    from requests.structures import CaseInsensitiveDict
+
+    from trakt.core.components.http_component import BufferedResponse
+
+    return BufferedResponse(status_code, CaseInsensitiveDict(headers), body)
+
+
+def _dump_entry(entry: CacheEntry) -> Dict[str, Any]:
+    req = entry.request
+    status_code, headers, body = dump_response(req.response)
+
+    return {
+        "path": req.path,
+        "query_args": req.query_args,
+        "headers": req.headers,
+        "expires_at": entry.expires_at,
+        "label": entry.label,
+        "latency": entry.latency,
+        "response": [status_code, headers, body.decode("utf-8")],
+    }
+
+
+def _load_entry(data: Dict[str, Any]) -> CacheEntry:
+    status_code, headers, body = data["response"]
+    response = load_response(status_code, headers, body.encode("utf-8"))
+
+    req = FrozenRequest(data["path"], data["query_args"], data["headers"], response)
+    size = _estimate_size(req)
+    return CacheEntry(req, data["expires_at"], size, data["label"], data["latency"])
+
+
+def _get_structure_key(structure: Any) -> str:
+    return repr(structure)
+
+
+def _estimate_size(req: FrozenRequest) -> int:
+    """Response body size plus the key, and the json and parsed results kept
+    with it; an approximation of memory use."""
+    content = getattr(req.response, "content", None)
+    body_size = len(content) if isinstance(content, bytes) else 0
+
+    size = body_size + len(req._unique_id)
+    if req.parsed:
+        size += _estimate_tree_size([req.json, *req.parsed.values()])
+
+    return size
+
+
+def _estimate_tree_size(root: Any) -> int:
+    """sys.getsizeof() of the objects of a json / parsed result tree."""
+    size = 0
+    seen: Set[int] = set()
+    stack = [root]
+
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif is_dataclass(obj):
+            if hasattr(obj, "__dict__"):  # fields and the undeclared keys
+                stack.append(vars(obj))
+            else:  # slotted
+                stack.extend(getattr(obj, f.name) for f in fields(obj))
+
+    return size
 
 
 class FrozenRequest:
@@ -70,16 +594,45 @@ class FrozenRequest:
         self.headers = headers
         self.response = response
 
-    @property
-    def _unique_id(self) -> str:
+        # decoded json and parsed results (by response structure), kept only
+        # when the cache.parsed_results setting is on
+        self.json: Any = None
+        self.parsed: Dict[str, Any] = {}
+
+        # computed once; requests are compared on every cache lookup
+        self._unique_id = self._make_unique_id()
+        self._hash = hash(self._unique_id)
+
+    def _make_unique_id(self) -> str:
         qargs_repr = repr(sorted(self.query_args.items()))
         headers_repr = repr(sorted(self.headers.items()))
         return self.path + qargs_repr + headers_repr
 
+    def is_user_scoped(self) -> bool:
+        """Whether the request is made on behalf of a user (by the cache key)."""
+        return any(h in self.headers for h in USER_HEADERS)
+
+    def get_conditional_headers(self) -> Dict[str, str]:
+        """Headers asking the api to answer 304 if the response is still valid."""
+        if self.response is None:
+            return {}
+
+        headers = {}
+
+        etag = self.response.headers.get("ETag")
+        if etag:
+            headers["If-None-Match"] = etag
+
+        last_modified = self.response.headers.get("Last-Modified")
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        return headers
+
     def __hash__(self):
-        return hash(self._unique_id)
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, FrozenRequest):
-            return self._unique_id == other._unique_id
+            return self._hash == other._hash and self._unique_id == other._unique_id
         return False  # pragma: no cover
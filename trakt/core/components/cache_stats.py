@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, Dict, Optional
+
+__all__ = ("CacheStats", "MetricsHook")
+
+MetricsHook = Callable[[str, str, float], None]  # (label, counter, change)
+
+COUNTERS = (
+    "hits",
+    "misses",
+    "stale_hits",
+    "evictions",
+    "expirations",
+    "bytes_stored",
+    "time_saved",  # seconds; the latency of the fetches the hits replaced
+)
+
+
+class CacheStats:
+    """Cache counters per path, labeled "suite.method" (Path.label).
+
+    Counters are kept per process; with a SQLite cache shared by several
+    processes bytes_stored is only an approximation.
+    """
+
+    hook: Optional[MetricsHook]
+
+    def __init__(self, hook: Optional[MetricsHook] = None) -> None:
+        self.hook = hook
+        self._counters: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, label: str, counter: str, change: float = 1) -> None:
+        with self._lock:
+            counters = self._counters.get(label)
+            if counters is None:
+                counters = self._counters[label] = dict.fromkeys(COUNTERS, 0)
+
+            counters[counter] += change
+
+        if self.hook is not None:
+            self.hook(label, counter, change)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """{label: {counter: value}} of all paths which used the cache."""
+        with self._lock:
+            return {label: dict(c) for label, c in self._counters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters = {}
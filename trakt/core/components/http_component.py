@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import time
 import urllib.parse
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from functools import partial
+from http.cookiejar import DefaultCookiePolicy
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Optional, Tuple, Union
 
 import requests
-from trakt.core.components.cache import FrozenRequest
+from requests.adapters import HTTPAdapter
+from trakt.core.components.cache import USER_HEADERS, FrozenRequest
+from trakt.core.deadline import Deadline
 from trakt.core.exceptions import (
     BadRequest,
     Conflict,
@@ -21,10 +26,17 @@ from trakt.core.exceptions import (
     Unauthorized,
     UnprocessableEntity,
 )
+from trakt.core.rate_limiter import RateLimiter
+from trakt.core.retry import RetryPolicy
+from trakt.core.singleflight import SingleFlight
 
 if TYPE_CHECKING:  # pragma: no cover
     from trakt.api import TraktApi
 
+REQUEST_ERRORS = (requests.ConnectionError, requests.Timeout)
+# a request failing with less of the deadline left was cut short by it
+DEADLINE_SLACK = 0.05
+
 STATUS_CODE_MAPPING = {
     400: BadRequest,
     401: Unauthorized,
@@ -43,31 +55,146 @@ STATUS_CODE_MAPPING = {
     522: ServiceUnavailable,
 }
 
+Timeout = Union[float, Tuple[float, float], None]  # seconds or (connect, read)
+
+
+@dataclass
+class PendingRequest:
+    """A request to send (and retry); what the sync and async components share."""
+
+    method: str
+    path: str
+    url: str
+    query_args: Dict[str, str]
+    data: str
+    headers: Dict[str, str]
+    cache_headers: Dict[str, str]  # those of the cache key
+    retry_policy: RetryPolicy
+    timeout: Timeout
+    deadline: Optional[Deadline]
+    stale_req: Optional[FrozenRequest] = None  # expired, to revalidate
+
+    def get_headers(self) -> Dict[str, str]:
+        """Headers to send; conditional ones if it revalidates a response."""
+        if self.stale_req is None:
+            return self.headers
+
+        return {**self.headers, **self.stale_req.get_conditional_headers()}
+
+    def get_revalidated(self, status_code: int) -> Any:
+        """The stored response if the api says it's still valid (304), or None."""
+        if self.stale_req is not None and status_code == 304:
+            return self.stale_req.response  # the executor refreshes its ttl
 
-class DefaultHttpComponent:
+        return None
+
+
+class BaseHttpComponent:
     name = "http"
     client: TraktApi
-    _requests = requests
+    retry_policy: RetryPolicy
+    rate_limiter: Optional[RateLimiter]
     _last_response: Optional[FrozenRequest]
 
-    def __init__(self, client: TraktApi, requests_dependency: Any = None) -> None:
+    def __init__(self, client: TraktApi) -> None:
         self.client = client
-        self._requests = requests_dependency if requests_dependency else requests
+        self.retry_policy = RetryPolicy.from_config(client.config["http"])
+        self.rate_limiter = self._make_rate_limiter()
         self._last_response = None
 
-    def request(
+    def _make_rate_limiter(self) -> Optional[RateLimiter]:
+        config = self.client.config["rate_limit"]
+        return RateLimiter.from_config(config) if config["enabled"] else None
+
+    def _get_rate_limit_delay(self, pending: PendingRequest) -> float:
+        """Seconds to wait before sending; raises if it's past the deadline."""
+        if self.rate_limiter is None:
+            return 0
+
+        delay = self.rate_limiter.reserve(
+            pending.method, self.client.client_id, pending.headers.get("Authorization")
+        )
+        if delay and pending.deadline is not None:
+            pending.deadline.check(delay)
+
+        return delay
+
+    def _prepare(
         self,
         path: str,
-        *,
-        method: str = "GET",
-        query_args: Dict[str, str] = None,
-        data: Any = None,
-        headers: Optional[Dict[str, str]] = None,
-        no_raise: bool = False,
-        use_cache: bool = False,
-        **kwargs: Any,
+        method: str,
+        query_args: Optional[Dict[str, str]],
+        data: Any,
+        headers: Optional[Dict[str, str]],
+        user_scoped: bool,
+        retry_policy: Optional[RetryPolicy],
+        timeout: Timeout,
+        deadline: Union[Deadline, float, None],
+    ) -> PendingRequest:
+        url, query_args, data, headers = self._prepare_request(
+            path, query_args, data, headers
+        )
+
+        return PendingRequest(
+            method,
+            path,
+            url,
+            query_args,
+            data,
+            headers,
+            self._get_cache_headers(headers, user_scoped),
+            retry_policy or self.retry_policy,
+            timeout,
+            Deadline.coerce(deadline),
+        )
+
+    def _get_cached(
+        self, pending: PendingRequest, serve_stale: bool
+    ) -> Optional[ApiResponse]:
+        """The cached response; if it's expired but can be revalidated, it's
+        set as the pending request's stale_req."""
+        cached_response = self._get_cached_api_response(
+            pending.path, pending.query_args, pending.cache_headers, serve_stale
+        )
+        if cached_response is None:
+            pending.stale_req = self._get_stale_request(
+                pending.path, pending.query_args, pending.cache_headers
+            )
+
+        return cached_response
+
+    def _finish_request(
+        self,
+        pending: PendingRequest,
+        response: Any,
+        use_cache: bool,
+        no_raise: bool,
+        cache_label: str,
     ) -> ApiResponse:
+        if pending.stale_req is not None and response is pending.stale_req.response:
+            return self._make_revalidated_api_response(pending.stale_req)  # 304
+
+        if use_cache and not no_raise:
+            self._cache_not_found(
+                pending.method,
+                pending.path,
+                pending.query_args,
+                pending.cache_headers,
+                response,
+                cache_label,
+            )
+
+        return self._make_api_response(
+            pending.path, pending.query_args, pending.cache_headers, response, no_raise
+        )
 
+    def _prepare_request(
+        self,
+        path: str,
+        query_args: Optional[Dict[str, str]],
+        data: Any,
+        headers: Optional[Dict[str, str]],
+    ) -> Tuple[str, Dict[str, str], str, Dict[str, str]]:
         url = urllib.parse.urljoin(self.client.config["http"]["base_url"], path)
 
         query_args = query_args or {}
@@ -78,38 +205,198 @@ class DefaultHttpComponent:
             **(headers if headers is not None else self._get_headers()),
         }  # {} disables get_headers call
 
-        response = self._get_raw_response(
-            url, path, query_args, headers, method, data, use_cache
-        )
+        return url, query_args, data, headers
 
-        if not no_raise:
-            self._handle_code(response)
+    @staticmethod
+    def _get_cache_headers(
+        headers: Dict[str, str], user_scoped: bool
+    ) -> Dict[str, str]:
+        """Headers the cache key is made of.
+
+        Responses of endpoints which don't require authentication are the same
+        for every user, so they're cached once for all users.
+        """
+        if user_scoped:
+            return headers
+
+        return {k: v for k, v in headers.items() if k not in USER_HEADERS}
+
+    def _get_cached_request(
+        self, path: str, query_args: Dict[str, str], headers: Dict[str, str]
+    ) -> Optional[FrozenRequest]:
+        poss_cached_req = FrozenRequest(path, query_args, headers, response=None)
+        try:
+            return self.client.cache.get(poss_cached_req)
+        except LookupError:
+            return None
 
-        json_response = self._get_json(response, no_raise=no_raise)
+    def _get_cached_api_response(
+        self,
+        path: str,
+        query_args: Dict[str, str],
+        headers: Dict[str, str],
+        serve_stale: bool,
+    ) -> Optional[ApiResponse]:
+        cached_req = self._get_cached_request(path, query_args, headers)
+        if cached_req is not None:
+            return self._make_cached_api_response(cached_req)
+
+        if serve_stale:
+            poss_cached_req = FrozenRequest(path, query_args, headers, response=None)
+            stale_req = self.client.cache.get_within_grace(poss_cached_req)
+            if stale_req is not None:
+                return self._make_cached_api_response(stale_req, stale=True)
+
+        return None
+
+    def _make_cached_api_response(
+        self, cached_req: FrozenRequest, stale: bool = False
+    ) -> ApiResponse:
+        response = cached_req.response
+        self._handle_code(response)  # a remembered 404 raises like the original
 
-        self._last_response = FrozenRequest(path, query_args, headers, response)
+        json_response = cached_req.json
+        if json_response is None:  # only kept along with parsed results
+            json_response = self._get_json(response, no_raise=False)
+
+        self._last_response = cached_req
 
         return ApiResponse(
-            json_response, response, self._get_pagination_headers(response)
+            json_response,
+            response,
+            self._get_pagination_headers(response),
+            request=cached_req,
+            from_cache=True,
+            stale=stale,
+        )
+
+    def _make_revalidated_api_response(self, stale_req: FrozenRequest) -> ApiResponse:
+        """The stored response, still valid; with its json and parsed results.
+
+        It isn't from_cache: the executor stores it again, with a new ttl.
+        """
+        api_response = self._make_cached_api_response(stale_req)
+        api_response.from_cache = False
+        return api_response
+
+    def _get_timeouts(
+        self, timeout: Timeout, deadline: Optional[Deadline]
+    ) -> Tuple[float, float]:
+        """(connect, read) timeouts of a single request."""
+        if timeout is None:
+            config = self.client.config["http"]
+            timeout = (config["connect_timeout"], config["read_timeout"])
+
+        if isinstance(timeout, (tuple, list)):
+            connect, read = timeout
+        else:
+            connect = read = timeout
+
+        if deadline is not None:
+            deadline.check()
+            remaining = deadline.remaining()
+            connect, read = min(connect, remaining), min(read, remaining)
+
+        return connect, read
+
+    @staticmethod
+    def _get_retry_delay(
+        pending: PendingRequest, attempt: int, response: Any = None
+    ) -> Optional[float]:
+        """Seconds to wait before the next attempt; None to give up."""
+        retry_policy, deadline = pending.retry_policy, pending.deadline
+
+        status_code = None if response is None else response.status_code
+        if not retry_policy.should_retry(pending.method, attempt, status_code):
+            return None
+
+        delay = retry_policy.get_backoff(attempt, response)
+        if delay is None:
+            return None  # asked to wait longer than max_backoff
+        if deadline is not None and deadline.remaining() <= delay:
+            return None  # fail now rather than after sleeping past the deadline
+
+        return delay
+
+    def _get_error_retry_delay(
+        self, error: Exception, pending: PendingRequest, attempt: int
+    ) -> float:
+        """Seconds to wait before retrying a failed request; raises if it isn't."""
+        delay = self._get_retry_delay(pending, attempt)
+        if delay is not None:
+            return delay
+
+        deadline = pending.deadline
+        if deadline is not None and deadline.remaining() <= DEADLINE_SLACK:
+            raise deadline.exceeded() from error  # its timeout was the deadline's
+
+        raise error
+
+    def _get_flight_key(self, pending: PendingRequest) -> Optional[Hashable]:
+        """Concurrent GETs with the same key share a single api call.
+
+        Calls share it only with calls of the same timeout, so a timeout
+        error isn't handed to a call which set a longer one.
+        """
+        config = self.client.config["http"]
+        if pending.method.upper() != "GET" or not config["coalesce_gets"]:
+            return None
+
+        timeout = pending.timeout
+        if isinstance(timeout, list):
+            timeout = tuple(timeout)
+
+        request = FrozenRequest(
+            pending.path, pending.query_args, pending.headers, response=None
         )
+        return request, timeout
+
+    def _get_stale_request(
+        self, path: str, query_args: Dict[str, str], headers: Dict[str, str]
+    ) -> Optional[FrozenRequest]:
+        poss_cached_req = FrozenRequest(path, query_args, headers, response=None)
+        return self.client.cache.get_stale(poss_cached_req)
 
-    def _get_raw_response(
+    def _cache_not_found(
         self,
-        url: str,
+        method: str,
         path: str,
         query_args: Dict[str, str],
         headers: Dict[str, str],
-        method: str,
-        data: Any,
-        use_cache: bool,
-    ) -> Any:
-        if use_cache:
-            poss_cached_req = FrozenRequest(path, query_args, headers, response=None)
-            if self.client.cache.has(poss_cached_req):
-                return self.client.cache.get(poss_cached_req).response
+        response: Any,
+        label: str,
+    ) -> None:
+        """Remember a 404 for cache.not_found_ttl seconds (negative caching).
+
+        Only a definite "doesn't exist" is remembered; auth errors and
+        transient failures are not.
+        """
+        ttl = self.client.config["cache"]["not_found_ttl"]
+        if ttl and response.status_code == 404 and method.upper() == "GET":
+            req = FrozenRequest(path, query_args, headers, response)
+            self.client.cache.set(req, ttl=ttl, label=label)
+
+    def _make_api_response(
+        self,
+        path: str,
+        query_args: Dict[str, str],
+        headers: Dict[str, str],
+        response: Any,
+        no_raise: bool,
+    ) -> ApiResponse:
+        if not no_raise:
+            self._handle_code(response)
+
+        json_response = self._get_json(response, no_raise=no_raise)
+
+        frozen_request = FrozenRequest(path, query_args, headers, response)
+        self._last_response = frozen_request
 
-        return self._requests.request(
-            method, url, params=query_args, data=data, headers=headers
+        return ApiResponse(
+            json_response,
+            response,
+            self._get_pagination_headers(response),
+            request=frozen_request,
         )
 
     @staticmethod
@@ -171,11 +458,144 @@ class DefaultHttpComponent:
         return self._last_response
 
 
+class DefaultHttpComponent(BaseHttpComponent):
+    _requests: Any
+    _session: Optional[requests.Session]
+
+    def __init__(self, client: TraktApi, requests_dependency: Any = None) -> None:
+        super().__init__(client)
+        self._session = None if requests_dependency else self._make_session()
+        self._requests = requests_dependency if requests_dependency else self._session
+        self._flights = SingleFlight()
+
+    def _make_session(self) -> requests.Session:
+        config = self.client.config["http"]
+
+        adapter = HTTPAdapter(
+            pool_connections=config["pool_connections"],
+            pool_maxsize=config["pool_maxsize"],
+            pool_block=config["pool_block"],
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        # the api doesn't use cookies; rejecting them leaves the connection pool
+        # as the only state shared between threads using the session
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
+        if not config["keep_alive"]:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+
+    def request(
+        self,
+        path: str,
+        *,
+        method: str = "GET",
+        query_args: Optional[Dict[str, str]] = None,
+        data: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        no_raise: bool = False,
+        use_cache: bool = False,
+        serve_stale: bool = False,
+        user_scoped: bool = True,
+        cache_label: str = "",
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: Timeout = None,
+        deadline: Union[Deadline, float, None] = None,
+        **kwargs: Any,
+    ) -> ApiResponse:
+        pending = self._prepare(
+            path,
+            method,
+            query_args,
+            data,
+            headers,
+            user_scoped,
+            retry_policy,
+            timeout,
+            deadline,
+        )
+
+        if use_cache:
+            cached_response = self._get_cached(pending, serve_stale)
+            if cached_response is not None:
+                return cached_response
+
+        flight_key = self._get_flight_key(pending)
+        if flight_key is None:
+            response = self._get_response(pending)
+        else:
+            get_response = partial(self._get_response, pending)
+            response = self._flights.do(flight_key, get_response, pending.deadline)
+
+        return self._finish_request(pending, response, use_cache, no_raise, cache_label)
+
+    def _get_response(self, pending: PendingRequest) -> Any:
+        attempt = 0
+        delay: Optional[float]
+
+        while True:
+            try:
+                response = self._get_raw_response(pending)
+            except REQUEST_ERRORS as e:
+                delay = self._get_error_retry_delay(e, pending, attempt)
+            else:
+                delay = self._get_retry_delay(pending, attempt, response)
+                if delay is None:
+                    return response
+
+            self.sleep(delay)
+            attempt += 1
+
+    def sleep(self, t: float):  # pragma: no cover
+        return time.sleep(t)
+
+    def _get_raw_response(self, pending: PendingRequest) -> Any:
+        delay = self._get_rate_limit_delay(pending)
+        if delay:
+            self.sleep(delay)
+
+        response = self._requests.request(
+            pending.method,
+            pending.url,
+            params=pending.query_args,
+            data=pending.data,
+            headers=pending.get_headers(),
+            timeout=self._get_timeouts(pending.timeout, pending.deadline),
+        )
+
+        revalidated = pending.get_revalidated(response.status_code)
+        return response if revalidated is None else revalidated
+
+
+class BufferedResponse:
+    """Fully read response; mimics the parts of requests.Response we use."""
+
+    def __init__(self, status_code: int, headers: Any, content: bytes) -> None:
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+
 @dataclass
 class ApiResponse:
     json: Any
     original: Any
     pagination: Any
+    request: Optional[FrozenRequest] = field(default=None, repr=False)
+    from_cache: bool = field(default=False, repr=False)
+    stale: bool = field(default=False, repr=False)  # the caller refreshes it
     code: int = field(init=False)
     parsed: Any = field(init=False, default=None)
 
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import TYPE_CHECKING, NamedTuple, cast
+from typing import TYPE_CHECKING, Any, Dict, NamedTuple, cast
 
 from trakt.core.config import TraktCredentials
 from trakt.core.decorators import auth_required
 from trakt.core.exceptions import TraktTimeoutError
 
 if TYPE_CHECKING:  # pragma: no cover
-    from trakt.api import TraktApi
+    from trakt.api import AsyncTraktApi, TraktApi
 
 
 class CodeResponse(NamedTuple):
@@ -42,10 +43,63 @@ class DefaultOauthComponent:
         return self.client.http.get_url("oauth/authorize", query_args=quargs)
 
     def get_token(self, *, code: str, redirect_uri: str = "") -> TraktCredentials:
+        data = self._get_token_data(code, redirect_uri)
+        ret = self.client.http.request("oauth/token", method="POST", data=data).json
+
+        return self._set_user(ret)
+
+    @auth_required
+    def refresh_token(self, *, redirect_uri: str = "") -> TraktCredentials:
+        data = self._get_refresh_token_data(redirect_uri)
+        ret = self.client.http.request("oauth/token", method="POST", data=data).json
+
+        return self._set_user(ret)
+
+    @auth_required
+    def revoke_token(self) -> None:
+        data = self._get_revoke_token_data()
+
+        self.client.http.request("oauth/revoke", method="POST", data=data, headers={})
+        self.client.user = None
+
+    def get_verification_code(self) -> CodeResponse:
+        data = {"client_id": self.client.client_id}
+
+        ret = self.client.http.request(
+            "oauth/device/code", method="POST", data=data, headers={}
+        )
+
+        return CodeResponse(**ret.json)
+
+    def wait_for_verification(self, *, code: CodeResponse) -> TraktCredentials:
+        data = self._get_device_token_data(code)
+
+        elapsed_time: float = 0
+        while True:
+            ret = self.client.http.request(
+                "oauth/device/token",
+                method="POST",
+                data=data,
+                return_code=True,
+                headers={},
+                no_raise=True,
+            )
+            if ret.original.status_code == 200:
+                break
+
+            elapsed_time = self._check_code_expiry(code, elapsed_time)
+            self.sleep(code.interval + 0.3)
+
+        return self._set_user(ret.json)
+
+    def sleep(self, t: float):  # pragma: no cover
+        return time.sleep(t)
+
+    def _get_token_data(self, code: str, redirect_uri: str) -> Dict[str, str]:
         if not redirect_uri:
             redirect_uri = self.client.config["oauth"]["default_redirect_uri"]
 
-        data = {
+        return {
             "code": code,
             "client_id": self.client.client_id,
             "client_secret": self.client.client_secret,
@@ -53,23 +107,11 @@ class DefaultOauthComponent:
             "grant_type": "authorization_code",
         }
 
-        ret = self.client.http.request("oauth/token", method="POST", data=data).json
-
-        self.client.user = TraktCredentials(
-            access_token=ret["access_token"],
-            refresh_token=ret["refresh_token"],
-            scope=ret["scope"],
-            expires_at=(int(ret["created_at"]) + int(ret["expires_in"])),
-        )
-
-        return self.client.user
-
-    @auth_required
-    def refresh_token(self, *, redirect_uri: str = "") -> TraktCredentials:
+    def _get_refresh_token_data(self, redirect_uri: str) -> Dict[str, str]:
         if not redirect_uri:
             redirect_uri = self.client.config["oauth"]["default_redirect_uri"]
 
-        data = {
+        return {
             "refresh_token": cast(TraktCredentials, self.client.user).access_token,
             "client_id": self.client.client_id,
             "client_secret": self.client.client_secret,
@@ -77,8 +119,31 @@ class DefaultOauthComponent:
             "grant_type": "refresh_token",
         }
 
-        ret = self.client.http.request("oauth/token", method="POST", data=data).json
+    def _get_revoke_token_data(self) -> Dict[str, str]:
+        return {
+            "token": cast(TraktCredentials, self.client.user).access_token,
+            "client_id": self.client.client_id,
+            "client_secret": self.client.client_secret,
+        }
 
+    def _get_device_token_data(self, code: CodeResponse) -> Dict[str, str]:
+        return {
+            "code": code.device_code,
+            "client_id": self.client.client_id,
+            "client_secret": self.client.client_secret,
+        }
+
+    @staticmethod
+    def _check_code_expiry(code: CodeResponse, elapsed_time: float) -> float:
+        elapsed_time += code.interval + 0.3
+        if elapsed_time > code.expires_in:
+            raise TraktTimeoutError(
+                message="Code expired; start the verification process again"
+            )
+
+        return elapsed_time
+
+    def _set_user(self, ret: Dict[str, Any]) -> TraktCredentials:
         self.client.user = TraktCredentials(
             access_token=ret["access_token"],
             refresh_token=ret["refresh_token"],
@@ -88,62 +153,66 @@ class DefaultOauthComponent:
 
         return self.client.user
 
+
+class AsyncOauthComponent(DefaultOauthComponent):
+    client: AsyncTraktApi
+
+    async def get_token(  # type: ignore[override]
+        self, *, code: str, redirect_uri: str = ""
+    ) -> TraktCredentials:
+        data = self._get_token_data(code, redirect_uri)
+        ret = await self.client.http.request("oauth/token", method="POST", data=data)
+
+        return self._set_user(ret.json)
+
     @auth_required
-    def revoke_token(self) -> None:
-        data = {
-            "token": cast(TraktCredentials, self.client.user).access_token,
-            "client_id": self.client.client_id,
-            "client_secret": self.client.client_secret,
-        }
+    async def refresh_token(  # type: ignore[override]
+        self, *, redirect_uri: str = ""
+    ) -> TraktCredentials:
+        data = self._get_refresh_token_data(redirect_uri)
+        ret = await self.client.http.request("oauth/token", method="POST", data=data)
 
-        self.client.http.request("oauth/revoke", method="POST", data=data, headers={})
+        return self._set_user(ret.json)
+
+    @auth_required
+    async def revoke_token(self) -> None:  # type: ignore[override]
+        data = self._get_revoke_token_data()
+
+        await self.client.http.request(
+            "oauth/revoke", method="POST", data=data, headers={}
+        )
         self.client.user = None
 
-    def get_verification_code(self) -> CodeResponse:
+    async def get_verification_code(self) -> CodeResponse:  # type: ignore[override]
         data = {"client_id": self.client.client_id}
 
-        ret = self.client.http.request(
+        ret = await self.client.http.request(
             "oauth/device/code", method="POST", data=data, headers={}
         )
 
         return CodeResponse(**ret.json)
 
-    def wait_for_verification(self, *, code: CodeResponse) -> TraktCredentials:
-        data = {
-            "code": code.device_code,
-            "client_id": self.client.client_id,
-            "client_secret": self.client.client_secret,
-        }
+    async def wait_for_verification(  # type: ignore[override]
+        self, *, code: CodeResponse
+    ) -> TraktCredentials:
+        data = self._get_device_token_data(code)
 
         elapsed_time: float = 0
         while True:
-            ret = self.client.http.request(
+            ret = await self.client.http.request(
                 "oauth/device/token",
                 method="POST",
                 data=data,
-                return_code=True,
                 headers={},
                 no_raise=True,
             )
             if ret.original.status_code == 200:
                 break
 
-            elapsed_time += code.interval + 0.3
-            if elapsed_time > code.expires_in:
-                raise TraktTimeoutError(
-                    message="Code expired; start the verification process again"
-                )
-
-            self.sleep(code.interval + 0.3)
-
-        self.client.user = TraktCredentials(
-            access_token=ret.json["access_token"],
-            refresh_token=ret.json["refresh_token"],
-            scope=ret.json["scope"],
-            expires_at=(int(ret.json["created_at"]) + int(ret.json["expires_in"])),
-        )
+            elapsed_time = self._check_code_expiry(code, elapsed_time)
+            await self.sleep(code.interval + 0.3)
 
-        return self.client.user
+        return self._set_user(ret.json)
 
-    def sleep(self, t: float):  # pragma: no cover
-        return time.sleep(t)
+    async def sleep(self, t: float):  # type: ignore[override]  # pragma: no cover
+        return await asyncio.sleep(t)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from trakt.core.components.cache import (
+    CacheBackend,
+    CacheEntry,
+    FrozenRequest,
+    dump_response,
+    load_response,
+)
+
+__all__ = ("SQLiteCacheBackend",)
+
+SCHEMA_VERSION = 3
+LOCK_TIMEOUT = 30  # seconds to wait for other processes' locks
+
+SCHEMA = (
+    "DROP TABLE IF EXISTS entries",
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        key TEXT PRIMARY KEY,
+        path TEXT NOT NULL,
+        request TEXT,
+        label TEXT NOT NULL,
+        status INTEGER NOT NULL,
+        headers TEXT NOT NULL,
+        body BLOB NOT NULL,
+        expires_at REAL NOT NULL,
+        revalidatable INTEGER NOT NULL,
+        size INTEGER NOT NULL,
+        latency REAL NOT NULL,
+        stored_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_stored_at ON entries (stored_at)",
+    "CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at)",
+)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache kept in a SQLite file; survives restarts and can be shared
+    by several processes (WAL mode lets readers work alongside a writer).
+
+    Bodies are stored zlib-compressed; size limits apply to the compressed
+    bodies and evict the least recently stored entries first.
+    """
+
+    def __init__(self, path: str, max_entries: int = 0, max_bytes: int = 0) -> None:
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=LOCK_TIMEOUT, isolation_level=None, check_same_thread=False
+        )
+
+        with self._lock:
+            self._enable_wal()
+            self._migrate()
+
+    def get(self, key: FrozenRequest) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, expires_at, size, label, latency"
+                " FROM entries WHERE key = ?",
+                (_digest(key),),
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        status, headers, body, *entry_fields = row
+        response = load_response(status, json.loads(headers), zlib.decompress(body))
+        request = FrozenRequest(key.path, key.query_args, key.headers, response)
+
+        return CacheEntry(request, *entry_fields)
+
+    def entries(self) -> Iterator[CacheEntry]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT request, status, headers, body, expires_at, size, label,"
+                " latency FROM entries WHERE request IS NOT NULL"
+            ).fetchall()
+
+        for key, status, headers, body, *entry_fields in rows:
+            path, query_args, key_headers = json.loads(key)
+            response = load_response(status, json.loads(headers), zlib.decompress(body))
+            request = FrozenRequest(path, query_args, key_headers, response)
+
+            yield CacheEntry(request, *entry_fields)
+
+    def set(self, entry: CacheEntry) -> None:
+        req = entry.request
+        status, headers, body = dump_response(req.response)
+
+        # the key is kept only for public requests, so tokens aren't stored
+        request = None
+        if not req.is_user_scoped():
+            request = json.dumps([req.path, req.query_args, req.headers])
+
+        key = _digest(req)
+        body = zlib.compress(body)
+        row = (
+            key,
+            req.path,
+            request,
+            entry.label,
+            status,
+            json.dumps(headers),
+            body,
+            entry.expires_at,
+            entry.has_validators(),
+            len(body),
+            entry.latency,
+            time.time(),
+        )
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._delete("key = ?", (key,), "replaced")
+            self._conn.execute(
+                f"INSERT INTO entries VALUES ({', '.join('?' * len(row))})", row
+            )
+            self._notify("stored", entry.label, len(body))
+            self._evict()
+
+    def delete(self, key: FrozenRequest) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._delete("key = ?", (_digest(key),), "deleted")
+
+    def delete_paths(self, matches: Callable[[str], bool]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+
+            rows = self._conn.execute("SELECT DISTINCT path FROM entries")
+            paths = tuple(path for (path,) in rows if matches(path))
+            if paths:
+                placeholders = ", ".join("?" * len(paths))
+                self._delete(f"path IN ({placeholders})", paths, "deleted")
+
+    def sweep(self, expired_before: float, keep_revalidatable: bool) -> None:
+        condition = "expires_at < ?"
+        if keep_revalidatable:
+            condition += " AND NOT revalidatable"
+
+        with self._lock, self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._delete(condition, (expired_before,), "expired")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        with self._lock:
+            query = "SELECT COALESCE(SUM(size), 0) FROM entries"
+            return self._conn.execute(query).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _enable_wal(self) -> None:
+        # switching the journal mode doesn't wait for the busy timeout
+        give_up_at = time.monotonic() + LOCK_TIMEOUT
+        while True:
+            try:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                return
+            except sqlite3.OperationalError:
+                if time.monotonic() > give_up_at:
+                    raise
+                time.sleep(0.05)
+
+    def _migrate(self) -> None:
+        # it's a cache; entries stored by another version are dropped
+        if self._get_version() == SCHEMA_VERSION:
+            return
+
+        # other processes may be opening the file too; the one which gets
+        # the write lock first migrates it, the others see the new version
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            if self._get_version() != SCHEMA_VERSION:
+                for statement in SCHEMA:
+                    self._conn.execute(statement)
+                self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def _get_version(self) -> int:
+        return self._conn.execute("PRAGMA user_version").fetchone()[0]
+
+    def _evict(self) -> None:
+        if self.max_entries:
+            self._delete(
+                "key IN (SELECT key FROM entries"
+                " ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+                "evicted",
+            )
+
+        if self.max_bytes:
+            self._delete(
+                "key IN (SELECT key FROM ("
+                " SELECT key, SUM(size) OVER (ORDER BY stored_at DESC) AS total"
+                " FROM entries) WHERE total > ?)",
+                (self.max_bytes,),
+                "evicted",
+            )
+
+    def _delete(self, condition: str, params: Tuple[Any, ...], event: str) -> None:
+        # in a transaction; reports the removed entries as well
+        removed = self._conn.execute(
+            f"SELECT label, size FROM entries WHERE {condition}", params
+        ).fetchall()
+        self._conn.execute(f"DELETE FROM entries WHERE {condition}", params)
+
+        for label, size in removed:
+            self._notify(event, label, size)
+
+
+def _digest(req: FrozenRequest) -> str:
+    # the key contains the headers; don't write access tokens to disk
+    return hashlib.sha256(req._unique_id.encode()).hexdigest()
@@ -5,7 +5,7 @@ from typing import Any, Dict, Union
 __all__ = ("Config", "DefaultConfig", "TraktCredentials")
 
 
-ConfigEntryType = Union[int, str, Dict[str, Union[str, int]]]
+ConfigEntryType = Union[int, float, str, Dict[str, Any]]
 InternalConfigType = Dict[str, ConfigEntryType]
 
 
@@ -34,12 +34,58 @@ class Config:
 
 
 DEFAULT_CONFIG: InternalConfigType = {
-    "http": {"base_url": "https://api.trakt.tv", "max_retries": 3},
+    "http": {
+        "base_url": "https://api.trakt.tv",
+        "max_retries": 3,
+        "retry_backoff_factor": 0.5,
+        "retry_max_backoff": 30,
+        "retry_jitter": True,
+        "pool_connections": 10,
+        "pool_maxsize": 10,
+        "pool_block": False,
+        "keep_alive": True,
+        "connect_timeout": 5,
+        "read_timeout": 30,
+        "coalesce_gets": True,
+    },
     "oauth": {
         "default_redirect_uri": "urn:ietf:wg:oauth:2.0:oob",
         "refresh_token_s": 30 * 24 * 60 * 60,
     },
-    "cache": {"cache_level": "basic", "timeout": 60 * 60},
+    "cache": {
+        "cache_level": "basic",
+        "backend": "memory",  # or "sqlite"
+        "sqlite_path": "trakt-cache.sqlite",
+        "timeout": 60 * 60,  # for paths without a ttl
+        "ttl_policies": {
+            "static": 7 * 24 * 60 * 60,  # genres, countries, ...
+            "long": 24 * 60 * 60,  # summaries, people, translations, ...
+            "short": 5 * 60,  # trending, popular, ...
+        },
+        "ttl": {},  # overrides: {"shows": 600, "shows.get_trending": "short"}
+        "revalidate": True,
+        "stale_while_revalidate": 0,  # grace period in seconds; 0 = off
+        "not_found_ttl": 0,  # seconds to remember 404 responses for; 0 = off
+        "max_entries": 10000,
+        "max_bytes": 64 * 1024 * 1024,
+        "sweep_interval": 60,
+        "parsed_results": "off",  # or "share" (read-only results) / "copy"
+        "metrics_hook": None,  # called as hook(path label, counter, change)
+    },
+    "models": {"slots": False},  # parse into the slotted, smaller variants
+    "pagination": {
+        "max_workers": 4,
+        "lazy": False,  # parse items as they're yielded rather than by page
+    },
+    "batch": {"max_workers": 8},
+    "rate_limit": {
+        "enabled": False,
+        "get_limit": 1000,
+        "get_period": 5 * 60,
+        "post_limit": 1,
+        "post_period": 1,
+        "lock_dir": "",  # set to share the limits between processes
+    },
 }
 
 
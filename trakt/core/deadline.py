@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import time
+from typing import Optional, Union
+
+from trakt.core.exceptions import DeadlineExceeded
+
+__all__ = ("Deadline",)
+
+
+class Deadline:
+    """Time budget shared by all requests of an operation
+    (retries, pages of a paginated call, calls of a batch)."""
+
+    def __init__(self, timeout: float) -> None:
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    @classmethod
+    def coerce(cls, deadline: Union[Deadline, float, None]) -> Optional[Deadline]:
+        if deadline is None or isinstance(deadline, Deadline):
+            return deadline
+
+        return cls(deadline)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def check(self, wait: float = 0) -> None:
+        """Raise if the deadline passes before `wait` more seconds elapse."""
+        if self.remaining() <= wait:
+            raise self.exceeded()
+
+    def exceeded(self) -> DeadlineExceeded:
+        return DeadlineExceeded(message=f"deadline of {self.timeout}s exceeded")
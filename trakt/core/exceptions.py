@@ -92,3 +92,7 @@ class TraktResponseError(ClientError):
 
 class TraktTimeoutError(RequestRelatedError):
     message = "Pool timed out"
+
+
+class DeadlineExceeded(TraktTimeoutError):
+    message = "Deadline exceeded"
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import asyncio
 import itertools
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
     Dict,
+    Generic,
     Iterable,
     List,
     Optional,
+    Set,
     Tuple,
     TypeVar,
     Union,
@@ -18,18 +26,28 @@ from typing import (
 
 from trakt.core import json_parser
 from trakt.core.components.cache import FrozenRequest
-from trakt.core.components.http_component import ApiResponse
-from trakt.core.exceptions import ArgumentError, ClientError
+from trakt.core.components.http_component import ApiResponse, Timeout
+from trakt.core.deadline import Deadline
+from trakt.core.exceptions import ArgumentError, ClientError, TraktResponseError
+from trakt.core.models import slotted_structure
 
 if TYPE_CHECKING:  # pragma: no cover
-    from trakt.api import TraktApi
-    from trakt.core.paths.suite_interface import SuiteInterface
+    from trakt.api import AsyncTraktApi, TraktApi
     from trakt.core.paths.path import Path
+    from trakt.core.paths.suite_interface import SuiteInterface
 
 
 T = TypeVar("T")
 PER_PAGE_LIMIT = 100
 
+REFRESH_WORKERS = 4
+
+log = logging.getLogger(__name__)
+
+# cache refreshes; threads are started only when needed
+_refresh_pool = ThreadPoolExecutor(REFRESH_WORKERS, thread_name_prefix="trakt-refresh")
+_background_tasks: Set[asyncio.Future] = set()
+
 
 class Executor:
     params: List[str]
@@ -41,34 +59,40 @@ class Executor:
         self.client = client
         self.path_suites = []
 
+        if self._should_refresh_token():
+            self.client.oauth.refresh_token()
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f'Executor(params={".".join(self.params)})'
+
+    def _should_refresh_token(self) -> bool:
         if self.client.config["auto_refresh_token"] and self.client.user:
             expires_in = self.client.user.expires_at - int(time.time())
 
-            if expires_in < self.client.config["oauth"]["refresh_token_s"]:
-                self.client.oauth.refresh_token()
+            return expires_in < self.client.config["oauth"]["refresh_token_s"]
 
-    def __repr__(self) -> str:  # pragma: no cover
-        return f'Executor(params={".".join(self.params)})'
+        return False
 
     def install(self, suites: List[SuiteInterface]) -> None:
         self.path_suites.extend(suites)
 
-    def run(
-        self, *, path: Optional[Path] = None, **kwargs: Any
-    ) -> Union[ApiResponse, PaginationIterator[T]]:
+    def run(self, *, path: Optional[Path] = None, **kwargs: Any) -> Any:
         if not path:
             return self._delegate_to_interface(**kwargs)
 
+        # paths are shared between calls; bind the arguments to a private copy
+        path = copy(path)
         path.is_valid(self.client, **kwargs)  # raises
 
+        # started here, so it covers all pages of a paginated call
+        kwargs["deadline"] = Deadline.coerce(kwargs.get("deadline"))
+
         if path.pagination:
             return self._make_generator(path, **kwargs)
 
         return self.exec_path_call(path, **kwargs)
 
-    def _delegate_to_interface(
-        self, **kwargs
-    ) -> Union[ApiResponse, PaginationIterator[T]]:
+    def _delegate_to_interface(self, **kwargs) -> Any:
         matching_paths = self.find_matching_path()
 
         if len(matching_paths) != 1:
@@ -79,48 +103,224 @@ class Executor:
         return interface_handler(**kwargs)
 
     def exec_path_call(
-        self, path: Path, extra_quargs: Optional[Dict[str, str]] = None, **kwargs: Any
+        self,
+        path: Path,
+        extra_quargs: Optional[Dict[str, str]] = None,
+        parse: bool = True,
+        **kwargs: Any
     ) -> ApiResponse:
-        caching_enabled = self._should_use_cache(path, kwargs.get("no_cache", False))
+        api_path, request_kwargs = self._get_request_args(path, extra_quargs, kwargs)
+
+        started = time.perf_counter()
+        api_response = self.client.http.request(api_path, **request_kwargs)
+        latency = time.perf_counter() - started
 
+        return self._finish_call(
+            path, extra_quargs, kwargs, request_kwargs, api_response, latency, parse
+        )
+
+    def _get_request_args(
+        self, path: Path, extra_quargs: Optional[Dict[str, str]], kwargs: Dict[str, Any]
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Api path and the arguments of http.request() for a call."""
         api_path, query_args = path.get_path_and_qargs()
         query_args.update(extra_quargs or {})
-
-        api_response = self.client.http.request(
-            api_path,
-            method=path.method,
-            query_args=query_args,
-            data=kwargs.get("data"),
-            use_cache=caching_enabled,
+        kwargs.setdefault("serve_stale", True)  # background refreshes pass False
+
+        return api_path, {
+            "method": path.method,
+            "query_args": query_args,
+            "data": kwargs.get("data"),
+            "use_cache": self._should_use_cache(path, kwargs.get("no_cache", False)),
+            "user_scoped": path.requires_auth,
+            "cache_label": path.label,
+            "retry_policy": path.retry_policy,
             **kwargs,
-        )
+        }
+
+    def _finish_call(
+        self,
+        path: Path,
+        extra_quargs: Optional[Dict[str, str]],
+        kwargs: Dict[str, Any],
+        request_kwargs: Dict[str, Any],
+        api_response: ApiResponse,
+        latency: float,
+        parse: bool,
+    ) -> ApiResponse:
+        if api_response.stale:
+            self._refresh_in_background(path, extra_quargs, kwargs, api_response)
 
-        api_response.parsed = json_parser.parse_tree(
-            api_response.json, path.response_structure
+        return self._process_response(
+            path, api_response, request_kwargs["use_cache"], latency, parse
         )
 
-        if caching_enabled:
+    def _process_response(
+        self,
+        path: Path,
+        api_response: ApiResponse,
+        caching_enabled: bool,
+        latency: float = 0,
+        parse: bool = True,
+    ) -> ApiResponse:
+        """Parse the response and cache it; unparsed (json only) if not parse."""
+        if path.invalidates:
+            # the call succeeded (errors are raised earlier); drop what it changed
+            self.client.cache.invalidate(path.get_invalidated_patterns())
+
+        cache = self.client.cache
+        store = caching_enabled and not api_response.from_cache
+        if store:
+            cache.stats.record(path.label, "misses")
+
+        if parse:
+            structure = self._get_response_structure(path)
+            self._parse_response(api_response, structure, caching_enabled)
+
+        if store:
             # only runs if there were no errors
-            last_request = cast(FrozenRequest, self.client.http.last_request)
-            self.client.cache.set(last_request)
+            request = cast(FrozenRequest, api_response.request)
+            ttl = cache.get_ttl(path)
+            cache.set(request, ttl=ttl, label=path.label, latency=latency)
 
         return api_response
 
+    def _parse_response(
+        self, api_response: ApiResponse, structure: Any, caching_enabled: bool
+    ) -> None:
+        if not caching_enabled:
+            api_response.parsed = json_parser.parse_tree(api_response.json, structure)
+            return
+
+        cache = self.client.cache
+        request = cast(FrozenRequest, api_response.request)
+        try:
+            api_response.parsed = cache.get_parsed(request, structure)
+        except LookupError:
+            parsed = json_parser.parse_tree(api_response.json, structure)
+            api_response.parsed = cache.set_parsed(
+                request, structure, api_response.json, parsed
+            )
+
+    def _get_response_structure(self, path: Path) -> Any:
+        if self.client.config["models"]["slots"]:
+            return slotted_structure(path.response_structure)
+
+        return path.response_structure
+
+    def _refresh_in_background(
+        self,
+        path: Path,
+        extra_quargs: Optional[Dict[str, str]],
+        kwargs: Dict[str, Any],
+        stale_response: ApiResponse,
+    ) -> None:
+        request = cast(FrozenRequest, stale_response.request)
+        if not self.client.cache.start_refresh(request):
+            return  # one refresh per entry
+
+        # the caller got its response already; don't bind the refresh to its deadline
+        kwargs = {**kwargs, "serve_stale": False, "deadline": None}
+
+        refresh = self._start_refresh(path, extra_quargs, kwargs)
+        refresh.add_done_callback(partial(self._finish_refresh, path, request))
+
+    def _start_refresh(
+        self, path: Path, extra_quargs: Optional[Dict[str, str]], kwargs: Dict[str, Any]
+    ) -> Any:
+        """Future of the refresh call."""
+        return _refresh_pool.submit(self.exec_path_call, path, extra_quargs, **kwargs)
+
+    def _finish_refresh(self, path: Path, request: FrozenRequest, refresh: Any) -> None:
+        self.client.cache.finish_refresh(request)
+
+        error = None if refresh.cancelled() else refresh.exception()
+        if error is not None:
+            # the stale entry is served until its grace period ends
+            log.warning("refresh of %s failed", path.label, exc_info=error)
+
     def _should_use_cache(self, path: Path, no_cache: bool):
         return no_cache is False and self.client.cache.accepted_level(path.cache_level)
 
     def _make_generator(self, path: Path, **kwargs: Any):
+        return PaginationIterator(
+            self,
+            path,
+            *self._get_pagination_args(**kwargs),
+            readahead=kwargs.get("readahead", 0),
+            lazy=kwargs.get("lazy", self.client.config["pagination"]["lazy"]),
+            timeout=kwargs.get("timeout"),
+            deadline=kwargs.get("deadline"),
+        )
+
+    @staticmethod
+    def _get_pagination_args(**kwargs: Any) -> Tuple[int, int, int]:
         start_page = int(kwargs.get("page", 1))
         per_page = int(kwargs.get("per_page", 10))
         max_pages = 1 << 16
 
-        return PaginationIterator(self, path, start_page, per_page, max_pages)
+        return start_page, per_page, max_pages
 
     def find_matching_path(self) -> List[Tuple[Path, Callable]]:
         return [p for s in self.path_suites for p in s.find_matching(self.params)]
 
 
-class PaginationIterator(Iterable[T]):
+class AsyncExecutor(Executor):
+    client: AsyncTraktApi
+
+    def __init__(
+        self, client: AsyncTraktApi, params: Union[List[str], None] = None
+    ) -> None:
+        self.params = params or []
+        self.client = client
+        self.path_suites = []
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f'AsyncExecutor(params={".".join(self.params)})'
+
+    async def exec_path_call(  # type: ignore[override]
+        self,
+        path: Path,
+        extra_quargs: Optional[Dict[str, str]] = None,
+        parse: bool = True,
+        **kwargs: Any
+    ) -> ApiResponse:
+        if self._should_refresh_token():
+            await self.client.oauth.refresh_token()
+
+        api_path, request_kwargs = self._get_request_args(path, extra_quargs, kwargs)
+
+        started = time.perf_counter()
+        api_response = await self.client.http.request(api_path, **request_kwargs)
+        latency = time.perf_counter() - started
+
+        return self._finish_call(
+            path, extra_quargs, kwargs, request_kwargs, api_response, latency, parse
+        )
+
+    def _start_refresh(
+        self, path: Path, extra_quargs: Optional[Dict[str, str]], kwargs: Dict[str, Any]
+    ) -> Any:
+        task = asyncio.ensure_future(self.exec_path_call(path, extra_quargs, **kwargs))
+
+        # the event loop keeps only weak references to tasks
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+        return task
+
+    def _make_generator(self, path: Path, **kwargs: Any):
+        return AsyncPaginationIterator(
+            self,
+            path,
+            *self._get_pagination_args(**kwargs),
+            readahead=kwargs.get("readahead", 0),
+            lazy=kwargs.get("lazy", self.client.config["pagination"]["lazy"]),
+            timeout=kwargs.get("timeout"),
+            deadline=kwargs.get("deadline"),
+        )
+
+
+class BasePaginationIterator(Generic[T]):
     pages_total: Optional[int] = None
 
     def __init__(
@@ -130,20 +330,65 @@ class PaginationIterator(Iterable[T]):
         start_page: int,
         per_page: int,
         max_pages: int,
+        readahead: int = 0,
+        lazy: bool = False,
+        timeout: Timeout = None,
+        deadline: Optional[Deadline] = None,
     ) -> None:
+        # set first; __del__ calls close() even if __init__ raises
+        self._pending: Dict[int, Any] = {}  # page -> future/task fetching it
+        self._closed = False
+
+        if not isinstance(readahead, int) or readahead < 0:
+            raise ArgumentError(f"readahead={readahead} is invalid; must be >= 0")
+
         self._executor = executor
         self._path = path
         self._start_page = start_page
         self._per_page = per_page
         self._max_pages = max_pages
+        self._readahead = readahead
+
+        # lazy: pages are kept as json, items are parsed as they're yielded
+        structure = executor._get_response_structure(path)
+        self._lazy = lazy and isinstance(structure, list) and len(structure) == 1
+        self._decode_item: Optional[json_parser.Decoder] = None
+        if self._lazy:
+            self._decode_item = json_parser.get_decoder(structure[0])
+        self._request_kwargs: Dict[str, Any] = {
+            "timeout": timeout,
+            "deadline": deadline,
+            "parse": not self._lazy,
+        }
 
         self._exhausted = False
-        self._queue: List[T] = []
+        self._queue: List[Any] = []  # parsed items, or their json if lazy
         self._yielded_items = 0
 
-    def __iter__(self) -> PaginationIterator[T]:
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Cancel pages being read ahead; iteration continues without read-ahead."""
+        self._closed = True
+        self._cancel_pending()
+
+    def _cancel_pending(self) -> None:
+        for pending in self._pending.values():
+            pending.cancel()
+
+        self._pending = {}
+
+    def _get_readahead_pages(self) -> List[int]:
+        if self._closed:
+            return []
+
+        last_page = min(self._page + self._readahead, self._stop_at_page + 1)
+        return [p for p in range(self._page, last_page) if p not in self._pending]
+
+    def _start(self) -> None:
         if self._exhausted:
-            return self
+            return
 
         self._exhausted = True
         self._page = self._start_page
@@ -152,60 +397,69 @@ class PaginationIterator(Iterable[T]):
         self._queue = []
         self._yielded_items = 0
 
-        return self
+    def _pop(self) -> T:
+        self._yielded_items += 1
+        item = self._queue.pop(0)
 
-    def __next__(self) -> T:
-        if not self._queue:
-            if not self._has_next_page():
-                raise StopIteration()
+        if self._decode_item is None:
+            return item
 
-            self._fetch_next_page()
+        try:
+            return self._decode_item(item)
+        except Exception as e:  # the item is skipped, iteration can go on
+            raise TraktResponseError(errors=[e])
 
-        self._yielded_items += 1
-        return self._queue.pop(0)
+    def _get_page_quargs(self, page: int) -> Dict[str, str]:
+        return {"page": str(page), "limit": str(self._per_page)}
 
-    def _fetch_next_page(self, skip_first: int = 0) -> None:
-        response = self._executor.exec_path_call(
-            self._path,
-            return_extras=True,
-            extra_quargs={"page": str(self._page), "limit": str(self._per_page)},
-        )
+    def _get_remaining_pages(self) -> List[int]:
+        return list(range(self._page, self._stop_at_page + 1))
 
-        for r in response.parsed[skip_first:]:
+    def _get_max_workers(self, max_workers: Optional[int]) -> int:
+        if max_workers is None:
+            max_workers = self._executor.client.config["pagination"]["max_workers"]
+
+        if not isinstance(max_workers, int) or max_workers < 1:
+            raise ArgumentError(f"max_workers={max_workers} is invalid; must be >= 1")
+
+        return max_workers
+
+    def _store_page(self, response: ApiResponse, skip_first: int) -> None:
+        for r in self._get_page_items(response)[skip_first:]:
             self._queue.append(r)
 
         self._page += 1
         self._stop_at_page = int(response.pagination["page_count"])
         self.pages_total = self._stop_at_page
 
-    def prefetch_all(self) -> PaginationIterator[T]:
-        """Prefetch all results. Optimized."""
-        iterator = cast(PaginationIterator[T], iter(self))
+    def _get_page_items(self, response: ApiResponse) -> List[Any]:
+        if not self._lazy:
+            return response.parsed
 
-        if not self._has_next_page():
-            return iterator
+        if not response.json:  # None, [] or {}, like the parser does
+            return []
+        if not isinstance(response.json, list):
+            error = ValueError(f"expected a list of items, got {response.json!r}")
+            raise TraktResponseError(errors=[error])
+
+        return response.json
+
+    def _start_prefetch(self) -> Tuple[int, int]:
+        """Switch to the biggest pages; returns old per_page and items to skip."""
+        self._cancel_pending()  # pages read ahead have the old size
 
-        # tweak per_page setting to make fetching as fast as possible
         old_per_page = self._per_page
         self._per_page = PER_PAGE_LIMIT
 
         self._page = (self._yielded_items // PER_PAGE_LIMIT) + 1
         to_skip = (self._yielded_items % PER_PAGE_LIMIT) + len(self._queue)
 
-        self._fetch_next_page(skip_first=to_skip)
-
-        while self._has_next_page():
-            self._fetch_next_page()
-
-        self._per_page = old_per_page
-
-        return iterator
+        return old_per_page, to_skip
 
     def _has_next_page(self) -> bool:
         return self._page <= self._stop_at_page
 
-    def take(self, n: int = -1) -> List[T]:
-        """Take n next results. By default returns per_page results."""
+    def _validate_take(self, n: int) -> int:
         if n == -1:
             n = self._per_page
 
@@ -214,17 +468,197 @@ class PaginationIterator(Iterable[T]):
                 f"argument n={n} is invalid; n must be an int and n >= 1"
             )
 
+        return n
+
+    def has_next(self) -> bool:
+        """Check if there are any results left."""
+        if not self._exhausted:
+            self._start()
+
+        return bool(self._queue or self._has_next_page())
+
+
+class PaginationIterator(BasePaginationIterator[T], Iterable[T]):
+    _pool: Optional[ThreadPoolExecutor] = None
+
+    def __iter__(self) -> PaginationIterator[T]:
+        self._start()
+        return self
+
+    def __next__(self) -> T:
+        if not self._queue:
+            if not self._has_next_page():
+                raise StopIteration()
+
+            self._fetch_next_page()
+
+        return self._pop()
+
+    def _fetch_page(self, page: int) -> ApiResponse:
+        return self._executor.exec_path_call(
+            self._path,
+            return_extras=True,
+            extra_quargs=self._get_page_quargs(page),
+            **self._request_kwargs,
+        )
+
+    def _fetch_next_page(self, skip_first: int = 0) -> None:
+        pending = self._pending.pop(self._page, None)
+        response = pending.result() if pending else self._fetch_page(self._page)
+
+        self._store_page(response, skip_first)
+        self._read_ahead()
+
+    def _read_ahead(self) -> None:
+        for page in self._get_readahead_pages():
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self._readahead)
+
+            # the queued call must not reference self; otherwise the iterator
+            # couldn't be garbage collected (and its fetches cancelled) early
+            self._pending[page] = self._pool.submit(
+                self._executor.exec_path_call,
+                self._path,
+                return_extras=True,
+                extra_quargs=self._get_page_quargs(page),
+                **self._request_kwargs,
+            )
+
+    def close(self) -> None:
+        super().close()
+
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+
+    def prefetch_all(self, max_workers: Optional[int] = None) -> PaginationIterator[T]:
+        """Prefetch all results. Optimized.
+
+        The first page tells how many pages there are; the remaining ones
+        are fetched concurrently by up to max_workers threads.
+        """
+        iterator = iter(self)
+        max_workers = self._get_max_workers(max_workers)
+
+        if not self._has_next_page():
+            return iterator
+
+        # tweak per_page setting to make fetching as fast as possible
+        old_per_page, to_skip = self._start_prefetch()
+
+        self._store_page(self._fetch_page(self._page), to_skip)
+
+        remaining_pages = self._get_remaining_pages()
+        if remaining_pages:
+            with ThreadPoolExecutor(min(max_workers, len(remaining_pages))) as pool:
+                for response in pool.map(self._fetch_page, remaining_pages):
+                    self._store_page(response, 0)
+
+        self._per_page = old_per_page
+
+        return iterator
+
+    def take(self, n: int = -1) -> List[T]:
+        """Take n next results. By default returns per_page results."""
+        n = self._validate_take(n)
+
         it = iter(self)
         return list(itertools.islice(it, n))
 
-    def take_all(self) -> List[T]:
+    def take_all(self, max_workers: Optional[int] = None) -> List[T]:
         """Take all available results."""
-        self.prefetch_all()
+        self.prefetch_all(max_workers)
         return self.take(len(self._queue))
 
-    def has_next(self) -> bool:
-        """Check if there are any results left."""
-        if not self._exhausted:
-            iter(self)
 
-        return bool(self._queue or self._has_next_page())
+class AsyncPaginationIterator(BasePaginationIterator[T], AsyncIterator[T]):
+    _executor: AsyncExecutor
+
+    def __aiter__(self) -> AsyncPaginationIterator[T]:
+        self._start()
+        return self
+
+    async def __anext__(self) -> T:
+        if not self._queue:
+            if not self._has_next_page():
+                raise StopAsyncIteration()
+
+            await self._fetch_next_page()
+
+        return self._pop()
+
+    async def _fetch_page(self, page: int) -> ApiResponse:
+        return await self._executor.exec_path_call(
+            self._path,
+            return_extras=True,
+            extra_quargs=self._get_page_quargs(page),
+            **self._request_kwargs,
+        )
+
+    async def _fetch_next_page(self, skip_first: int = 0) -> None:
+        pending = self._pending.pop(self._page, None)
+        response = await (pending if pending else self._fetch_page(self._page))
+
+        self._store_page(response, skip_first)
+        self._read_ahead()
+
+    def _read_ahead(self) -> None:
+        for page in self._get_readahead_pages():
+            # the task must not reference self, see PaginationIterator._read_ahead
+            self._pending[page] = asyncio.ensure_future(
+                self._executor.exec_path_call(
+                    self._path,
+                    return_extras=True,
+                    extra_quargs=self._get_page_quargs(page),
+                    **self._request_kwargs,
+                )
+            )
+
+    async def prefetch_all(
+        self, max_workers: Optional[int] = None
+    ) -> AsyncPaginationIterator[T]:
+        """Prefetch all results. Optimized.
+
+        The first page tells how many pages there are; up to max_workers
+        of the remaining ones are fetched at a time.
+        """
+        iterator = self.__aiter__()
+        semaphore = asyncio.Semaphore(self._get_max_workers(max_workers))
+
+        if not self._has_next_page():
+            return iterator
+
+        # tweak per_page setting to make fetching as fast as possible
+        old_per_page, to_skip = self._start_prefetch()
+
+        self._store_page(await self._fetch_page(self._page), to_skip)
+
+        async def fetch(page: int) -> ApiResponse:
+            async with semaphore:
+                return await self._fetch_page(page)
+
+        remaining_pages = self._get_remaining_pages()
+        for response in await asyncio.gather(*map(fetch, remaining_pages)):
+            self._store_page(response, 0)
+
+        self._per_page = old_per_page
+
+        return iterator
+
+    async def take(self, n: int = -1) -> List[T]:
+        """Take n next results. By default returns per_page results."""
+        n = self._validate_take(n)
+
+        it = self.__aiter__()
+        items: List[T] = []
+        while len(items) < n:
+            try:
+                items.append(await it.__anext__())
+            except StopAsyncIteration:
+                break
+
+        return items
+
+    async def take_all(self, max_workers: Optional[int] = None) -> List[T]:
+        """Take all available results."""
+        await self.prefetch_all(max_workers)
+        return await self.take(len(self._queue))
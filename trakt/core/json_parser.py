@@ -1,84 +1,139 @@
-from typing import Any, Dict, List
+import threading
+from dataclasses import MISSING, fields, is_dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Tuple, Union, cast, get_type_hints
 
 import jsons  # type: ignore
 from trakt.core.exceptions import TraktResponseError
 
 TYPE_TYPE = int.__class__
 ITERABLES = {list, dict}
+NONE_TYPE = type(None)
+PRIMITIVES = {int, float, str, bool}
 
 GLOBAL_NAME_MAPPING = {"costume & make-up": "costume_make_up"}
 
+Decoder = Callable[[Any], Any]
+
+_decoders: Dict[str, Decoder] = {}  # by structure, see get_decoder
+_type_decoders: Dict[Any, Decoder] = {}
+# compiling registers dataclass decoders before their fields are compiled; it
+# recurses, so the lock is re-entrant
+_compile_lock = threading.RLock()
+
 
 def parse_tree(data: Any, tree_structure: Any) -> Any:
     try:
-        data = _apply_name_mapping(data)
-        data = _substitute_none_val(data)
-        return _parse_tree(data, tree_structure)
+        return get_decoder(tree_structure)(data)
     except Exception as e:
         raise TraktResponseError(errors=[e])
 
 
-def _apply_name_mapping(data: Any):
-    if isinstance(data, list):
-        data = [_apply_name_mapping(v) for v in data]
-    if isinstance(data, dict):
-        data = {
-            GLOBAL_NAME_MAPPING.get(k, k): _apply_name_mapping(v)
-            for k, v in data.items()
-        }
+def get_decoder(tree_structure: Any) -> Decoder:
+    """Function parsing responses into the given structure.
 
-    return data
+    It's compiled on first use and cached per structure; types are inspected
+    once rather than for every parsed object.
+    """
+    key = repr(tree_structure)  # structures are nested lists and dicts
+    decoder = _decoders.get(key)
+    if decoder is None:
+        with _compile_lock:
+            decoder = _decoders.get(key)
+            if decoder is None:
+                decoder = _decoders[key] = _compile_tree(tree_structure)
 
+    return decoder
 
-def _substitute_none_val(data: Any):
-    """Trakt represents null-value as {}. Change it to None."""
-    if data == {}:
-        return None
 
-    if isinstance(data, list):
-        data = [_substitute_none_val(v) for v in data]
+def _normalize(data: Any) -> Any:
+    """Apply the name mapping; Trakt represents null-value as {}, change it to None.
+
+    The decoders do it on the fly; only values handed over as they are
+    (as Any, or to jsons) are normalized here.
+    """
     if isinstance(data, dict):
-        data = {k: _substitute_none_val(v) for k, v in data.items()}
+        if not data:
+            return None
+
+        return {GLOBAL_NAME_MAPPING.get(k, k): _normalize(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_normalize(v) for v in data]
 
     return data
 
 
-def _parse_tree(data: Any, tree_structure: Any) -> Any:
-    level_type = tree_structure.__class__
+def _is_null(data: Any) -> bool:
+    return data is None or (data.__class__ is dict and not data)
+
 
-    if level_type not in ITERABLES:
-        return jsons.load(data, tree_structure)
+def _compile_tree(tree_structure: Any) -> Decoder:
+    level_type = tree_structure.__class__
 
     if level_type == list:
-        return _parse_list(data, tree_structure)
+        return _compile_list(tree_structure)
 
     if level_type == dict:
-        return _parse_dict(data, tree_structure)
+        return _compile_dict(tree_structure)
+
+    return _compile_type(tree_structure)
 
 
 def _is_arbitrary_value(x: Any) -> bool:
     return x.__class__ not in (ITERABLES | {type})
 
 
-def _parse_list(data: List[Any], tree_structure: List[Any]) -> List[Any]:
+def _compile_list(tree_structure: List[Any]) -> Decoder:
     if not tree_structure:
-        return tree_structure
+        return lambda data: tree_structure
 
     single_item_type = tree_structure[0]
     if single_item_type is Any:
-        return data
-    if data is None or not data:
-        return []
+        return _normalize
+
+    decode_item = _compile_tree(single_item_type)
 
-    return [_parse_tree(e, single_item_type) for e in data]
+    def decode_list(data: Any) -> List[Any]:
+        if not data:  # None, [] or {}
+            return []
 
+        return [decode_item(e) for e in data]
 
-def _parse_dict(data: Dict[Any, Any], tree_structure: Dict[Any, Any]) -> Dict[Any, Any]:
+    return decode_list
+
+
+def _compile_dict(tree_structure: Dict[Any, Any]) -> Decoder:
     if not tree_structure:
-        return tree_structure
+        return lambda data: tree_structure
+
+    wildcards, defaults, subtrees = _split_dict_structure(tree_structure)
+
+    def decode_dict(data: Any) -> Dict[Any, Any]:
+        if _is_null(data):
+            raise ValueError("null value for a non-empty structure")
+
+        result = {}
+        for k, v in data.items():
+            k = GLOBAL_NAME_MAPPING.get(k, k)
+
+            decode = subtrees.get(k) or wildcards.get(k.__class__)
+            if decode is not None:
+                result[k] = decode(v)
+
+        # set defaults if any keys are missing
+        result.update({k: v for k, v in defaults.items() if k not in result})
+        return result
+
+    return decode_dict
+
 
+def _split_dict_structure(
+    tree_structure: Dict[Any, Any]
+) -> Tuple[Dict[type, Decoder], Dict[Any, Any], Dict[Any, Decoder]]:
     wildcards = {  # eg {str: str} / {str: Any}
-        k: v for k, v in tree_structure.items() if isinstance(k, type)
+        k: _normalize if v is Any else _compile_tree(v)
+        for k, v in tree_structure.items()
+        if isinstance(k, type)
     }
 
     defaults = {  # eg {value: value}
@@ -87,29 +142,232 @@ def _parse_dict(data: Dict[Any, Any], tree_structure: Dict[Any, Any]) -> Dict[An
         if (k not in wildcards) and _is_arbitrary_value(v)
     }
 
-    result = __parse_dict_items(data, tree_structure, wildcards)
+    # a default value stands for a subtree of its type
+    subtrees = {
+        k: _compile_tree(v.__class__ if _is_arbitrary_value(v) else v)
+        for k, v in tree_structure.items()
+        if k not in wildcards
+    }
+
+    return wildcards, defaults, subtrees
+
+
+def _compile_type(tp: Any) -> Decoder:
+    decoder = _type_decoders.get(tp)
+    if decoder is None:
+        # dataclasses register themselves before compiling their fields
+        decoder = _type_decoders[tp] = _make_type_decoder(tp)
+
+    return decoder
+
+
+def _make_type_decoder(tp: Any) -> Decoder:
+    if tp in PRIMITIVES:
+        return _make_primitive_decoder(tp)
+    if tp in SIMPLE_DECODERS:
+        return SIMPLE_DECODERS[tp]
+    if is_dataclass(tp):
+        return _compile_dataclass(cast(type, tp))
+
+    return _compile_generic(tp)
+
+
+def _compile_generic(tp: Any) -> Decoder:
+    origin = getattr(tp, "__origin__", None)
+    args: Tuple[Any, ...] = getattr(tp, "__args__", None) or ()
+
+    if origin is Union:
+        return _compile_union(tp, args)
+    if origin in (list, List) and args:
+        return _compile_list_type(args[0])
+    if origin in (dict, Dict) and len(args) == 2:
+        return _compile_dict_type(args[1])
+
+    return lambda data: jsons.load(_normalize(data), tp)
+
+
+def _decode_none(data: Any) -> None:
+    if not _is_null(data):
+        raise ValueError(f"expected null, got {data!r}")
+
+
+def _make_primitive_decoder(tp: type) -> Decoder:
+    def decode_primitive(data: Any) -> Any:
+        if data.__class__ is tp:
+            return data
+
+        data = _normalize(data)
+        if data is None:
+            raise ValueError(f"null value for {tp.__name__}")
+
+        return data if isinstance(data, tp) else tp(data)
+
+    return decode_primitive
+
+
+def _decode_datetime(data: Any) -> datetime:
+    # the api's format, "2014-08-22T08:32:06.000Z"; anything else goes to jsons
+    if data.__class__ is str and data[-1:] == "Z" and data[10:11] == "T":
+        try:
+            return datetime.fromisoformat(data[:-1]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+
+    return jsons.load(_normalize(data), datetime)
+
+
+def _decode_date(data: Any) -> date:
+    return date.fromisoformat(data)
+
+
+SIMPLE_DECODERS: Dict[Any, Decoder] = {
+    Any: _normalize,
+    NONE_TYPE: _decode_none,
+    datetime: _decode_datetime,
+    date: _decode_date,
+}
+
+
+def _compile_union(tp: Any, args: Tuple[Any, ...]) -> Decoder:
+    if len(args) == 2 and NONE_TYPE in args:
+        value_type = args[0] if args[1] is NONE_TYPE else args[1]
+        return _compile_optional(tp, value_type)
+
+    decoders = [_compile_type(a) for a in args]
+
+    def decode_union(data: Any) -> Any:
+        if _is_null(data):  # jsons doesn't check null values against the types
+            return None
+
+        for decode in decoders:  # the first type that matches
+            try:
+                return decode(data)
+            except Exception:
+                pass
+
+        return jsons.load(_normalize(data), tp)
+
+    return decode_union
+
+
+def _compile_optional(tp: Any, value_type: Any) -> Decoder:
+    decode_value = _compile_type(value_type)
+
+    def decode_optional(data: Any) -> Any:
+        if _is_null(data):
+            return None
+
+        try:
+            return decode_value(data)
+        except Exception:
+            # jsons may still take it, eg a date-only string for a datetime
+            # is kept as it is; the output stays the same as jsons'
+            return jsons.load(_normalize(data), tp)
+
+    return decode_optional
+
+
+def _compile_list_type(item_type: Any) -> Decoder:
+    decode_item = _compile_type(item_type)
+
+    def decode_list(data: Any) -> List[Any]:
+        if _is_null(data):
+            raise ValueError("null value for a list")
+
+        return [decode_item(e) for e in data]
+
+    return decode_list
+
+
+def _compile_dict_type(value_type: Any) -> Decoder:
+    decode_value = _compile_type(value_type)
+
+    def decode_dict(data: Any) -> Dict[Any, Any]:
+        if _is_null(data):
+            raise ValueError("null value for a dict")
+
+        return {GLOBAL_NAME_MAPPING.get(k, k): decode_value(v) for k, v in data.items()}
+
+    return decode_dict
+
+
+def _compile_dataclass(cls: type) -> Decoder:
+    field_decoders: Dict[str, Decoder] = {}
+    required: List[Tuple[str, bool]] = []  # (name, may be null)
+
+    def decode_dataclass(data: Any) -> Any:
+        if data.__class__ is not dict or not data:
+            return _as_instance(data, cls)
+
+        kwargs: Dict[str, Any] = {}
+        extra: Dict[str, Any] = {}
+        k: str
+        for k, v in data.items():
+            k = GLOBAL_NAME_MAPPING.get(k, k)
+
+            decode = field_decoders.get(k)
+            if decode is None:
+                extra[k] = v
+            else:
+                kwargs[k] = decode(v)
+
+        _fill_required(kwargs, required)
+        return _set_extra(cls(**kwargs), extra)
+
+    _type_decoders[cls] = decode_dataclass  # the fields may refer to cls
+    try:
+        _compile_fields(cls, field_decoders, required)
+    except Exception:
+        del _type_decoders[cls]
+        raise
+
+    return decode_dataclass
+
+
+def _compile_fields(
+    cls: type, field_decoders: Dict[str, Decoder], required: List[Tuple[str, bool]]
+) -> None:
+    # resolved like jsons does, from __init__; the class may have annotations
+    # of attributes which aren't fields
+    hints = get_type_hints(cls.__init__)  # type: ignore
+
+    for f in fields(cls):
+        if not f.init:
+            continue
+
+        field_decoders[f.name] = _compile_type(hints[f.name])
+        if f.default is MISSING and f.default_factory is MISSING:  # type: ignore
+            required.append((f.name, _is_nullable(hints[f.name])))
+
+
+def _as_instance(data: Any, cls: type) -> Any:
+    if isinstance(data, cls):
+        return data
+
+    raise ValueError(f"can't decode {data!r} into {cls.__name__}")
+
+
+def _fill_required(kwargs: Dict[str, Any], required: List[Tuple[str, bool]]) -> None:
+    for name, nullable in required:
+        if name not in kwargs:
+            if not nullable:
+                raise ValueError(f'No value found for "{name}"')
+            kwargs[name] = None
 
-    # set defaults if any keys are missing
-    for k, v in defaults.items():
-        if k not in result:
-            result[k] = v
 
-    return result
+def _set_extra(instance: Any, extra: Dict[str, Any]) -> Any:
+    # keys the class doesn't declare are kept as attributes, like jsons does
+    for k, v in extra.items():
+        try:
+            setattr(instance, k, _normalize(v))
+        except AttributeError:  # a property
+            pass
 
+    return instance
 
-def __parse_dict_items(
-    data: Dict[Any, Any], tree_structure: Dict[Any, Any], wildcards: Dict[type, Any]
-):
-    result = {}
-    for k, v in data.items():
-        if k in tree_structure:
-            # v may be a default value -> use its type as subtree type
-            subtree = tree_structure[k]
-            subtree = subtree.__class__ if _is_arbitrary_value(subtree) else subtree
 
-            result[k] = _parse_tree(v, subtree)
-        elif k.__class__ in wildcards:
-            wildcard = wildcards[k.__class__]
-            result[k] = v if wildcard is Any else _parse_tree(v, wildcard)
+def _is_nullable(tp: Any) -> bool:
+    if tp is Any or tp is NONE_TYPE:
+        return True
 
-    return result
+    return getattr(tp, "__origin__", None) is Union and NONE_TYPE in tp.__args__
@@ -1,6 +1,27 @@
-from dataclasses import asdict, dataclass
+from copy import deepcopy
+from dataclasses import (
+    FrozenInstanceError,
+    asdict,
+    dataclass,
+    field,
+    fields,
+    is_dataclass,
+    make_dataclass,
+)
 from datetime import date, datetime
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_type_hints,
+)
 
 import jsons  # type: ignore
 
@@ -20,7 +41,12 @@ jsons.set_deserializer(any_deserializer, Any)
 jsons.set_deserializer(date_deserializer, date)
 
 
+T = TypeVar("T")
+
+
 class AbstractBaseModel:
+    __slots__ = ()  # so the slotted variants have no __dict__
+
     _client: "TraktApi"
 
     @classmethod
@@ -131,7 +157,7 @@ class Episode(AbstractBaseModel):
 
 @dataclass
 class Movie(AbstractBaseModel):
-    title: int
+    title: str
     year: int
     ids: IDs
 
@@ -194,3 +220,241 @@ class Comment:
     likes: int
     user_rating: Optional[int]
     user: User
+
+
+_slotted: Dict[type, type] = {}
+_slotted_structures: Dict[str, Any] = {}
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Variant of a model / response struct dataclass using __slots__.
+
+    Same fields, to_dict() and client; instances take less memory but have
+    no __dict__, so keys the class doesn't declare aren't kept. Nested
+    models are slotted as well. The variant isn't a subclass of cls, check
+    instances with is_instance().
+    """
+    if "_slotted_from" in vars(cls):
+        return cls
+
+    variant = _slotted.get(cls)
+    if variant is None:
+        variant = _slotted[cls] = _make_slotted(cls)
+
+    return variant
+
+
+def slotted_structure(tree_structure: Any) -> Any:
+    """Response structure with the dataclasses replaced by their slotted variants."""
+    key = repr(tree_structure)
+    structure = _slotted_structures.get(key)
+    if structure is None:
+        structure = _slotted_structures[key] = _slot_tree(tree_structure)
+
+    return structure
+
+
+def is_instance(obj: Any, classes: Union[type, Tuple[type, ...]]) -> bool:
+    """isinstance() accepting the slotted variants of the classes as well."""
+    origin = getattr(obj.__class__, "_slotted_from", None)
+    return isinstance(obj, classes) or (
+        origin is not None and issubclass(origin, classes)
+    )
+
+
+def _slot_tree(tree_structure: Any) -> Any:
+    if isinstance(tree_structure, list):
+        return [_slot_tree(v) for v in tree_structure]
+    if isinstance(tree_structure, dict):
+        return {k: _slot_tree(v) for k, v in tree_structure.items()}
+
+    return _slot_type(tree_structure)
+
+
+def _slot_type(tp: Any) -> Any:
+    if isinstance(tp, type) and is_dataclass(tp):
+        return slotted(tp)
+
+    args = getattr(tp, "__args__", None)
+    if args and hasattr(tp, "copy_with"):  # Optional[...], List[...], ...
+        slotted_args = tuple(_slot_type(a) for a in args)
+        if slotted_args != args:
+            return tp.copy_with(slotted_args)
+
+    return tp
+
+
+def _make_slotted(cls: type) -> type:
+    hints = get_type_hints(cls.__init__)  # type: ignore
+    names = tuple(f.name for f in fields(cls))
+    name = f"Slotted{cls.__name__}"  # distinct repr, the parsers' caches use it
+
+    namespace = {  # methods and properties
+        k: v for k, v in vars(cls).items() if not k.startswith("__") and k not in names
+    }
+    bases = (AbstractBaseModel,) if issubclass(cls, AbstractBaseModel) else ()
+    variant = make_dataclass(
+        name,
+        [(f.name, _slot_type(hints[f.name]), _copy_field(f)) for f in fields(cls)],
+        bases=bases,
+        namespace=namespace,
+    )
+
+    # recreated with __slots__, like dataclass(slots=True) does on 3.10+
+    cls_dict = {
+        k: v
+        for k, v in vars(variant).items()
+        if k not in names and k not in ("__dict__", "__weakref__")
+    }
+    cls_dict.update(
+        __slots__=names,
+        __module__=cls.__module__,
+        __qualname__=name,
+        __reduce__=_reduce_slotted,
+        _slotted_from=cls,
+    )
+    return type(name, bases, cls_dict)
+
+
+def _reduce_slotted(obj: Any) -> Any:
+    # the variant isn't reachable by its name, pickle it through slotted()
+    cls = obj.__class__
+    return _unpickle_slotted, (
+        cls._slotted_from,
+        [getattr(obj, n) for n in cls.__slots__],
+    )
+
+
+def _unpickle_slotted(origin: type, values: List[Any]) -> Any:
+    cls: Any = slotted(origin)
+    obj = cls.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(obj, name, value)
+
+    return obj
+
+
+def _copy_field(f: Any) -> Any:
+    return field(  # type: ignore
+        default=f.default,
+        default_factory=f.default_factory,
+        init=f.init,
+        repr=f.repr,
+        hash=f.hash,
+        compare=f.compare,
+        metadata=f.metadata,
+    )
+
+
+class ReadOnlyList(list):
+    """List of a read-only result; copies (copy.deepcopy, pickle) are plain lists."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("read-only result; use copy.deepcopy() to modify it")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _read_only
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only  # type: ignore
+
+    def __reduce__(self) -> Any:
+        return list, (list(self),)
+
+
+class ReadOnlyDict(dict):
+    """Dict of a read-only result; copies (copy.deepcopy, pickle) are plain dicts."""
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("read-only result; use copy.deepcopy() to modify it")
+
+    pop = popitem = clear = update = setdefault = _read_only  # type: ignore
+    __setitem__ = __delitem__ = _read_only  # type: ignore
+
+    def __reduce__(self) -> Any:
+        return dict, (dict(self),)
+
+
+_read_only: Dict[type, type] = {}
+
+
+def read_only(result: Any) -> Any:
+    """Parsed result which can be handed to many callers; modifying it raises.
+
+    Lists and dicts are replaced with ReadOnlyList / ReadOnlyDict, model
+    instances are switched, in place, to a read-only subclass of their class.
+    copy.deepcopy() of the result gives regular, modifiable objects.
+    """
+    if isinstance(result, list) and not isinstance(result, ReadOnlyList):
+        return ReadOnlyList(read_only(v) for v in result)
+    if isinstance(result, dict) and not isinstance(result, ReadOnlyDict):
+        return ReadOnlyDict((k, read_only(v)) for k, v in result.items())
+
+    cls = result.__class__
+    if is_dataclass(result) and "_read_only_from" not in vars(cls):
+        for name, value in _get_attributes(result):
+            object.__setattr__(result, name, read_only(value))
+
+        result.__class__ = _get_read_only_class(cls)  # type: ignore
+
+    return result
+
+
+def _get_read_only_class(cls: type) -> type:
+    variant = _read_only.get(cls)
+    if variant is None:
+        namespace = {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,  # same repr
+            "__setattr__": _read_only_setattr,
+            "__delattr__": _read_only_setattr,
+            "__eq__": _read_only_eq,
+            "__hash__": cls.__hash__,
+            "__reduce__": _reduce_read_only,
+            "_read_only_from": cls,
+        }
+        if hasattr(cls, "to_dict"):
+            namespace["to_dict"] = lambda self: deepcopy(self).to_dict()
+
+        variant = _read_only[cls] = type(cls.__name__, (cls,), namespace)
+
+    return variant
+
+
+def _get_attributes(obj: Any) -> Iterable[Tuple[str, Any]]:
+    if hasattr(obj, "__dict__"):  # fields and the keys the class doesn't declare
+        return list(vars(obj).items())
+
+    return [(f.name, getattr(obj, f.name)) for f in fields(obj)]
+
+
+def _read_only_setattr(obj: Any, name: str, *args: Any) -> None:
+    raise FrozenInstanceError(f"read-only result; cannot modify field {name!r}")
+
+
+def _read_only_eq(obj: Any, other: Any) -> Any:
+    # equal to regular instances of the class as well
+    origin = obj._read_only_from
+    if getattr(other.__class__, "_read_only_from", other.__class__) is not origin:
+        return NotImplemented
+
+    compared = [f.name for f in fields(origin) if f.compare]
+    return [getattr(obj, n) for n in compared] == [getattr(other, n) for n in compared]
+
+
+def _reduce_read_only(obj: Any) -> Any:
+    # copies are regular instances; a slotted class is found through slotted()
+    origin = obj._read_only_from
+    slotted_from = vars(origin).get("_slotted_from")
+    attributes = dict(_get_attributes(obj))
+
+    return _copy_read_only, (slotted_from or origin, bool(slotted_from), attributes)
+
+
+def _copy_read_only(cls: Any, is_slotted: bool, attributes: Dict[str, Any]) -> Any:
+    if is_slotted:
+        cls = slotted(cls)
+
+    obj = cls.__new__(cls)
+    for name, value in attributes.items():
+        object.__setattr__(obj, name, value)
+
+    return obj
@@ -1,9 +1,9 @@
 from dataclasses import asdict
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Union, cast
 
 from trakt.core.decorators import auth_required
 from trakt.core.exceptions import ArgumentError
-from trakt.core.models import Episode, Movie
+from trakt.core.models import Episode, Movie, is_instance
 from trakt.core.paths.path import Path
 from trakt.core.paths.response_structs import (
     EpisodeCheckin,
@@ -16,25 +16,39 @@ from trakt.core.paths.validators import AuthRequiredValidator, PerArgValidator
 
 MESSAGE_VALIDATOR = PerArgValidator("message", lambda m: isinstance(m, str))
 
+# lists of users watching, which checkins and scrobbles change
+MOVIE_WATCHING = ["movies/*/watching"]
+EPISODE_WATCHING = [
+    "shows/*/watching",
+    "shows/*/seasons/*/watching",
+    "shows/*/seasons/*/episodes/*/watching",
+]
+
 
 class CheckinI(SuiteInterface):
     name = "checkin"
 
     paths = {
         "delete_active_checkins": Path(
-            "checkin", {}, methods="DELETE", validators=[AuthRequiredValidator()]
+            "checkin",
+            {},
+            methods="DELETE",
+            validators=[AuthRequiredValidator()],
+            invalidates=MOVIE_WATCHING + EPISODE_WATCHING,
         ),
         "check_into_episode": Path(
             "checkin",
             EpisodeCheckin,
             methods="POST",
             validators=[AuthRequiredValidator(), MESSAGE_VALIDATOR],
+            invalidates=EPISODE_WATCHING,
         ),
         "check_into_movie": Path(
             "checkin",
             MovieCheckin,
             methods="POST",
             validators=[AuthRequiredValidator(), MESSAGE_VALIDATOR],
+            invalidates=MOVIE_WATCHING,
         ),
     }
 
@@ -68,13 +82,13 @@ class CheckinI(SuiteInterface):
             **kwargs, message=message, sharing=sharing
         )
 
-        if isinstance(episode, Episode):
-            episode = {"ids": {"trakt": self._generic_get_id(episode)}}
+        if is_instance(episode, Episode):
+            episode = {"ids": {"trakt": self._generic_get_id(cast(Episode, episode))}}
         data["episode"] = episode
 
         if "show" in kwargs:
             show = kwargs["show"]
-            if isinstance(show, Show):
+            if is_instance(show, Show):
                 data["show"] = {"ids": {"trakt": self._generic_get_id(show)}}
             elif isinstance(show, dict):
                 data["show"] = show
@@ -91,10 +105,12 @@ class CheckinI(SuiteInterface):
         sharing: Optional[Union[Sharing, Dict[str, str]]] = None,
         **kwargs,
     ) -> MovieCheckin:
-        data = self._prepare_common_data(**kwargs, message=message, sharing=sharing)
+        data: Dict[str, Any] = self._prepare_common_data(
+            **kwargs, message=message, sharing=sharing
+        )
 
-        if isinstance(movie, Movie):
-            movie = {"ids": {"trakt": self._generic_get_id(movie)}}
+        if is_instance(movie, Movie):
+            movie = {"ids": {"trakt": self._generic_get_id(cast(Movie, movie))}}
         data["movie"] = movie
 
         return self.run("check_into_movie", **data, body=data)
@@ -121,4 +137,4 @@ class CheckinI(SuiteInterface):
         return d
 
     def delete_active_checkins(self, **kwargs: Any) -> None:
-        self.run("delete_active_checkins", **kwargs)
+        return self._discard(self.run("delete_active_checkins", **kwargs))
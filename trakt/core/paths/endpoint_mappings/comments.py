@@ -31,6 +31,17 @@ COMMENT_ID_VALIDATOR = PerArgValidator("id", lambda c: isinstance(c, int))
 COMMENT_TYPES = ["all", "reviews", "shouts"]
 MEDIA_TYPES = ["all", "movies", "shows", "seasons", "episodes", "lists"]
 
+# cached lists of comments which a new or changed comment makes stale
+COMMENT_LISTS = [
+    "movies/*/comments/?sort",
+    "shows/*/comments/?sort",
+    "shows/*/seasons/*/comments/?sort",
+    "shows/*/seasons/*/episodes/*/comments/?sort",
+    "comments/trending/?comment_type/?type",
+    "comments/recent/?comment_type/?type",
+    "comments/updates/?comment_type/?type",
+]
+
 TRENDING_RECENT_UPDATED_VALIDATORS: List[Validator] = [
     PerArgValidator("comment_type", lambda c: c in COMMENT_TYPES),
     PerArgValidator("type", lambda c: c in MEDIA_TYPES),
@@ -47,6 +58,7 @@ class CommentsI(SuiteInterface):
             CommentResponse,
             methods=["POST"],
             validators=[AuthRequiredValidator(), COMMENT_TEXT_VALIDATOR],
+            invalidates=COMMENT_LISTS,
         ),
         "get_comment": Path("comments/!id", Comment, validators=[COMMENT_ID_VALIDATOR]),
         "update_comment": Path(
@@ -54,9 +66,14 @@ class CommentsI(SuiteInterface):
             Comment,
             methods="PUT",
             validators=[COMMENT_ID_VALIDATOR, COMMENT_TEXT_VALIDATOR],
+            invalidates=["comments/!id", *COMMENT_LISTS],
         ),
         "delete_comment": Path(
-            "comments/!id", {}, methods="DELETE", validators=[COMMENT_ID_VALIDATOR]
+            "comments/!id",
+            {},
+            methods="DELETE",
+            validators=[COMMENT_ID_VALIDATOR],
+            invalidates=["comments/!id", "comments/!id/*", *COMMENT_LISTS],
         ),
         "get_replies": Path(
             "comments/!id/replies",
@@ -67,11 +84,13 @@ class CommentsI(SuiteInterface):
         "post_reply": Path(
             "comments/!id/replies",
             Comment,
+            methods=["POST"],
             validators=[
                 AuthRequiredValidator(),
                 COMMENT_ID_VALIDATOR,
                 COMMENT_TEXT_VALIDATOR,
             ],
+            invalidates=["comments/!id", "comments/!id/replies", *COMMENT_LISTS],
         ),
         "get_item": Path(
             "comments/!id/item",
@@ -90,12 +109,14 @@ class CommentsI(SuiteInterface):
             {},
             methods=["POST"],
             validators=[AuthRequiredValidator(), COMMENT_ID_VALIDATOR],
+            invalidates=["comments/!id", "comments/!id/likes"],
         ),
         "remove_like": Path(
             "comments/!id/like",
             {},
             methods=["DELETE"],
             validators=[AuthRequiredValidator(), COMMENT_ID_VALIDATOR],
+            invalidates=["comments/!id", "comments/!id/likes"],
         ),
         "get_trending": Path(
             "comments/trending/?comment_type/?type",
@@ -103,6 +124,7 @@ class CommentsI(SuiteInterface):
             validators=TRENDING_RECENT_UPDATED_VALIDATORS,
             pagination=True,
             extended=["full"],
+            ttl="short",
         ),
         "get_recently_created": Path(
             "comments/recent/?comment_type/?type",
@@ -110,6 +132,7 @@ class CommentsI(SuiteInterface):
             validators=TRENDING_RECENT_UPDATED_VALIDATORS,
             pagination=True,
             extended=["full"],
+            ttl="short",
         ),
         "get_recently_updated": Path(
             "comments/updates/?comment_type/?type",
@@ -117,6 +140,7 @@ class CommentsI(SuiteInterface):
             validators=TRENDING_RECENT_UPDATED_VALIDATORS,
             pagination=True,
             extended=["full"],
+            ttl="short",
         ),
     }
 
@@ -158,7 +182,7 @@ class CommentsI(SuiteInterface):
 
     def delete_comment(self, *, id: Union[Comment, str, int], **kwargs) -> None:
         id = int(self._generic_get_id(id))
-        self.run("delete_comment", **kwargs, id=id)
+        return self._discard(self.run("delete_comment", **kwargs, id=id))
 
     def get_replies(
         self, *, id: Union[Comment, str, int], **kwargs
@@ -192,11 +216,11 @@ class CommentsI(SuiteInterface):
 
     def like_comment(self, *, id: Union[Comment, str, int], **kwargs) -> None:
         id = int(self._generic_get_id(id))
-        self.run("like_comment", **kwargs, id=id)
+        return self._discard(self.run("like_comment", **kwargs, id=id))
 
     def remove_like(self, *, id: Union[Comment, str, int], **kwargs) -> None:
         id = int(self._generic_get_id(id))
-        self.run("remove_like", **kwargs, id=id)
+        return self._discard(self.run("remove_like", **kwargs, id=id))
 
     def get_trending(
         self,
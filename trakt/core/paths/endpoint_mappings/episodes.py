@@ -37,6 +37,7 @@ class EpisodesI(SuiteInterface):
             Episode,
             extended=["full"],
             validators=[ID_VALIDATOR, SEASON_ID_VALIDATOR, EPISODE_ID_VALIDATOR],
+            ttl="long",
         ),
         "get_translations": Path(
             "shows/!id/seasons/!season/episodes/!episode/translations/?language",
@@ -47,6 +48,7 @@ class EpisodesI(SuiteInterface):
                 EPISODE_ID_VALIDATOR,
                 PerArgValidator("language", lambda s: isinstance(s, str)),
             ],
+            ttl="long",
         ),
         "get_comments": Path(
             "shows/!id/seasons/!season/episodes/!episode/comments/?sort",
@@ -86,6 +88,7 @@ class EpisodesI(SuiteInterface):
             [User],
             extended=["full"],
             validators=[ID_VALIDATOR, SEASON_ID_VALIDATOR, EPISODE_ID_VALIDATOR],
+            ttl="short",
         ),
     }
 
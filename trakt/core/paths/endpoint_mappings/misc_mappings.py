@@ -30,6 +30,7 @@ class CountriesI(SuiteInterface):
             aliases=["get_countries", ""],
             validators=[TYPE_MOVIES_SHOWS],
             cache_level="basic",
+            ttl="static",
         )
     }
 
@@ -46,12 +47,13 @@ class CertificationsI(SuiteInterface):
             {"us": [Certification]},
             validators=[TYPE_MOVIES_SHOWS],
             cache_level="basic",
+            ttl="static",
         )
     }
 
     def get_certifications(self, *, type: str, **kwargs: Any) -> List[Certification]:
         ret = self.run("get_certifications", type=type, **kwargs)
-        return ret["us"]
+        return self._then(ret, lambda r: r["us"])
 
 
 class GenresI(SuiteInterface):
@@ -59,7 +61,11 @@ class GenresI(SuiteInterface):
 
     paths = {
         "get_genres": Path(
-            "genres/!type", [Genre], validators=[TYPE_MOVIES_SHOWS], cache_level="basic"
+            "genres/!type",
+            [Genre],
+            validators=[TYPE_MOVIES_SHOWS],
+            cache_level="basic",
+            ttl="static",
         )
     }
 
@@ -76,6 +82,7 @@ class LanguagesI(SuiteInterface):
             [Language],
             validators=[TYPE_MOVIES_SHOWS],
             cache_level="basic",
+            ttl="static",
         )
     }
 
@@ -88,10 +95,18 @@ class ListsI(SuiteInterface):
 
     paths = {
         "get_trending": Path(
-            "lists/trending", [ListResponse], extended=["full"], pagination=True
+            "lists/trending",
+            [ListResponse],
+            extended=["full"],
+            pagination=True,
+            ttl="short",
         ),
         "get_popular": Path(
-            "lists/popular", [ListResponse], extended=["full"], pagination=True
+            "lists/popular",
+            [ListResponse],
+            extended=["full"],
+            pagination=True,
+            ttl="short",
         ),
     }
 
@@ -105,7 +120,9 @@ class ListsI(SuiteInterface):
 class NetworksI(SuiteInterface):
     name = "networks"
 
-    paths = {"get_networks": Path("networks", [Network], cache_level="basic")}
+    paths = {
+        "get_networks": Path("networks", [Network], cache_level="basic", ttl="static")
+    }
 
     def get_networks(self, **kwargs: Any) -> List[Network]:
         return self.run("get_networks", **kwargs)
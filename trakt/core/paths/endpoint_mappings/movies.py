@@ -51,7 +51,11 @@ class MoviesI(SuiteInterface):
 
     paths = {
         "get_box_office": Path(
-            "movies/boxoffice", [BoxOffice], extended=["full"], cache_level="basic"
+            "movies/boxoffice",
+            [BoxOffice],
+            extended=["full"],
+            cache_level="basic",
+            ttl="long",
         ),
         "get_recently_updated": Path(
             "movies/updates/?start_date",
@@ -59,11 +63,14 @@ class MoviesI(SuiteInterface):
             extended=["full"],
             pagination=True,
             validators=[PerArgValidator("start_date", is_date)],
+            ttl="short",
         ),
         "get_summary": Path(
-            "movies/!id", Movie, extended=["full"], cache_level="basic"
+            "movies/!id", Movie, extended=["full"], cache_level="basic", ttl="long"
+        ),
+        "get_aliases": Path(
+            "movies/!id/aliases", [Alias], cache_level="basic", ttl="long"
         ),
-        "get_aliases": Path("movies/!id/aliases", [Alias], cache_level="basic"),
         "get_releases": Path(
             "movies/!id/releases/?country",
             [MovieRelease],
@@ -71,6 +78,7 @@ class MoviesI(SuiteInterface):
                 PerArgValidator("country", lambda c: isinstance(c, str) and len(c) == 2)
             ],
             cache_level="basic",
+            ttl="long",
         ),
         "get_translations": Path(
             "movies/!id/translations/?language",
@@ -81,6 +89,7 @@ class MoviesI(SuiteInterface):
                 )
             ],
             cache_level="basic",
+            ttl="long",
         ),
         "get_comments": Path(
             "movies/!id/comments/?sort",
@@ -98,7 +107,11 @@ class MoviesI(SuiteInterface):
             pagination=True,
         ),
         "get_people": Path(
-            "movies/!id/people", CastCrewList, extended=["full"], cache_level="basic"
+            "movies/!id/people",
+            CastCrewList,
+            extended=["full"],
+            cache_level="basic",
+            ttl="long",
         ),
         "get_ratings": Path("movies/!id/ratings", RatingsSummary),
         "get_related": Path(
@@ -107,9 +120,12 @@ class MoviesI(SuiteInterface):
             extended=["full"],
             pagination=True,
             cache_level="basic",
+            ttl="long",
         ),
         "get_stats": Path("movies/!id/stats", MovieStats),
-        "get_users_watching": Path("movies/!id/watching", [User], extended=["full"]),
+        "get_users_watching": Path(
+            "movies/!id/watching", [User], extended=["full"], ttl="short"
+        ),
     }
 
     def __init__(self, *args, **kwargs):
@@ -132,6 +148,7 @@ class MoviesI(SuiteInterface):
             filters=COMMON_FILTERS,
             pagination=True,
             validators=extra_validators,
+            ttl="short",
         )
 
     def get_trending(self, **kwargs) -> PaginationIterator[TrendingMovie]:
@@ -20,6 +20,7 @@ class PeopleI(SuiteInterface):
             validators=[PERSON_ID_VALIDATOR],
             extended=["full"],
             cache_level="basic",
+            ttl="long",
         ),
         "get_movie_credits": Path(
             "people/!id/movies",
@@ -27,6 +28,7 @@ class PeopleI(SuiteInterface):
             validators=[PERSON_ID_VALIDATOR],
             extended=["full"],
             cache_level="basic",
+            ttl="long",
         ),
         "get_show_credits": Path(
             "people/!id/shows",
@@ -34,6 +36,7 @@ class PeopleI(SuiteInterface):
             validators=[PERSON_ID_VALIDATOR],
             extended=["full"],
             cache_level="basic",
+            ttl="long",
         ),
         "get_lists": Path(
             "people/!id/lists/?type/?sort",
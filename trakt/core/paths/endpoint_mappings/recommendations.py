@@ -28,6 +28,7 @@ class RecommendationsI(SuiteInterface):
             {},
             methods="DELETE",
             validators=[AuthRequiredValidator(), ID_VALIDATOR],
+            invalidates=["recommendations/movies"],
         ),
         "get_show_recommendations": Path(
             "recommendations/shows",
@@ -41,6 +42,7 @@ class RecommendationsI(SuiteInterface):
             {},
             methods="DELETE",
             validators=[AuthRequiredValidator(), ID_VALIDATOR],
+            invalidates=["recommendations/shows"],
         ),
     }
 
@@ -53,7 +55,7 @@ class RecommendationsI(SuiteInterface):
 
     def hide_movie(self, *, movie: Union[Movie, str, int], **kwargs) -> None:
         id = self._generic_get_id(movie)
-        self.run("hide_movie", **kwargs, id=id)
+        return self._discard(self.run("hide_movie", **kwargs, id=id))
 
     def get_show_recommendations(
         self, *, ignore_collected: bool = False, **kwargs
@@ -64,4 +66,4 @@ class RecommendationsI(SuiteInterface):
 
     def hide_show(self, *, show: Union[Movie, str, int], **kwargs) -> None:
         id = self._generic_get_id(show)
-        self.run("hide_show", **kwargs, id=id)
+        return self._discard(self.run("hide_show", **kwargs, id=id))
@@ -1,7 +1,8 @@
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Union, cast
 
 from trakt.core.exceptions import ArgumentError
-from trakt.core.models import Episode, Movie
+from trakt.core.models import Episode, Movie, is_instance
+from trakt.core.paths.endpoint_mappings.checkin import EPISODE_WATCHING, MOVIE_WATCHING
 from trakt.core.paths.path import Path
 from trakt.core.paths.response_structs import EpisodeScrobble, MovieScrobble, Show
 from trakt.core.paths.suite_interface import SuiteInterface
@@ -35,6 +36,9 @@ class ScrobbleI(SuiteInterface):
             self.name + "/" + resource_path,
             return_type,
             validators=[AuthRequiredValidator(), PROGRESS_VALIDATOR],
+            invalidates=(
+                MOVIE_WATCHING if return_type is MovieScrobble else EPISODE_WATCHING
+            ),
         )
 
     def start_scrobble(
@@ -142,12 +146,12 @@ class ScrobbleI(SuiteInterface):
     ) -> Dict[str, Any]:
         data: Dict[str, Any] = {"progress": progress}
 
-        if isinstance(episode, Episode):
-            episode = {"ids": {"trakt": self._generic_get_id(episode)}}
+        if is_instance(episode, Episode):
+            episode = {"ids": {"trakt": self._generic_get_id(cast(Episode, episode))}}
         data["episode"] = episode
 
         if show:
-            if isinstance(show, Show):
+            if is_instance(show, Show):
                 data["show"] = {"ids": {"trakt": self._generic_get_id(show)}}
             else:
                 data["show"] = show
@@ -159,8 +163,8 @@ class ScrobbleI(SuiteInterface):
     ) -> Dict[str, Any]:
         data: Dict[str, Any] = {"progress": progress}
 
-        if isinstance(movie, Movie):
-            data["movie"] = {"ids": {"trakt": self._generic_get_id(movie)}}
+        if is_instance(movie, Movie):
+            data["movie"] = {"ids": {"trakt": self._generic_get_id(cast(Movie, movie))}}
         else:
             data["movie"] = movie
 
@@ -35,6 +35,7 @@ class SeasonsI(SuiteInterface):
             extended=["full", "episodes"],
             validators=[ID_VALIDATOR],
             cache_level="basic",
+            ttl="long",
         ),
         "get_season": Path(
             "shows/!id/seasons/!season",
@@ -50,6 +51,7 @@ class SeasonsI(SuiteInterface):
             ],
             qargs=["translations"],
             cache_level="basic",
+            ttl="long",
         ),
         "get_comments": Path(
             "shows/!id/seasons/!season/comments/?sort",
@@ -87,6 +89,7 @@ class SeasonsI(SuiteInterface):
             [User],
             extended=["full"],
             validators=[ID_VALIDATOR, SEASON_ID_VALIDATOR],
+            ttl="short",
         ),
     }
 
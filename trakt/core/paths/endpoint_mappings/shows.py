@@ -71,6 +71,7 @@ class ShowsI(SuiteInterface):
             extended=["full"],
             pagination=True,
             validators=[PerArgValidator("start_date", is_date)],
+            ttl="short",
         ),
         "get_summary": Path(
             "shows/!id",
@@ -78,9 +79,14 @@ class ShowsI(SuiteInterface):
             extended=["full"],
             validators=[ID_VALIDATOR],
             cache_level="basic",
+            ttl="long",
         ),
         "get_aliases": Path(
-            "shows/!id/aliases", [Alias], validators=[ID_VALIDATOR], cache_level="basic"
+            "shows/!id/aliases",
+            [Alias],
+            validators=[ID_VALIDATOR],
+            cache_level="basic",
+            ttl="long",
         ),
         "get_translations": Path(
             "shows/!id/translations/?language",
@@ -92,6 +98,7 @@ class ShowsI(SuiteInterface):
                 ),
             ],
             cache_level="basic",
+            ttl="long",
         ),
         "get_comments": Path(
             "shows/!id/comments/?sort",
@@ -130,6 +137,7 @@ class ShowsI(SuiteInterface):
             extended=["full"],
             validators=[ID_VALIDATOR],
             cache_level="basic",
+            ttl="long",
         ),
         "get_ratings": Path(
             "shows/!id/ratings", RatingsSummary, validators=[ID_VALIDATOR]
@@ -141,10 +149,15 @@ class ShowsI(SuiteInterface):
             pagination=True,
             validators=[ID_VALIDATOR],
             cache_level="basic",
+            ttl="long",
         ),
         "get_stats": Path("shows/!id/stats", ShowStats, validators=[ID_VALIDATOR]),
         "get_users_watching": Path(
-            "shows/!id/watching", [User], extended=["full"], validators=[ID_VALIDATOR]
+            "shows/!id/watching",
+            [User],
+            extended=["full"],
+            validators=[ID_VALIDATOR],
+            ttl="short",
         ),
         "get_next_episode": Path(
             "shows/!id/next_episode",
@@ -180,6 +193,7 @@ class ShowsI(SuiteInterface):
             filters=COMMON_FILTERS | SHOWS_FILTERS,
             pagination=True,
             validators=extra_validators,
+            ttl="short",
         )
 
     def get_trending(self, **kwargs) -> PaginationIterator[TrendingShow]:
@@ -312,7 +326,7 @@ class ShowsI(SuiteInterface):
             return_extras=True
         )
 
-        return None if resp.code == 204 else resp.parsed
+        return self._then(resp, lambda r: None if r.code == 204 else r.parsed)
 
     def get_last_episode(
         self, *, show: Union[Show, str, int], **kwargs
@@ -324,4 +338,4 @@ class ShowsI(SuiteInterface):
             return_extras=True
         )
 
-        return None if resp.code == 204 else resp.parsed
+        return self._then(resp, lambda r: None if r.code == 204 else r.parsed)
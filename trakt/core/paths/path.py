@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+import re
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 from trakt.core.components.cache import CacheLevel
 from trakt.core.exceptions import ClientError
 from trakt.core.paths.validators import (
     MULTI_FILTERS,
+    AuthRequiredValidator,
     ExtendedValidator,
     FiltersValidator,
     OptionalArgsValidator,
     RequiredArgsValidator,
     Validator,
 )
+from trakt.core.retry import RetryPolicy
 
 if TYPE_CHECKING:  # pragma: no cover
     from trakt.api import TraktApi
@@ -36,6 +49,10 @@ class Path:
     filters: Set[str]
     pagination: bool
     cache_level: CacheLevel
+    ttl: Optional[Union[int, str]]
+    invalidates: List[str]
+    retry_policy: Optional[RetryPolicy]
+    name: Optional[str]  # "suite.method", set by the suite interface
 
     _output_structure: Any
 
@@ -54,7 +71,10 @@ class Path:
         extended: List[str] = None,
         filters: Set[str] = None,
         pagination: bool = False,
-        cache_level: Optional[Union[str, CacheLevel]] = None
+        cache_level: Optional[Union[str, CacheLevel]] = None,
+        ttl: Optional[Union[int, str]] = None,
+        invalidates: Optional[List[str]] = None,
+        retry_policy: Optional[RetryPolicy] = None
     ) -> None:
         self.path = path
         self._output_structure = output_structure
@@ -80,9 +100,15 @@ class Path:
 
         self.pagination = pagination
 
+        self.name = None
         self.__bound_client = None
 
         self.cache_level = self._determine_cache_level(cache_level)
+        self.ttl = ttl  # seconds or a cache.ttl_policies name; None = cache.timeout
+
+        # templates of the paths whose cached responses a call makes stale
+        self.invalidates = invalidates or []
+        self.retry_policy = retry_policy  # None = http component's default
 
     def does_match(self, name: str) -> bool:
         return name in self.aliases
@@ -133,6 +159,35 @@ class Path:
 
         return "/".join(parts), qargs
 
+    def get_invalidated_patterns(self) -> List[Pattern[str]]:
+        """Patterns matching the api paths of the responses this call makes stale.
+
+        Template params are filled in from the call's arguments; those it
+        doesn't have, and "*" segments, match any value.
+        """
+        if not self.is_bound():  # pragma: no cover
+            raise ClientError("call .is_valid first!")
+
+        return [self._compile_template(t) for t in self.invalidates]
+
+    def _compile_template(self, template: str) -> Pattern[str]:
+        regex = ""
+
+        for i, part in enumerate(template.split("/")):
+            sep = "/" if i else ""
+            value = self.__bound_kwargs.get(part[1:]) if part[0] in "?!" else None
+
+            if value is not None:
+                regex += sep + re.escape(str(value))
+            elif part[0] == "?":
+                regex += f"(?:{sep}[^/]+)?"
+            elif part == "*" or part[0] == "!":
+                regex += sep + "[^/]+"
+            else:
+                regex += sep + re.escape(part)
+
+        return re.compile(regex)
+
     @staticmethod
     def _stringify_param(v: Any) -> str:
         if isinstance(v, bool):
@@ -164,6 +219,15 @@ class Path:
     def method(self) -> str:
         return self.methods[0]
 
+    @property
+    def label(self) -> str:
+        """Name in the cache stats: "suite.method", else the default alias."""
+        return self.name or self.aliases[0]
+
+    @property
+    def requires_auth(self) -> bool:
+        return any(isinstance(v, AuthRequiredValidator) for v in self.validators)
+
     def _determine_cache_level(
         self, cache_level: Union[str, CacheLevel, None]
     ) -> CacheLevel:
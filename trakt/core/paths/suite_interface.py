@@ -1,10 +1,30 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, Type, Union
+import inspect
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 from trakt.core.components.http_component import ApiResponse
 from trakt.core.exceptions import ArgumentError
-from trakt.core.models import Episode, Movie, Person, Season, Show, TraktList
+from trakt.core.models import (
+    Episode,
+    Movie,
+    Person,
+    Season,
+    Show,
+    TraktList,
+    is_instance,
+)
 from trakt.core.paths.response_structs import Comment
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -39,6 +59,10 @@ class SuiteInterface:
     def run_path(self, path: Path, return_extras: bool = False, **kwargs: Any) -> Any:
         r = self.executor_class(self.client).run(path=path, **kwargs)
 
+        return self._then(r, lambda r: self._unpack(r, return_extras))
+
+    @staticmethod
+    def _unpack(r: Any, return_extras: bool) -> Any:
         if isinstance(r, ApiResponse):
             if return_extras:
                 return r
@@ -46,18 +70,43 @@ class SuiteInterface:
 
         return r
 
+    @staticmethod
+    def _then(result: Any, f: Callable[[Any], Any]) -> Any:
+        """Apply f to the result of a call made by either a sync or async executor."""
+        if inspect.isawaitable(result):
+            return _await_then(result, f)
+
+        return f(result)
+
+    def _discard(self, result: Any) -> Any:
+        return self._then(result, lambda _: None)
+
     def _get_path(self, command: str) -> Path:
         return self.paths[command]
 
+    def name_paths(self) -> None:
+        """Name the paths "suite.method"; config overrides and stats use the names.
+
+        Called once the suite is set up (some suites make their paths in
+        __init__), rather than on every call.
+        """
+        for command, path in self.paths.items():
+            path.name = f"{self.name}.{command}"
+
     @staticmethod
     def _generic_get_id(
         item: Union[Movie, Episode, Show, Season, Comment, Person, str, int]
     ) -> Union[int, str]:
         if isinstance(item, (int, str)):
             return item
-        if isinstance(item, Comment):
-            return item.id
-        elif isinstance(item, (Movie, Episode, Show, Season, TraktList, Person)):
-            return item.ids.trakt
+        # slotted variants aren't subclasses, is_instance doesn't narrow the type
+        if is_instance(item, Comment):
+            return cast(Comment, item).id
+        elif is_instance(item, (Movie, Episode, Show, Season, TraktList, Person)):
+            return cast(Movie, item).ids.trakt
         else:
             raise ArgumentError("item: invalid id")
+
+
+async def _await_then(result: Awaitable[Any], f: Callable[[Any], Any]) -> Any:
+    return f(await result)
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from trakt.core.exceptions import ClientError
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+__all__ = ("RateLimiter", "TokenBucket", "FileTokenBucket")
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+class TokenBucket:
+    """Thread safe token bucket.
+
+    reserve() always takes the token, letting the balance go negative;
+    the caller has to wait the returned number of seconds before using it.
+    This way nobody sleeps while holding the lock.
+    """
+
+    def __init__(self, capacity: int, period: float) -> None:
+        self.capacity = capacity
+        self.rate = capacity / period
+
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, self._updated_at = self._take(
+                self._tokens, self._updated_at, now, tokens
+            )
+
+            return max(0.0, -self._tokens / self.rate)
+
+    def _take(
+        self, available: float, updated_at: float, now: float, tokens: float
+    ) -> Tuple[float, float]:
+        refilled = available + (now - updated_at) * self.rate
+        return min(float(self.capacity), refilled) - tokens, now
+
+
+class FileTokenBucket(TokenBucket):
+    """Token bucket kept in a file guarded by flock.
+
+    Lets worker processes on the same host share one budget.
+    """
+
+    def __init__(self, capacity: int, period: float, path: str) -> None:
+        if fcntl is None:  # pragma: no cover
+            raise ClientError("file locks are not supported on this platform")
+
+        super().__init__(capacity, period)
+        self.path = path
+
+    def reserve(self, tokens: float = 1) -> float:
+        with open(self.path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)  # released on close
+
+            f.seek(0)
+            available, updated_at = self._read_state(f.read())
+
+            now = time.time()  # monotonic clocks aren't comparable between processes
+            available, updated_at = self._take(available, updated_at, now, tokens)
+
+            f.seek(0)
+            f.truncate()
+            f.write(f"{available} {updated_at}")
+
+        return max(0.0, -available / self.rate)
+
+    def _read_state(self, state: str) -> Tuple[float, float]:
+        try:
+            available, updated_at = state.split()
+            return float(available), float(updated_at)
+        except ValueError:  # new or corrupted file
+            return float(self.capacity), time.time()
+
+
+BucketKey = Tuple[str, str, Optional[str]]
+
+
+class RateLimiter:
+    """Paces requests to stay within the api limits.
+
+    Keeps a separate bucket for each (method class, client id, user token),
+    as the api counts GET and POST/PUT/DELETE calls separately.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, Tuple[int, float]],
+        lock_dir: Optional[str] = None,
+    ) -> None:
+        self.limits = limits
+        self.lock_dir = lock_dir
+
+        self._lock = threading.Lock()
+        self._buckets: Dict[BucketKey, TokenBucket] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> RateLimiter:
+        limits = {
+            "GET": (config["get_limit"], config["get_period"]),
+            "POST": (config["post_limit"], config["post_period"]),
+        }
+
+        return cls(limits, lock_dir=config["lock_dir"] or None)
+
+    def reserve(
+        self, method: str, client_id: str, access_token: Optional[str] = None
+    ) -> float:
+        """Take a token; returns the number of seconds to wait before the call."""
+        method_class = "GET" if method.upper() in SAFE_METHODS else "POST"
+        user = _digest(access_token) if access_token else None
+
+        return self._get_bucket((method_class, client_id, user)).reserve()
+
+    def _get_bucket(self, key: BucketKey) -> TokenBucket:
+        with self._lock:
+            if key not in self._buckets:
+                self._buckets[key] = self._make_bucket(key)
+
+            return self._buckets[key]
+
+    def _make_bucket(self, key: BucketKey) -> TokenBucket:
+        capacity, period = self.limits[key[0]]
+
+        if self.lock_dir:
+            path = os.path.join(self.lock_dir, f"trakt-{_digest(repr(key))}.bucket")
+            return FileTokenBucket(capacity, period, path)
+
+        return TokenBucket(capacity, period)
+
+
+def _digest(s: str) -> str:
+    return hashlib.sha1(s.encode()).hexdigest()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, FrozenSet, Optional
+
+__all__ = ("RetryPolicy", "RETRY_STATUS_CODES", "IDEMPOTENT_METHODS")
+
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504, 520, 521, 522})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: bool = True
+    respect_retry_after: bool = True
+    status_codes: FrozenSet[int] = RETRY_STATUS_CODES
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    @classmethod
+    def from_config(cls, http_config: Any) -> RetryPolicy:
+        return cls(
+            max_retries=http_config["max_retries"],
+            backoff_factor=http_config["retry_backoff_factor"],
+            max_backoff=http_config["retry_max_backoff"],
+            jitter=http_config["retry_jitter"],
+        )
+
+    def should_retry(
+        self, method: str, attempt: int, status_code: Optional[int] = None
+    ) -> bool:
+        """status_code=None means the request failed without a response."""
+        if attempt >= self.max_retries or method.upper() not in self.methods:
+            return False
+
+        return status_code is None or status_code in self.status_codes
+
+    def get_backoff(self, attempt: int, response: Any = None) -> Optional[float]:
+        """Seconds to wait before the next attempt; None if the response's
+        Retry-After asks for more than max_backoff (it isn't retried then)."""
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_backoff else None
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+
+        if self.jitter:  # "full jitter"; spreads out retries of concurrent clients
+            return random.uniform(0, backoff)
+
+        return backoff
+
+
+def parse_retry_after(response: Any) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+from trakt.core.deadline import Deadline
+
+__all__ = ("SingleFlight", "AsyncSingleFlight")
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs one call per key at a time; concurrent callers share its outcome.
+
+    The first caller (the leader) runs fn, everyone asking for the same key
+    in the meantime waits for the leader's result or exception.
+
+    A caller with a deadline waits for a leader until its own deadline passes,
+    but doesn't lead: others mustn't inherit its DeadlineExceeded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+
+    def do(
+        self, key: Hashable, fn: Callable[[], T], deadline: Optional[Deadline] = None
+    ) -> T:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None and deadline is None
+            if leader:
+                call = self._calls[key] = Future()
+
+        if call is None:
+            return fn()
+        if not leader:
+            return _wait(call, deadline)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+        call.set_result(result)
+        return result
+
+
+def _wait(call: Future[T], deadline: Optional[Deadline]) -> T:
+    if deadline is None:
+        return call.result()
+
+    try:
+        return call.result(timeout=deadline.remaining())
+    except FutureTimeoutError:
+        raise deadline.exceeded() from None
+
+
+class AsyncSingleFlight:
+    """asyncio counterpart of SingleFlight; must be used from a single event loop."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        deadline: Optional[Deadline] = None,
+    ) -> T:
+        call = self._calls.get(key)
+        if call is not None:
+            # shielded, so a cancelled follower doesn't cancel the others
+            return await _wait_async(asyncio.shield(call), deadline)
+        if deadline is not None:
+            return await fn()
+
+        call = self._calls[key] = asyncio.get_running_loop().create_future()
+
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            call.cancel()
+            raise
+        except BaseException as e:
+            call.set_exception(e)
+            call.exception()  # no "never retrieved" warning if nobody waited
+            raise
+        finally:
+            del self._calls[key]
+
+        call.set_result(result)
+        return result
+
+
+async def _wait_async(call: Awaitable[T], deadline: Optional[Deadline]) -> T:
+    if deadline is None:
+        return await call
+
+    try:
+        return await asyncio.wait_for(call, deadline.remaining())
+    except asyncio.TimeoutError:
+        raise deadline.exceeded() from None